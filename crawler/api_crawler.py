@@ -2,22 +2,56 @@
 카드고릴라 삼성카드 API 크롤러
 - Playwright 없이 requests만 사용
 - 리스트 API + 상세 API 조합으로 전체 혜택 수집
+- 상세 API는 스레드 풀로 병렬 호출 (토큰 버킷으로 초당 요청 수 제한)
+- 커넥션 풀 세션 재사용 + 지수 백오프 재시도
+- 리스트 API는 페이지 단위로 조회하고, 받은 ID부터 바로 상세 조회 시작
+- --incremental: ETag/Last-Modified 조건부 요청 + 내용 해시로 변경된 카드만 재파싱
+- 상세 응답 원본을 gzip 캐시로 보관, --from-cache로 네트워크 없이 재파싱
+- 혜택 문구는 자르지 않고 저장, 상세 문구는 중복 제거 저장소(*.texts.json)로 분리 (scripts/text_store.py)
 """
 
+import argparse
+import gzip
+import hashlib
 import json
+import random
+import threading
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 from html import unescape
 import re
+import sys
+
+# 공용 모듈 (scripts/)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from bench_utils import percentile  # noqa: E402
+from categorizer import PARSE_CATEGORIZER  # noqa: E402
+from choice_sets import group_choice_sets  # noqa: E402
+from data_io import load_data, save_data  # noqa: E402
+from discount_parser import PERCENT_RE  # noqa: E402
+from text_store import print_store_report  # noqa: E402
 
 # 설정
-API_BASE = "https://api.card-gorilla.com:8080/v1"
-LIST_API = f"{API_BASE}/cards"
-DETAIL_API = f"{API_BASE}/cards"  # /cards/{card_id}
+API_BASE = "https://api.card-gorilla.com:8080/v1"  # 리스트: /cards, 상세: /cards/{card_id}
 OUTPUT_PATH = Path(__file__).parent.parent / "data" / "samsung_cards.json"
-REQUEST_DELAY = 0.5  # API 호출 간 딜레이 (초)
+STATE_PATH = Path(__file__).parent / "crawl_state.json"  # 증분 크롤링 상태
+CACHE_DIR = Path(__file__).parent / "cache"  # 상세 응답 원본 캐시 ({cid}/{hash}.json.gz)
+MAX_WORKERS = 8  # 상세 API 동시 요청 수
+RATE_LIMIT = 5.0  # 초당 최대 요청 수
+RATE_BURST = 5  # 토큰 버킷 최대 용량 (순간 허용 요청 수)
+PER_PAGE = 50  # 리스트 API 페이지 크기
 TIMEOUT = 10  # 개별 요청 타임아웃
+MAX_RETRIES = 3  # 5xx/타임아웃 시 재시도 횟수
+BACKOFF_BASE = 0.5  # 재시도 백오프 기본값 (초, 시도마다 2배)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+TAG_RE = re.compile(r'<[^>]+>')
+SPACE_RE = re.compile(r'\s+')
+NUMBER_RE = re.compile(r'[\d,]+')
 
 # 공통 헤더
 HEADERS = {
@@ -27,6 +61,32 @@ HEADERS = {
 }
 
 
+class RateLimiter:
+    """토큰 버킷 기반 요청 속도 제한 (스레드 안전)"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
 def strip_html(text: str) -> str:
     """HTML 태그 제거 및 텍스트 정리"""
     if not text:
@@ -34,9 +94,9 @@ def strip_html(text: str) -> str:
     # HTML 엔티티 디코딩
     text = unescape(text)
     # 태그 제거
-    text = re.sub(r'<[^>]+>', ' ', text)
+    text = TAG_RE.sub(' ', text)
     # 연속 공백 정리
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = SPACE_RE.sub(' ', text).strip()
     return text
 
 
@@ -44,47 +104,213 @@ def extract_number(text: str) -> int | None:
     """텍스트에서 숫자 추출"""
     if not text:
         return None
-    match = re.search(r'[\d,]+', text.replace(',', ''))
+    match = NUMBER_RE.search(text.replace(',', ''))
     return int(match.group().replace(',', '')) if match else None
 
 
-def get_card_list() -> list[int]:
-    """삼성카드 전체 리스트 조회 (corp=1)"""
-    print("[1/2] 카드 리스트 조회 중...")
-    
-    params = {
-        "corp": 1,  # 삼성카드
-        "perPage": 200,  # 충분히 큰 값
-        "is_discon": 0,  # 활성 카드만
-        "p": 1
-    }
-    
-    try:
-        resp = requests.get(LIST_API, params=params, headers=HEADERS, timeout=TIMEOUT)
-        resp.raise_for_status()
-        data = resp.json()
-        
-        card_ids = [card["cid"] for card in data.get("data", [])]
-        total = data.get("total", len(card_ids))
-        
-        print(f"  - 총 {total}개 카드 발견, {len(card_ids)}개 ID 수집")
-        return card_ids
-        
-    except Exception as e:
-        print(f"[ERROR] 리스트 조회 실패: {e}")
-        return []
+class CardGorillaClient:
+    """카드고릴라 API 클라이언트
+    - 커넥션 풀 세션 재사용 (keep-alive, 호스트당 연결 수 제한)
+    - 5xx/타임아웃 시 지수 백오프 + 지터 재시도, Retry-After 준수
+    - 핸드셰이크/재시도 횟수와 요청별 지연 시간 기록
+    """
 
+    def __init__(self, api_base: str = API_BASE, pool_size: int = MAX_WORKERS,
+                 rate: float = RATE_LIMIT, burst: int = RATE_BURST,
+                 max_retries: int = MAX_RETRIES, backoff_base: float = BACKOFF_BASE):
+        self.api_base = api_base.rstrip("/")
+        self.limiter = RateLimiter(rate, burst)
+        self.max_retries = max(0, max_retries)  # 음수면 재시도 없이 한 번만 요청
+        self.backoff_base = backoff_base
+
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size), pool_block=True)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.adapter = adapter
+
+        self.lock = threading.Lock()
+        self.retries = 0
+        self.latencies = []  # 성공/실패 포함 개별 HTTP 요청 소요 시간 (초)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _backoff_delay(self, attempt: int, resp: requests.Response | None) -> float:
+        """Retry-After 헤더 우선, 없으면 지수 백오프 + full jitter"""
+        if resp is not None:
+            retry_after = resp.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return max(0.0, float(retry_after))
+                except ValueError:
+                    try:
+                        when = parsedate_to_datetime(retry_after)
+                        return max(0.0, when.timestamp() - time.time())
+                    except (TypeError, ValueError):
+                        pass
+        return random.uniform(0, self.backoff_base * (2 ** attempt))
+
+    def request(self, path: str, params: dict | None = None,
+                headers: dict | None = None) -> requests.Response:
+        """GET 요청 (재시도 포함, 최종 실패 시 예외)"""
+        url = f"{self.api_base}{path}"
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            resp = None
+            started = time.perf_counter()
+            try:
+                resp = self.session.get(url, params=params, headers=headers, timeout=TIMEOUT)
+                retryable = resp.status_code in RETRY_STATUS
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_retries:
+                    raise
+                retryable = True
+            finally:
+                with self.lock:
+                    self.latencies.append(time.perf_counter() - started)
+
+            if not retryable or attempt == self.max_retries:
+                resp.raise_for_status()
+                return resp
+
+            with self.lock:
+                self.retries += 1
+            time.sleep(self._backoff_delay(attempt, resp))
+
+    def get_json(self, path: str, params: dict | None = None) -> dict:
+        """GET 요청 후 JSON 반환"""
+        return self.request(path, params).json()
+
+    def iter_card_pages(self, per_page: int = PER_PAGE):
+        """삼성카드 리스트를 페이지 단위로 조회하며 카드 ID 목록을 yield (corp=1)
+        조회가 끝나면 self.list_total 에 API가 보고한 전체 개수가 남음
+        """
+        self.list_total = None
+        seen = set()
+        page = 1
+        while True:
+            params = {
+                "corp": 1,  # 삼성카드
+                "perPage": per_page,
+                "is_discon": 0,  # 활성 카드만
+                "p": page
+            }
+            data = self.get_json("/cards", params)
+            rows = data.get("data", [])
+            if self.list_total is None:
+                self.list_total = data.get("total")
+            
+            # 페이지 경계에서 목록이 밀려 중복된 ID는 제외
+            card_ids = [card["cid"] for card in rows if card["cid"] not in seen]
+            seen.update(card_ids)
+            if card_ids:
+                yield card_ids
+            
+            if not rows or len(rows) < per_page:
+                break
+            if self.list_total is not None and len(seen) >= self.list_total:
+                break
+            page += 1
+
+    def get_card_detail_if_changed(self, card_id: int, validators: dict | None = None) -> tuple:
+        """조건부 상세 조회 (If-None-Match / If-Modified-Since)
+        반환: (status, payload, validators) - 304면 payload None, 실패면 status 0
+        """
+        validators = validators or {}
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        try:
+            resp = self.request(f"/cards/{card_id}", headers=headers)
+        except Exception as e:
+            print(f"  [WARN] 카드 {card_id} 조회 실패: {e}")
+            return 0, None, validators
+        if resp.status_code == 304:
+            return 304, None, validators
+        new_validators = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
+        return resp.status_code, resp.json(), new_validators
+
+    def handshake_count(self) -> int:
+        """지금까지 새로 연 TCP(+TLS) 연결 수"""
+        pools = self.adapter.poolmanager.pools
+        return sum(pools[key].num_connections for key in pools.keys())
+
+    def print_stats(self):
+        """요청 통계 출력"""
+        with self.lock:
+            latencies = sorted(self.latencies)
+            retries = self.retries
+        print(f"  - HTTP 요청: {len(latencies)}회 (재시도 {retries}회)")
+        print(f"  - 연결(핸드셰이크): {self.handshake_count()}회")
+        if latencies:
+            p50, p90, p99 = (percentile(latencies, q) for q in (50, 90, 99))
+            print(f"  - 지연 시간: p50 {p50 * 1000:.0f}ms / p90 {p90 * 1000:.0f}ms / p99 {p99 * 1000:.0f}ms")
+
+
+def crawl_card_details(client: CardGorillaClient, state: dict, workers: int = MAX_WORKERS,
+                       per_page: int = PER_PAGE) -> tuple[list[int], list[tuple]]:
+    """리스트 페이지를 받는 즉시 해당 카드의 조건부 상세 조회를 병렬로 시작
+    반환: (card_ids, results) - results는 card_ids 순서 유지
+    리스트 조회가 중간에 실패하면 남은 상세 조회를 취소하고 예외를 그대로 전달 (잘린 목록으로 저장하지 않도록)
+    """
+    def fetch(card_id: int) -> tuple:
+        return client.get_card_detail_if_changed(card_id, state.get(str(card_id)))
+
+    card_ids = []
+    futures = []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        try:
+            for page, page_ids in enumerate(client.iter_card_pages(per_page), start=1):
+                print(f"  - 리스트 {page}페이지: {len(page_ids)}개 ID")
+                card_ids.extend(page_ids)
+                futures.extend(executor.submit(fetch, cid) for cid in page_ids)
+        except Exception:
+            print(f"  - 리스트 조회 중단 ({len(card_ids)}개 ID까지 수집)")
+            for future in futures:
+                future.cancel()
+            raise
+        results = [future.result() for future in futures]
+    return card_ids, results
+
+
+def payload_hash(raw: dict) -> str:
+    """상세 응답의 내용 해시 (키 순서와 무관)"""
+    canonical = json.dumps(raw, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def load_crawl_state(path: Path) -> dict:
+    """카드별 ETag/Last-Modified/해시 상태 로드"""
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("cards", {})
+
+
+def save_crawl_state(path: Path, state: dict):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"updated_at": time.strftime("%Y-%m-%d %H:%M:%S"), "cards": state},
+                  f, ensure_ascii=False, indent=2)
 
-def get_card_detail(card_id: int) -> dict | None:
-    """개별 카드 상세 정보 조회"""
-    try:
-        url = f"{DETAIL_API}/{card_id}"
-        resp = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
-        resp.raise_for_status()
-        return resp.json()
-    except Exception as e:
-        print(f"  [WARN] 카드 {card_id} 조회 실패: {e}")
-        return None
+
+def load_previous_cards(path: Path) -> dict:
+    """이전 크롤링 결과를 카드 ID 기준으로 로드 (상세 문구 저장소 포함)"""
+    if not path.exists():
+        return {}
+    return {card["id"]: card for card in load_data(str(path)).get("cards", [])}
 
 
 def parse_card_data(raw: dict) -> dict:
@@ -123,20 +349,6 @@ def parse_card_data(raw: dict) -> dict:
     # 혜택 정보 파싱
     key_benefits = raw.get("key_benefit", [])
     
-    # 카테고리 키워드 매핑
-    category_keywords = {
-        "커피": ["스타벅스", "커피", "카페", "투썸", "이디야", "메가커피"],
-        "교통": ["교통", "버스", "지하철", "택시", "대중교통"],
-        "주유": ["주유", "SK", "GS", "S-OIL", "현대오일뱅크", "정유"],
-        "쇼핑": ["쇼핑", "백화점", "마트", "이마트", "홈플러스", "쿠팡", "SSG", "온라인몰"],
-        "편의점": ["편의점", "CU", "GS25", "세븐일레븐", "이마트24"],
-        "통신": ["통신", "SKT", "KT", "LG U+", "휴대폰", "이동통신"],
-        "영화": ["영화", "CGV", "메가박스", "롯데시네마"],
-        "음식": ["배달", "요기요", "배민", "음식", "식당", "음식점"],
-        "항공": ["항공", "마일리지", "대한항공", "아시아나", "스카이패스"],
-        "스트리밍": ["넷플릭스", "유튜브", "웨이브", "왓챠", "디즈니", "OTT"],
-    }
-    
     for benefit in key_benefits:
         title = benefit.get("title", "")
         comment = benefit.get("comment", "")
@@ -147,17 +359,13 @@ def parse_card_data(raw: dict) -> dict:
         full_text = f"{title} {comment} {info_text}"
         
         # 카테고리 추정
-        category = None
-        for cat, keywords in category_keywords.items():
-            if any(kw in full_text for kw in keywords):
-                category = cat
-                break
+        category = PARSE_CATEGORIZER.categorize(full_text)
         
         # 할인 정보 파싱
         discount = {"type": None, "value": None, "raw": comment}
         if '%' in comment:
             discount["type"] = "percent"
-            match = re.search(r'(\d+(?:\.\d+)?)\s*%', comment)
+            match = PERCENT_RE.search(comment)
             if match:
                 discount["value"] = float(match.group(1))
         elif '원' in comment:
@@ -170,55 +378,195 @@ def parse_card_data(raw: dict) -> dict:
         card["benefits"].append({
             "category": category,
             "title": title,
-            "description": comment[:300] if comment else title,
-            "detail": info_text[:500] if info_text else None,
+            "description": comment or title,
+            "detail": info_text or None,
             "discount": discount,
             "is_select_option": is_select
         })
     
+    # 선택형(택 1) 혜택을 선택 세트로 묶음
+    card["choice_sets"] = group_choice_sets(card["benefits"])
+    
     return card
 
 
-def main():
-    """메인 크롤링 함수"""
-    start_time = time.time()
-    print("=" * 50)
-    print("삼성카드 API 크롤러 시작")
-    print("=" * 50)
+def cache_blob_path(cache_dir: Path, card_id, digest: str) -> Path:
+    """원본 캐시 경로 (카드 ID + 내용 해시 기준)"""
+    return cache_dir / str(card_id) / f"{digest}.json.gz"
+
+
+def save_raw_payload(cache_dir: Path, card_id, digest: str, raw: dict):
+    """상세 응답 원본을 gzip으로 저장 (같은 해시는 한 번만 기록)"""
+    path = cache_blob_path(cache_dir, card_id, digest)
+    if path.exists():
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = json.dumps(raw, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    tmp_path = path.with_suffix(".tmp")
+    with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=9) as f:
+        f.write(payload)
+    tmp_path.replace(path)
+
+
+def load_raw_payload(cache_dir: Path, card_id, digest: str) -> dict | None:
+    path = cache_blob_path(cache_dir, card_id, digest)
+    if not path.exists():
+        return None
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def crawl(args, output_path: Path) -> tuple[list[dict], dict] | None:
+    """API에서 카드 수집 (증분 모드 지원)
+    반환: (cards, new_state) - 리스트 조회가 실패했거나 카드 ID를 하나도 못 받으면 None
+    리스트 ID 수가 API 전체 개수와 다르면 이번 목록에 없는 이전 카드와 상태는 그대로 유지 (단종 처리 안 함)
+    """
+    # 리스트 페이징 요청이 상세 조회와 동시에 나가므로 연결 1개 여유
+    client = CardGorillaClient(args.api_base, pool_size=args.workers + 1, rate=args.rate,
+                               burst=args.burst, max_retries=args.retries)
     
-    # 출력 디렉토리 생성
-    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    # 증분 모드: 이전 결과가 남아 있는 카드에만 조건부 요청
+    previous = load_previous_cards(output_path) if args.incremental else {}
+    state = load_crawl_state(args.state) if args.incremental else {}
+    conditional_state = {cid: v for cid, v in state.items() if cid in previous}
     
-    # 1. 카드 리스트 수집
-    card_ids = get_card_list()
+    # 1. 카드 리스트 페이지 조회 + 2. 상세 정보 수집 (페이지 도착 즉시 병렬 조회)
+    print(f"[1/2] 카드 리스트/상세 정보 수집 중... (페이지당 {args.per_page}개, "
+          f"동시 {args.workers}개, 초당 {args.rate}회)")
+    try:
+        card_ids, results = crawl_card_details(client, conditional_state, args.workers, args.per_page)
+    except Exception as e:
+        print(f"[ERROR] 리스트 조회 실패: {e}")
+        client.close()
+        return None
     if not card_ids:
-        print("[ERROR] 카드 ID를 수집하지 못했습니다.")
-        return
+        client.close()
+        return None
+    
+    total = client.list_total
+    complete = total is None or total == len(card_ids)
+    if not complete:
+        print(f"  [WARN] API 전체 개수({total})와 수집된 ID 수({len(card_ids)})가 다릅니다. "
+              f"목록에 없는 이전 카드는 유지합니다.")
+        if not args.incremental:
+            previous = load_previous_cards(output_path)
+            state = load_crawl_state(args.state)
     
-    # 2. 상세 정보 수집
-    print(f"\n[2/2] 상세 정보 수집 중... (총 {len(card_ids)}개)")
+    print(f"\n[2/2] 상세 정보 정리 중... (총 {len(card_ids)}개)")
     
     cards = []
-    all_categories = set()
+    new_state = {}
+    counts = {"skipped": 0, "updated": 0, "added": 0, "failed": 0}
     
-    for i, card_id in enumerate(card_ids):
+    for i, (card_id, (status, raw_data, validators)) in enumerate(zip(card_ids, results)):
         print(f"  - [{i+1}/{len(card_ids)}] 카드 ID: {card_id}", end="")
+        key = str(card_id)
+        prev_card = previous.get(key)
         
-        raw_data = get_card_detail(card_id)
-        if raw_data:
-            card = parse_card_data(raw_data)
-            cards.append(card)
-            
-            # 카테고리 수집
-            for benefit in card.get("benefits", []):
-                if benefit.get("category"):
-                    all_categories.add(benefit["category"])
-            
-            print(f" - {card['name'][:20]}... ({len(card['benefits'])}개 혜택)")
+        if status == 304 and prev_card:
+            card = prev_card
+            new_state[key] = state[key]
+            counts["skipped"] += 1
+            print(f" - {card['name'][:20]}... (변경 없음, 304)")
+        elif raw_data:
+            digest = payload_hash(raw_data)
+            save_raw_payload(args.cache_dir, key, digest, raw_data)
+            if prev_card and state.get(key, {}).get("hash") == digest:
+                card = prev_card
+                counts["skipped"] += 1
+                print(f" - {card['name'][:20]}... (변경 없음)")
+            else:
+                card = parse_card_data(raw_data)
+                counts["updated" if prev_card else "added"] += 1
+                print(f" - {card['name'][:20]}... ({len(card['benefits'])}개 혜택)")
+            new_state[key] = {**validators, "hash": digest}
+        elif prev_card:
+            # 조회 실패 시 이전 데이터 유지
+            card = prev_card
+            if key in state:
+                new_state[key] = state[key]
+            counts["failed"] += 1
+            print(" - 실패 (이전 데이터 유지)")
         else:
+            counts["failed"] += 1
             print(" - 실패")
+            continue
         
-        time.sleep(REQUEST_DELAY)
+        cards.append(card)
+    
+    if not complete:
+        seen = {str(cid) for cid in card_ids}
+        kept = [card for key, card in previous.items() if key not in seen]
+        cards.extend(kept)
+        # 목록에 없던 카드도 해시/ETag 상태 유지 (완전한 목록을 받았을 때만 단종으로 정리)
+        new_state.update((key, value) for key, value in state.items() if key not in seen and key in previous)
+        print(f"\n  - 목록 누락으로 이전 카드 {len(kept)}개 유지")
+    
+    if args.incremental:
+        discontinued = set(previous) - {str(cid) for cid in card_ids} if complete else set()
+        print(f"\n  - 증분: 유지 {counts['skipped']} / 갱신 {counts['updated']} / "
+              f"신규 {counts['added']} / 단종 {len(discontinued)} / 실패 {counts['failed']}")
+    client.print_stats()
+    client.close()
+    return cards, new_state
+
+
+def replay_from_cache(state_path: Path, cache_dir: Path) -> list[dict]:
+    """크롤링 상태 파일 + 원본 캐시만으로 카드 데이터 재생성 (네트워크 없음)"""
+    state = load_crawl_state(state_path)
+    print(f"[1/1] 원본 캐시에서 재파싱 중... (총 {len(state)}개)")
+    
+    cards = []
+    for card_id, entry in state.items():
+        raw_data = load_raw_payload(cache_dir, card_id, entry.get("hash", ""))
+        if raw_data is None:
+            print(f"  [WARN] 카드 {card_id} 원본 캐시 없음")
+            continue
+        cards.append(parse_card_data(raw_data))
+    return cards
+
+
+def main(argv: list[str] | None = None):
+    """메인 크롤링 함수"""
+    parser = argparse.ArgumentParser(description="카드고릴라 삼성카드 API 크롤러")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="상세 API 동시 요청 수")
+    parser.add_argument("--rate", type=float, default=RATE_LIMIT, help="초당 최대 요청 수 (0이면 제한 없음)")
+    parser.add_argument("--per-page", type=int, default=PER_PAGE, help="리스트 API 페이지 크기")
+    parser.add_argument("--burst", type=int, default=RATE_BURST, help="순간 허용 요청 수")
+    parser.add_argument("--retries", type=int, default=MAX_RETRIES, help="5xx/타임아웃 재시도 횟수 (0 미만은 0)")
+    parser.add_argument("--api-base", default=API_BASE, help="API 기본 URL")
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH, help="결과 JSON 경로")
+    parser.add_argument("--incremental", action="store_true", help="변경된 카드만 재수집/재파싱")
+    parser.add_argument("--state", type=Path, default=STATE_PATH, help="증분 크롤링 상태 파일 경로")
+    parser.add_argument("--cache-dir", type=Path, default=CACHE_DIR, help="상세 응답 원본 캐시 디렉토리")
+    parser.add_argument("--from-cache", action="store_true", help="네트워크 없이 원본 캐시로 재파싱")
+    args = parser.parse_args(argv)
+    output_path = args.output
+
+    start_time = time.time()
+    print("=" * 50)
+    print("삼성카드 API 크롤러 시작" if not args.from_cache else "삼성카드 원본 캐시 재파싱 시작")
+    print("=" * 50)
+    
+    # 출력 디렉토리 생성
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    if args.from_cache:
+        cards = replay_from_cache(args.state, args.cache_dir)
+        new_state = None
+    else:
+        crawled = crawl(args, output_path)
+        if crawled is None:
+            print("[ERROR] 카드 ID를 수집하지 못했습니다. 기존 결과를 덮어쓰지 않습니다.")
+            return
+        cards, new_state = crawled
+    
+    # 카테고리 수집
+    all_categories = set()
+    for card in cards:
+        for benefit in card.get("benefits", []):
+            if benefit.get("category"):
+                all_categories.add(benefit["category"])
     
     # 3. 결과 저장
     result = {
@@ -229,9 +577,11 @@ def main():
         "cards": cards
     }
     
-    print(f"\n[저장 중] {OUTPUT_PATH}")
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"\n[저장 중] {output_path}")
+    store = save_data(result, str(output_path))
+    print_store_report(store, sys.stdout)
+    if new_state is not None:
+        save_crawl_state(args.state, new_state)
     
     elapsed = time.time() - start_time
     print(f"\n{'=' * 50}")
@@ -239,7 +589,7 @@ def main():
     print(f"  - 수집된 카드: {len(cards)}개")
     print(f"  - 카테고리: {len(all_categories)}개")
     print(f"  - 소요 시간: {elapsed:.1f}초")
-    print(f"  - 저장 위치: {OUTPUT_PATH}")
+    print(f"  - 저장 위치: {output_path}")
     print("=" * 50)
 
 
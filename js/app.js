@@ -14,16 +14,33 @@ class CardHeroAnimation {
             'https://d1c5n4ri2guedi.cloudfront.net/card/2885/card_img/44212/2885card_1.png',
             'https://d1c5n4ri2guedi.cloudfront.net/card/657/card_img/27715/657card.png'
         ];
+        this.fallbackUrls = [];
 
         this.init();
     }
 
-    init() {
+    async init() {
         this.resize();
         window.addEventListener('resize', () => this.resize());
+        await this.useLocalThumbnails();
         this.loadImages();
     }
 
+    async useLocalThumbnails() {
+        // scripts/images.py 로 만든 로컬 WebP 썸네일이 manifest에 있으면 원본 대신 사용
+        try {
+            const response = await fetch('data/manifest.json', { cache: 'no-cache' });
+            const manifest = await response.json();
+            (manifest.hero_images || []).forEach((path, i) => {
+                if (!path || i >= this.cardUrls.length) return;
+                this.fallbackUrls[i] = this.cardUrls[i];
+                this.cardUrls[i] = `data/${path}`;
+            });
+        } catch (error) {
+            // manifest 없음 → 원본 URL 사용
+        }
+    }
+
     resize() {
         const container = this.canvas.parentElement;
         this.canvas.width = container.offsetWidth;
@@ -45,6 +62,10 @@ class CardHeroAnimation {
                 }
             };
             img.onerror = () => {
+                if (this.fallbackUrls[i] && img.src !== this.fallbackUrls[i]) {
+                    img.src = this.fallbackUrls[i]; // 로컬 썸네일 실패 → 원본
+                    return;
+                }
                 console.log('Image load error, using fallback');
                 this.loaded++;
             };
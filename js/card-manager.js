@@ -6,6 +6,11 @@ class CardManager {
     constructor() {
         this.cards = [];
         this.filteredCards = [];
+        this.cardDetails = new Map(); // detail_key -> 전체 카드 데이터 (지연 로드)
+        this.cardsByKey = new Map(); // detail_key -> 목록 카드
+        this.categoryIndex = {}; // 카테고리 -> 정렬된 [detail_key, 혜택 수, 우선순위]
+        this.featuredKeys = []; // 추천 탭 고정 카드 detail_key (data/priority_cards.json featured_cards)
+        this.manifestFiles = {}; // 논리 이름 -> 내용 해시가 붙은 경로 (data/manifest.json)
         this.currentFilter = '추천';
         this.cardGridElement = document.querySelector('.card-grid');
         this.init();
@@ -17,18 +22,61 @@ class CardManager {
         this.setupFilterListeners();
     }
 
+    async loadManifest() {
+        // 매 배포마다 바뀌는 유일한 파일 → 항상 재검증, 나머지 해시 경로는 영구 캐시 가능
+        const response = await fetch('data/manifest.json', { cache: 'no-cache' });
+        const manifest = await response.json();
+        this.manifestFiles = manifest.files || {};
+    }
+
+    dataUrl(name) {
+        return `data/${this.manifestFiles[name]}`;
+    }
+
+    cardImageHtml(card) {
+        // 로컬 썸네일(scripts/images.py)이 있으면 AVIF → WebP → 원본 순으로 선택
+        const img = `<img src="${card.image_url}" alt="${card.name}" loading="lazy">`;
+        if (!card.thumb) return img;
+        const sources = Object.entries(card.thumb).map(([format, srcset]) => {
+            const urls = srcset.split(', ').map(entry => `data/${entry}`).join(', ');
+            return `<source type="image/${format}" srcset="${urls}" sizes="105px">`;
+        });
+        return `<picture>${sources.join('')}${img}</picture>`;
+    }
+
     async loadCards() {
         try {
-            const response = await fetch('data/samsung_cards.json');
+            await this.loadManifest();
+            // 그리드 렌더링 필드만 담은 목록 (scripts/build_frontend.py 생성)
+            const response = await fetch(this.dataUrl('cards_listing.json'));
             const data = await response.json();
             this.cards = data.cards;
             this.filteredCards = [...this.cards];
+            this.cardsByKey = new Map(this.cards.map(card => [card.detail_key, card]));
+            this.categoryIndex = data.category_index || {};
+            this.featuredKeys = data.featured || [];
             console.log(`${this.cards.length}개 카드 로드 완료`);
         } catch (error) {
             console.error('카드 데이터 로드 실패:', error);
         }
     }
 
+    async loadCardDetail(card) {
+        // 전체 혜택/유의사항 등 상세 데이터는 필요할 때 카드별로 로드
+        if (this.cardDetails.has(card.detail_key)) {
+            return this.cardDetails.get(card.detail_key);
+        }
+        try {
+            const response = await fetch(this.dataUrl(`cards/${card.detail_key}.json`));
+            const detail = await response.json();
+            this.cardDetails.set(card.detail_key, detail);
+            return detail;
+        } catch (error) {
+            console.error('카드 상세 로드 실패:', error);
+            return null;
+        }
+    }
+
     renderCards() {
         if (!this.cardGridElement) return;
 
@@ -37,10 +85,9 @@ class CardManager {
         let cardsToShow;
 
         if (this.currentFilter === '추천') {
-            // 추천 탭: 고정 3개 카드만
-            const priorityNames = ['삼성카드 taptap O', '삼성 iD SELECT ALL 카드', '모니모카드'];
-            cardsToShow = priorityNames
-                .map(name => this.cards.find(c => c.name === name))
+            // 추천 탭: 빌드 시 지정된 고정 카드만
+            cardsToShow = this.featuredKeys
+                .map(key => this.cardsByKey.get(key))
                 .filter(Boolean);
         } else {
             // 다른 탭: 해당 카테고리 혜택 있는 카드만
@@ -70,7 +117,7 @@ class CardManager {
         article.style.animationDelay = `${index * 0.05}s`;
 
         // display_benefits 사용 (재분류된 혜택), summary 중복 제거, 최대 4개
-        const allBenefits = card.display_benefits || card.summarized_benefits || [];
+        const allBenefits = card.display_benefits || [];
         const seenSummaries = new Set();
         const benefits = [];
 
@@ -101,7 +148,7 @@ class CardManager {
             <div class="card-content">
                 <div class="card-image">
                     <div class="card-tagline">${tagline}</div>
-                    <img src="${card.image_url}" alt="${card.name}" loading="lazy">
+                    ${this.cardImageHtml(card)}
                 </div>
                 <div class="card-info">
                     <h3 class="card-name">${card.name}</h3>
@@ -124,9 +171,43 @@ class CardManager {
             </div>
         `;
 
+        // 카드 정보를 누르면 전체 혜택 펼치기 (상세 데이터는 이때 처음 로드)
+        article.querySelector('.card-info').addEventListener('click', () => this.toggleCardDetail(article, card));
+
         return article;
     }
 
+    async toggleCardDetail(article, card) {
+        let panel = article.querySelector('.card-detail');
+        if (panel) {
+            panel.hidden = !panel.hidden;
+            return;
+        }
+        panel = document.createElement('div');
+        panel.className = 'card-detail';
+        panel.textContent = '혜택 불러오는 중...';
+        article.querySelector('.card-content').after(panel);
+
+        const detail = await this.loadCardDetail(card);
+        panel.innerHTML = detail ? this.createDetailHTML(detail) : '상세 혜택을 불러오지 못했습니다.';
+    }
+
+    createDetailHTML(detail) {
+        // 유의사항/선택형 안내 문구를 뺀 전체 혜택 목록 (첫 줄만)
+        const benefits = (detail.benefits || [])
+            .filter(b => b.title !== '유의사항' && b.title !== '선택형' && b.description);
+        return `
+            <ul class="detail-benefits">
+                ${benefits.map(b => `
+                    <li class="detail-benefit">
+                        <span class="detail-title">${b.title || '혜택'}</span>
+                        <span class="detail-desc">${b.description.split('\n')[0]}</span>
+                    </li>
+                `).join('')}
+            </ul>
+        `;
+    }
+
     getTopBenefits(benefits, count) {
         if (!benefits || !Array.isArray(benefits)) return [];
 
@@ -213,27 +294,11 @@ class CardManager {
         if (category === '추천') {
             this.filteredCards = [...this.cards];
         } else {
-            // display_benefits에서 해당 카테고리 혜택 있는 카드만 필터
-            this.filteredCards = this.cards.filter(card => {
-                const benefits = card.display_benefits || card.summarized_benefits || [];
-                return benefits.some(b => b.category === category);
-            });
-
-            // Priority 카드 우선, 이후 해당 카테고리 혜택 개수로 정렬
-            const priorityNames = ['삼성카드 taptap O', '삼성 iD SELECT ALL 카드', '모니모카드'];
-            this.filteredCards.sort((a, b) => {
-                const aPriority = priorityNames.indexOf(a.name);
-                const bPriority = priorityNames.indexOf(b.name);
-                // 둘 다 priority 카드인 경우 priority 순서대로
-                if (aPriority >= 0 && bPriority >= 0) return aPriority - bPriority;
-                // priority 카드가 먼저
-                if (aPriority >= 0) return -1;
-                if (bPriority >= 0) return 1;
-                // 나머지는 혜택 개수로 정렬
-                const aCount = (a.display_benefits || []).filter(b => b.category === category).length;
-                const bCount = (b.display_benefits || []).filter(b => b.category === category).length;
-                return bCount - aCount;
-            });
+            // 빌드 시 sort_key로 정렬해 둔 역색인 조회 (우선순위 rank 순 → 연회비 낮은 순)
+            const entries = this.categoryIndex[category] || [];
+            this.filteredCards = entries
+                .map(([key]) => this.cardsByKey.get(key))
+                .filter(Boolean);
         }
 
         console.log(`${category} 필터: ${this.filteredCards.length}개 카드`);
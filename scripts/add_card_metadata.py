@@ -1,43 +1,46 @@
 """
 107개 삼성카드에 색상(primary/secondary) 및 특징 문구(tagline) 자동 생성
 """
-import json
 import os
 
+from data_io import build_parser, info_stream, load_cards, parse_io_args, save_data
+from priority import priority_table
+
 # 카드 이름별 색상 및 tagline 매핑 (특수 카드)
+# 네이버 우선순위 카드 색상은 data/priority_cards.json card_colors 에서 가져오므로 tagline만 둠
 CARD_METADATA = {
     # taptap 시리즈 - 핑크 계열
-    "삼성카드 taptap O": {"colors": ["#e91e63", "#f48fb1"], "tagline": "다양한 혜택을 한 장에!"},
+    "삼성카드 taptap O": {"tagline": "다양한 혜택을 한 장에!"},
     "삼성카드 taptap S": {"colors": ["#e91e63", "#f48fb1"], "tagline": "스마트한 일상의 시작"},
-    "taptap DIGITAL": {"colors": ["#7c4dff", "#b388ff"], "tagline": "디지털 라이프 필수템"},
-    "taptap DRIVE": {"colors": ["#0277bd", "#4fc3f7"], "tagline": "드라이버를 위한 스마트 혜택"},
-    "taptap SHOPPING": {"colors": ["#ff5722", "#ff8a65"], "tagline": "쇼핑의 즐거움을 더하다"},
+    "taptap DIGITAL": {"tagline": "디지털 라이프 필수템"},
+    "taptap DRIVE": {"tagline": "드라이버를 위한 스마트 혜택"},
+    "taptap SHOPPING": {"tagline": "쇼핑의 즐거움을 더하다"},
     "삼성페이 삼성카드 taptap": {"colors": ["#e91e63", "#f48fb1"], "tagline": "삼성페이와 함께하는 혜택"},
-    "네이버페이 taptap": {"colors": ["#03c75a", "#00e676"], "tagline": "네이버와 함께하는 스마트 페이"},
+    "네이버페이 taptap": {"tagline": "네이버와 함께하는 스마트 페이"},
     "CU·배달의민족 삼성카드 taptap": {"colors": ["#3bb7c8", "#81d4fa"], "tagline": "편의점과 배달의 꿀조합"},
     
     # iD 시리즈 - 삼성 블루 계열
-    "삼성 iD SELECT ALL 카드": {"colors": ["#1428a0", "#2d4de0"], "tagline": "선택이 곧 혜택"},
+    "삼성 iD SELECT ALL 카드": {"tagline": "선택이 곧 혜택"},
     "삼성 iD SELECT ON 카드": {"colors": ["#1428a0", "#2d4de0"], "tagline": "나만의 혜택을 선택하다"},
-    "삼성 iD SIMPLE 카드": {"colors": ["#333333", "#666666"], "tagline": "심플하게, 알차게"},
-    "삼성 iD ENERGY 카드": {"colors": ["#f57c00", "#ffb74d"], "tagline": "에너지 넘치는 혜택"},
-    "삼성 iD ON 카드": {"colors": ["#5c6bc0", "#9fa8da"], "tagline": "언제나 켜져있는 혜택"},
-    "삼성 iD PLUG-IN 카드": {"colors": ["#26a69a", "#80cbc4"], "tagline": "일상에 혜택을 플러그인"},
-    "삼성 iD ALL 카드": {"colors": ["#1428a0", "#2d4de0"], "tagline": "모든 혜택을 한 장에"},
-    "삼성 iD GLOBAL 카드": {"colors": ["#1e3a5f", "#3d5a80"], "tagline": "해외에서 빛나는 혜택"},
-    "삼성 iD VITA 카드": {"colors": ["#ec407a", "#f48fb1"], "tagline": "건강한 라이프 파트너"},
-    "삼성 iD PET 카드": {"colors": ["#8d6e63", "#bcaaa4"], "tagline": "반려동물과 함께하는 혜택"},
+    "삼성 iD SIMPLE 카드": {"tagline": "심플하게, 알차게"},
+    "삼성 iD ENERGY 카드": {"tagline": "에너지 넘치는 혜택"},
+    "삼성 iD ON 카드": {"tagline": "언제나 켜져있는 혜택"},
+    "삼성 iD PLUG-IN 카드": {"tagline": "일상에 혜택을 플러그인"},
+    "삼성 iD ALL 카드": {"tagline": "모든 혜택을 한 장에"},
+    "삼성 iD GLOBAL 카드": {"tagline": "해외에서 빛나는 혜택"},
+    "삼성 iD VITA 카드": {"tagline": "건강한 라이프 파트너"},
+    "삼성 iD PET 카드": {"tagline": "반려동물과 함께하는 혜택"},
     "삼성 iD ONE 카드": {"colors": ["#1428a0", "#2d4de0"], "tagline": "하나로 충분한 혜택"},
     "삼성 iD STATION 카드 (GS칼텍스)": {"colors": ["#ff6f00", "#ffab40"], "tagline": "주유할 때마다 스마트하게"},
     "삼성 iD STATION 카드 (SK에너지)": {"colors": ["#d32f2f", "#ef5350"], "tagline": "SK와 함께하는 주유 혜택"},
     "삼성 iD NOMAD 카드": {"colors": ["#00897b", "#4db6ac"], "tagline": "자유로운 라이프를 위한 카드"},
     
     # 모니모 시리즈 - 하늘색 계열
-    "모니모카드": {"colors": ["#0096d6", "#00c3ff"], "tagline": "모이는 금융 커지는 혜택"},
-    "모니모A 카드": {"colors": ["#00bcd4", "#4dd0e1"], "tagline": "모니모로 시작하는 금융"},
+    "모니모카드": {"tagline": "모이는 금융 커지는 혜택"},
+    "모니모A 카드": {"tagline": "모니모로 시작하는 금융"},
     
     # 프리미엄 카드 - 다크 계열
-    "THE iD. PLATINUM (포인트)": {"colors": ["#424242", "#757575"], "tagline": "프리미엄 라이프의 시작"},
+    "THE iD. PLATINUM (포인트)": {"tagline": "프리미엄 라이프의 시작"},
     "THE iD. 1st": {"colors": ["#212121", "#424242"], "tagline": "최고를 위한 선택"},
     "THE 1 (스카이패스)": {"colors": ["#1a237e", "#3949ab"], "tagline": "여행의 품격을 높이다"},
     "BIZ THE iD. PLATINUM (포인트)": {"colors": ["#37474f", "#607d8b"], "tagline": "비즈니스 프리미엄 파트너"},
@@ -51,7 +54,7 @@ CARD_METADATA = {
     "삼성카드 스페셜마일리지 (스카이패스)": {"colors": ["#1565c0", "#42a5f5"], "tagline": "특별한 마일리지 적립"},
     
     # 제휴 카드 - 신세계/이마트
-    "신세계이마트 삼성카드 7": {"colors": ["#fbc02d", "#fff176"], "tagline": "장보기가 즐거워지는 혜택"},
+    "신세계이마트 삼성카드 7": {"tagline": "장보기가 즐거워지는 혜택"},
     "트레이더스 신세계 삼성카드": {"colors": ["#f9a825", "#ffee58"], "tagline": "대용량 쇼핑의 스마트 파트너"},
     "이마트신세계 삼성카드": {"colors": ["#fdd835", "#fff59d"], "tagline": "쇼핑 라이프의 필수 카드"},
     
@@ -140,22 +143,24 @@ KEYWORD_TAGLINES = {
 def get_card_metadata(card_name, benefits):
     """카드 이름과 혜택을 분석하여 색상과 tagline 반환"""
     
-    # 1. 미리 정의된 메타데이터 확인
-    if card_name in CARD_METADATA:
-        meta = CARD_METADATA[card_name]
+    # 1. 색상: priority_cards.json card_colors → CARD_METADATA → 키워드 순
+    meta = CARD_METADATA.get(card_name, {})
+    colors = priority_table().card_colors(card_name) or meta.get("colors")
+    if not colors:
+        colors = DEFAULT_COLORS.copy()
+        for keyword, color_pair in KEYWORD_COLORS.items():
+            if keyword.upper() in card_name.upper():
+                colors = color_pair
+                break
+    
+    # 2. 미리 정의된 tagline 확인
+    if "tagline" in meta:
         return {
-            "primary_color": meta["colors"][0],
-            "secondary_color": meta["colors"][1],
+            "primary_color": colors[0],
+            "secondary_color": colors[1],
             "tagline": meta["tagline"]
         }
     
-    # 2. 키워드 기반 색상 결정
-    colors = DEFAULT_COLORS.copy()
-    for keyword, color_pair in KEYWORD_COLORS.items():
-        if keyword.upper() in card_name.upper():
-            colors = color_pair
-            break
-    
     # 3. 키워드 기반 tagline 결정
     tagline = "일상에 혜택을 더하다"  # 기본값
     for keyword, tag in KEYWORD_TAGLINES.items():
@@ -185,36 +190,35 @@ def get_card_metadata(card_name, benefits):
         "tagline": tagline
     }
 
-def main():
-    # JSON 파일 읽기
-    json_path = r"c:\Users\MADUP\Documents\seokmin\website_samsungcard_recommend\data\samsung_cards.json"
+def apply_card_metadata(card):
+    """카드에 색상/tagline 추가 (파이프라인 단계)"""
+    metadata = get_card_metadata(card["name"], card.get("benefits", []))
     
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    card["primary_color"] = metadata["primary_color"]
+    card["secondary_color"] = metadata["secondary_color"]
+    card["tagline"] = metadata["tagline"]
+
+def main(argv=None):
+    args = parse_io_args(build_parser("카드 색상/tagline 메타데이터 추가"), argv)
+    out = info_stream(args.output)
+    
+    data = load_cards(args.input)
     
     # 각 카드에 메타데이터 추가
     for card in data["cards"]:
-        card_name = card["name"]
-        benefits = card.get("benefits", [])
-        
-        metadata = get_card_metadata(card_name, benefits)
-        
-        card["primary_color"] = metadata["primary_color"]
-        card["secondary_color"] = metadata["secondary_color"]
-        card["tagline"] = metadata["tagline"]
+        apply_card_metadata(card)
     
     # JSON 파일 저장
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_data(data, args.output)
     
-    print(f"완료: {len(data['cards'])}개 카드에 메타데이터 추가됨")
+    print(f"완료: {len(data['cards'])}개 카드에 메타데이터 추가됨", file=out)
     
     # 결과 샘플 출력
-    print("\n샘플 결과:")
+    print("\n샘플 결과:", file=out)
     for i, card in enumerate(data["cards"][:5]):
-        print(f"  {i+1}. {card['name']}")
-        print(f"     색상: {card['primary_color']} -> {card['secondary_color']}")
-        print(f"     태그라인: {card['tagline']}")
+        print(f"  {i+1}. {card['name']}", file=out)
+        print(f"     색상: {card['primary_color']} -> {card['secondary_color']}", file=out)
+        print(f"     태그라인: {card['tagline']}", file=out)
 
 if __name__ == "__main__":
     main()
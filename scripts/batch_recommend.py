@@ -0,0 +1,236 @@
+"""
+고객 소비 데이터 일괄 카드 추천 (오프라인 배치)
+- CSV/Parquet 소비 내역을 묶음 단위로 읽어 프로세스 풀에서 점수 계산 후 고객별 상위 N개 카드 기록
+- 입력 크기와 관계없이 메모리 일정: 한 번에 (워커 수 x 2)개 묶음만 처리 중으로 유지
+- 카드 행렬(recommender.Recommender)은 워커마다 한 번만 생성
+- 처리량(명/초)과 최대 메모리(RSS) 출력
+
+입력 형식 (첫 열 = 고객 ID, 나머지 열 = 월 소비 금액):
+    customer_id,커피,교통,쿠팡,기타
+    C0000001,45000,62000,180000,550000
+  열 이름은 추천 엔진 카테고리 또는 가맹점 이름 (알려진 가맹점은 가맹점 열, 그 밖에는 카테고리로 합산)
+  CSV는 한 행이 한 줄이어야 함 (따옴표 안 줄바꿈 미지원)
+
+출력 (CSV): customer_id,card_1,value_1,...,card_N,value_N  (value = 연간 순혜택, 원)
+  card = 카드 id (중복 id는 build_frontend detail_key 와 같은 "-n" 접미사), N은 카드 수 이하
+
+사용법:
+    python scripts/batch_recommend.py --input spend.csv --output top.csv --top 3
+    python scripts/batch_recommend.py --input spend.parquet --output top.csv   # pyarrow 필요
+    python scripts/batch_recommend.py --synthetic 1000000 --input /tmp/spend.csv --output /tmp/top.csv
+
+필요 패키지: numpy (Parquet 입력은 pyarrow 추가)
+"""
+import argparse
+import csv
+import io
+import os
+import resource
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from build_frontend import detail_keys
+from data_io import load_data
+from recommender import CATEGORIES, DATA_PATH, Recommender, random_profiles
+
+CHUNK_ROWS = 20000       # 워커에 한 번에 넘기는 고객 수
+IN_FLIGHT_PER_WORKER = 2  # 워커당 처리 중으로 유지하는 묶음 수 (메모리 상한)
+
+_recommender = None       # 워커 프로세스별 추천 엔진
+_card_keys = None         # 카드 순서 → 출력 ID (중복 id는 build_frontend 와 같은 -n 접미사)
+
+
+def _init_worker(data_path: str):
+    global _recommender, _card_keys
+    _recommender = Recommender.from_file(Path(data_path))
+    _card_keys = detail_keys(_recommender.cards)
+
+
+def column_matrix(recommender: Recommender, columns: list[str]) -> np.ndarray:
+    """입력 열 → 소비 열 합산 행렬 (C x K), 열 이름은 카테고리 또는 가맹점"""
+    matrix = np.zeros((len(columns), len(recommender.category_index)))
+    for c, column in enumerate(columns):
+        matrix[c] = recommender.profile_vector({column: 1})
+    return matrix
+
+
+def format_top(ids, top: np.ndarray, values: np.ndarray, card_ids: list[str]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for customer, row, row_values in zip(ids, top, values):
+        line = [customer]
+        for n, value in zip(row, row_values):
+            line += [card_ids[n], int(round(value))]
+        writer.writerow(line)
+    return buffer.getvalue()
+
+
+def _score_rows(ids, amounts: np.ndarray, columns: list[str], top: int) -> str:
+    """워커: (고객 ID, 열별 소비 금액) 묶음 → 출력 CSV 텍스트"""
+    spend = amounts @ column_matrix(_recommender, columns)
+    best, values = _recommender.top_cards(spend, top)
+    return format_top(ids, best, values, _card_keys)
+
+
+def check_amounts(amounts: np.ndarray, labels: list[str]):
+    """음수/무한대/NaN 금액 거부 (server.py /recommend 와 같은 기준), labels = 행별 오류 위치"""
+    bad = ~(np.isfinite(amounts) & (amounts >= 0))
+    if bad.any():
+        row, col = np.argwhere(bad)[0]
+        raise ValueError(f"{labels[row]}: {col + 2}번째 열 금액 {amounts[row, col]} (0 이상의 유한한 숫자여야 함)")
+
+
+def _parse_amount(value: str, number: int) -> float:
+    try:
+        return float(value) if value else 0.0
+    except ValueError:
+        raise ValueError(f"{number}번째 줄: 숫자가 아닌 금액 {value!r}") from None
+
+
+def _score_csv_lines(lines: list[str], line_numbers: list[int], columns: list[str], top: int) -> str:
+    """워커: CSV 줄 묶음 파싱 후 점수 계산 (파싱도 워커에서 처리)"""
+    rows = list(csv.reader(lines))
+    for number, row in zip(line_numbers, rows):
+        if len(row) != len(columns) + 1:
+            raise ValueError(f"{number}번째 줄: 열 {len(row)}개 (헤더는 {len(columns) + 1}개)")
+    ids = [row[0] for row in rows]
+    amounts = np.array([[_parse_amount(v, number) for v in row[1:]] for number, row in zip(line_numbers, rows)])
+    amounts = amounts.reshape(len(rows), len(columns))
+    check_amounts(amounts, [f"{number}번째 줄" for number in line_numbers])
+    return _score_rows(ids, amounts, columns, top)
+
+
+def iter_csv_chunks(path: Path, chunk_rows: int):
+    """(열 이름 목록, CSV 줄 묶음, 줄 번호 목록) 생성 - 줄 번호는 오류 보고용 (헤더 = 1)"""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        columns = next(csv.reader([f.readline()]))[1:]
+        lines, numbers = [], []
+        for number, line in enumerate(f, 2):
+            if line.strip():
+                lines.append(line)
+                numbers.append(number)
+            if len(lines) >= chunk_rows:
+                yield columns, lines, numbers
+                lines, numbers = [], []
+        if lines:
+            yield columns, lines, numbers
+
+
+def iter_parquet_chunks(path: Path, chunk_rows: int):
+    """(열 이름 목록, 고객 ID, 소비 행렬) 생성 - 첫 열은 고객 ID"""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        sys.exit("Parquet 입력에는 pyarrow가 필요합니다 (pip install pyarrow)")
+    parquet = pq.ParquetFile(path)
+    names = parquet.schema_arrow.names
+    offset = 0
+    for batch in parquet.iter_batches(batch_size=chunk_rows):
+        ids = batch.column(0).to_pylist()
+        amounts = np.column_stack([batch.column(i).to_numpy(zero_copy_only=False).astype(np.float64)
+                                   for i in range(1, len(names))])
+        amounts[np.isnan(amounts)] = 0.0     # 빈 값(null)만 0, 무한대/음수는 오류
+        check_amounts(amounts, [f"{offset + i + 1}번째 행" for i in range(len(ids))])
+        offset += len(ids)
+        yield names[1:], ids, amounts
+
+
+def write_synthetic_csv(path: Path, rows: int, chunk_rows: int = 100000, seed: int = 0):
+    """벤치마크용 가상 소비 CSV (카테고리 열 전체)"""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(",".join(["customer_id"] + CATEGORIES) + "\n")
+        for start in range(0, rows, chunk_rows):
+            count = min(chunk_rows, rows - start)
+            spend = random_profiles(count, seed=seed + start)[:, :len(CATEGORIES)].astype(np.int64)
+            lines = [f"C{start + i:08d}," + ",".join(map(str, row)) for i, row in enumerate(spend.tolist())]
+            f.write("\n".join(lines) + "\n")
+
+
+def peak_rss_mb() -> tuple[float, float]:
+    """(메인 프로세스, 종료된 워커 중 최대) 최대 RSS (MB, Linux 기준 ru_maxrss = KB)"""
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    return own, children
+
+
+def run_batch(input_path: Path, output_path: Path, data_path: Path, top: int,
+              workers: int, chunk_rows: int) -> int:
+    """입력 전체를 처리하고 고객 수 반환 (결과는 입력 순서대로 기록)
+    top은 호출 전에 카드 수 이하로 맞춰 둘 것 (헤더 열 수 = 행의 열 수)
+    임시 파일에 쓰고 끝까지 성공했을 때만 output_path를 교체 (입력 오류 시 이전 결과 유지)
+    """
+    is_parquet = input_path.suffix.lower() in (".parquet", ".pq")
+    pending = deque()
+    customers = 0
+    tmp_path = output_path.with_name(f"{output_path.name}.tmp")
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(str(data_path),)) as executor, \
+                open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(",".join(["customer_id"] + [f"{name}_{i}" for i in range(1, top + 1)
+                                                for name in ("card", "value")]) + "\n")
+
+            def drain(limit: int):
+                while len(pending) > limit:
+                    f.write(pending.popleft().result())
+
+            if is_parquet:
+                for columns, ids, amounts in iter_parquet_chunks(input_path, chunk_rows):
+                    pending.append(executor.submit(_score_rows, ids, amounts, columns, top))
+                    customers += len(ids)
+                    drain(workers * IN_FLIGHT_PER_WORKER)
+            else:
+                for columns, lines, numbers in iter_csv_chunks(input_path, chunk_rows):
+                    pending.append(executor.submit(_score_csv_lines, lines, numbers, columns, top))
+                    customers += len(lines)
+                    drain(workers * IN_FLIGHT_PER_WORKER)
+            drain(0)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    tmp_path.replace(output_path)
+    return customers
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="고객 소비 데이터 일괄 카드 추천")
+    parser.add_argument("--input", type=Path, required=True, help="소비 데이터 CSV/Parquet 경로")
+    parser.add_argument("--output", type=Path, required=True, help="추천 결과 CSV 경로")
+    parser.add_argument("--cards", type=Path, default=DATA_PATH, help="카드 데이터 JSON 경로")
+    parser.add_argument("--top", type=int, default=3, help="고객별 추천 카드 수")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="프로세스 수")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="워커에 한 번에 넘기는 고객 수")
+    parser.add_argument("--synthetic", type=int, metavar="N",
+                        help="--input 경로에 N명짜리 가상 소비 CSV를 먼저 생성")
+    args = parser.parse_args(argv)
+    out = sys.stdout
+
+    if args.synthetic:
+        start = time.perf_counter()
+        write_synthetic_csv(args.input, args.synthetic)
+        size_mb = args.input.stat().st_size / 1024 / 1024
+        print(f"가상 소비 데이터: {args.synthetic:,}명, {size_mb:,.1f}MB "
+              f"({time.perf_counter() - start:.1f}초)", file=out)
+
+    top = min(args.top, len(load_data(str(args.cards))["cards"]))
+    start = time.perf_counter()
+    try:
+        customers = run_batch(args.input, args.output, args.cards, top, args.workers, args.chunk_rows)
+    except ValueError as e:
+        sys.exit(f"입력 오류 ({args.input}): {e}")
+    elapsed = time.perf_counter() - start
+    own_rss, worker_rss = peak_rss_mb()
+
+    print(f"완료: {customers:,}명 → {args.output} (상위 {top}개, 워커 {args.workers}개)", file=out)
+    print(f"  - 처리 시간: {elapsed:.1f}초 ({customers / elapsed:,.0f}명/초)", file=out)
+    print(f"  - 최대 RSS: 메인 {own_rss:,.0f}MB / 워커 {worker_rss:,.0f}MB", file=out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""
+벤치마크/통계 공용 도구
+- 크롤러(api_crawler), 검색 색인(search_index), 서비스 부하 테스트(server)가 함께 사용
+"""
+import math
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """정렬된 리스트의 q 백분위수 (nearest-rank)"""
+    index = max(0, math.ceil(q / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
@@ -3,77 +3,38 @@
 - 할인/적립 정확히 구분
 - 마일리지 적립은 "마일리지 적립"으로 표시
 - 이동통신 = 통신 카테고리
+- 선택형(택 1) 혜택은 선택 세트의 대표 옵션(headline) 우선, 다른 옵션은 빈 카테고리만 표시
 """
-import json
-import re
+from categorizer import DISPLAY_CATEGORIZER
+from choice_sets import group_choice_sets, option_benefit_indexes
+from data_io import build_parser, info_stream, load_cards, parse_io_args, save_data
+from discount_parser import brand_percent, format_percent, format_won, parse_discount_text
+from memo import memoize
 
-def parse_discount_value(desc, detail, discount_obj):
+def parse_discount_value(desc, detail, discount_obj, parsed=None):
     """할인 값을 숫자로 파싱 (비교용)"""
     if discount_obj and discount_obj.get('value'):
         return float(discount_obj['value'])
     
-    text = desc + ' ' + (detail or '')
-    percent_match = re.search(r'(\d+(?:\.\d+)?)\s*%', text)
-    if percent_match:
-        return float(percent_match.group(1))
-    
-    won_match = re.search(r'([\d,]+)\s*원', text)
-    if won_match:
-        return int(won_match.group(1).replace(',', ''))
+    if parsed is None:
+        parsed = parse_discount_text(desc + ' ' + (detail or ''))
+    if parsed['percent'] is not None:
+        return parsed['percent']
+    if parsed['won'] is not None:
+        return parsed['won']
     
     # 마일리지
-    mile_match = re.search(r'([\d,]+)\s*마일', text)
-    if mile_match:
-        return int(mile_match.group(1).replace(',', ''))
+    if parsed['mile'] is not None:
+        return parsed['mile']
     
     return 0
 
 def detect_category(desc, detail):
     """description에서 올바른 카테고리 추출"""
-    text = (desc + ' ' + (detail or '')).lower()
-    
-    # 커피/카페 (먼저 체크)
-    if any(k in text for k in ['스타벅스', '투썸', '이디야', '메가커피', '커피', '카페']):
-        return '커피'
-    
-    # 스트리밍/OTT
-    if any(k in text for k in ['넷플릭스', '유튜브', '디즈니', '티빙', '웨이브', 'ott', '디지털콘텐츠']):
-        return '스트리밍'
-    
-    # 영화
-    if any(k in text for k in ['cgv', '롯데시네마', '메가박스', '영화']):
-        return '영화'
-    
-    # 배달
-    if any(k in text for k in ['배달의민족', '배민', '쿠팡이츠', '요기요', '배달앱']):
-        return '배달'
-    
-    # 통신 (이동통신 포함!)
-    if any(k in text for k in ['통신', 'skt', 'kt', 'lg u+', '이동통신', '휴대폰', '인터넷요금']):
-        return '통신'
-    
-    # 쇼핑
-    if any(k in text for k in ['쿠팡', '네이버', 'ssg', 'g마켓', '옥션', '11번가', '온라인쇼핑', '쇼핑몰', '마트', '이마트', '롯데마트', '편의점']):
-        return '쇼핑'
-    
-    # 주유
-    if any(k in text for k in ['주유', 'sk에너지', 'gs칼텍스', 's-oil', '오일뱅크']):
-        return '주유'
-    
-    # 교통
-    if any(k in text for k in ['대중교통', '버스', '지하철', '택시', 'ktx', '고속버스', '철도']):
-        return '교통'
-    
-    # 항공/마일리지
-    if any(k in text for k in ['마일리지', '스카이패스', '항공', '라운지', '아시아나', '대한항공', '마일']):
-        return '항공'
-    
-    # 해외
-    if any(k in text for k in ['해외']):
-        return '해외'
-    
-    return None
+    # 커피 > 스트리밍 > 영화 > 배달 > 통신(이동통신 포함) > 쇼핑 > 주유 > 교통 > 항공 > 해외 순
+    return DISPLAY_CATEGORIZER.categorize(desc + ' ' + (detail or ''))
 
+@memoize()
 def get_best_target(desc, detail, category):
     """가장 구체적인 대상 추출"""
     text = (desc + ' ' + (detail or '')).lower()
@@ -127,75 +88,53 @@ def get_best_target(desc, detail, category):
     }
     return defaults.get(category, category)
 
-def format_discount(discount_obj, desc, detail, target, category):
+def format_discount(discount_obj, desc, detail, target, category, parsed=None):
     """할인 값을 문자열로 포맷"""
     text = desc + ' ' + (detail or '')
+    if parsed is None:
+        parsed = parse_discount_text(text)
     
     # 항공/마일리지 카드 처리 (항공 카테고리이면서 스카이패스/마일리지 키워드가 있을 때만)
-    is_mileage_card = (category == '항공') and ('스카이패스' in target or '마일리지' in text.lower())
+    is_mileage_card = (category == '항공') and ('스카이패스' in target or parsed['mileage'])
     if is_mileage_card:
         # description에서 마일리지 숫자 추출
-        mile_patterns = [
-            r'(\d+)\s*마일',
-            r'최대\s*(\d+)\s*마일',
-            rf'{re.escape(target)}.*?(\d+)\s*마일',
-        ]
-        for pattern in mile_patterns:
-            mile_match = re.search(pattern, text, re.IGNORECASE)
-            if mile_match:
-                return f"{mile_match.group(1)}마일 적립"
+        if parsed['mile_digits']:
+            return f"{parsed['mile_digits']}마일 적립"
         # 숫자 없으면 기본값
         return "마일리지 적립"
     
     # 적립 vs 할인 판단
-    if '적립' in text and '할인' not in text:
+    if parsed['accrual'] and not parsed['discount']:
         discount_type = '적립'
     else:
         discount_type = '할인'
     
     # 타겟 브랜드와 연관된 할인율 우선 추출
     if target and '스카이패스' not in target:
-        brand_pattern = rf'{re.escape(target)}[^0-9]*(\d+(?:\.\d+)?)\s*%'
-        brand_match = re.search(brand_pattern, text, re.IGNORECASE)
-        if brand_match:
-            val = float(brand_match.group(1))
-            if val == int(val):
-                return f"{int(val)}% {discount_type}"
-            return f"{val}% {discount_type}"
+        val = brand_percent(text, target)
+        if val is not None:
+            return f"{format_percent(val)} {discount_type}"
     
     # discount 객체에서 추출 (마일리지 카드가 아닌 경우만)
     if discount_obj and discount_obj.get('value') and discount_obj.get('value') > 1:
         val = discount_obj['value']
         if discount_obj.get('type') == 'percent':
-            if val == int(val):
-                return f"{int(val)}% {discount_type}"
-            return f"{val}% {discount_type}"
+            return f"{format_percent(val)} {discount_type}"
         elif discount_obj.get('type') == 'won':
-            val = int(val)
-            if val >= 10000:
-                return f"{val//10000}만원 {discount_type}"
-            return f"{val:,}원 {discount_type}"
+            return f"{format_won(val)} {discount_type}"
     
     # description + detail에서 추출
-    percent_match = re.search(r'(\d+(?:\.\d+)?)\s*%', text)
-    if percent_match:
-        val = float(percent_match.group(1))
-        if val == int(val):
-            return f"{int(val)}% {discount_type}"
-        return f"{val}% {discount_type}"
+    if parsed['percent'] is not None:
+        return f"{format_percent(parsed['percent'])} {discount_type}"
     
-    won_match = re.search(r'([\d,]+)\s*원', text)
-    if won_match:
-        val = int(won_match.group(1).replace(',', ''))
-        if val >= 10000:
-            return f"{val//10000}만원 {discount_type}"
-        if val > 1:  # 1원 같은 잘못된 값 제외
-            return f"{val:,}원 {discount_type}"
+    val = parsed['won']
+    if val is not None and val > 1:  # 1원 같은 잘못된 값 제외
+        return f"{format_won(val)} {discount_type}"
     
-    if '무료' in text:
+    if parsed['free']:
         return '무료 제공'
     
-    if '할인' in text or '적립' in text:
+    if parsed['discount'] or parsed['accrual']:
         return '혜택'
     
     return None
@@ -205,7 +144,16 @@ def process_card(card):
     benefits = card.get('benefits', [])
     category_best = {}
     
-    for benefit in benefits:
+    # 선택 세트의 대표 옵션이 아닌 옵션 혜택은 기본/대표 옵션 혜택에 없는 카테고리만 채움
+    # (choices 단계 결과가 없으면 직접 구성)
+    choice_sets = card['choice_sets'] if 'choice_sets' in card else group_choice_sets(benefits)
+    headline = {i for choice_set in choice_sets for i in choice_set['options'][choice_set['headline']]['benefits']}
+    others = option_benefit_indexes(choice_sets) - headline
+    order = [i for i in range(len(benefits)) if i not in others] + sorted(others)
+    primary = set()
+    
+    for index in order:
+        benefit = benefits[index]
         desc = benefit.get('description', '') or ''
         detail = benefit.get('detail', '') or ''
         title = benefit.get('title', '') or ''
@@ -219,7 +167,7 @@ def process_card(card):
         
         # 카테고리 추출
         category = detect_category(desc, detail)
-        if not category:
+        if not category or (index in others and category in primary):
             continue
         
         # 대상 추출
@@ -227,25 +175,31 @@ def process_card(card):
         if not target:
             continue
         
+        # 할인 문구는 한 번만 파싱해서 표시/비교에 함께 사용
+        parsed = parse_discount_text(desc + ' ' + detail)
+        
         # 할인 값 추출
-        discount_str = format_discount(discount_obj, desc, detail, target, category)
+        discount_str = format_discount(discount_obj, desc, detail, target, category, parsed)
         if not discount_str:
             continue
         
         # 할인 값 비교용
-        value = parse_discount_value(desc, detail, discount_obj)
+        value = parse_discount_value(desc, detail, discount_obj, parsed)
         
         # 기존 것과 비교해서 더 좋으면 교체
         if category not in category_best or value > category_best[category]['value']:
             category_best[category] = {
                 'target': target,
                 'discount_str': discount_str,
-                'value': value
+                'value': value,
+                'position': category_best.get(category, {}).get('position', index)
             }
+        if index not in others:
+            primary.add(category)
     
-    # 최종 display_benefits 생성
+    # 최종 display_benefits 생성 (혜택 순서대로)
     display_benefits = []
-    for category, data in category_best.items():
+    for category, data in sorted(category_best.items(), key=lambda item: item[1]['position']):
         summary = f"{data['target']} {data['discount_str']}"
         display_benefits.append({
             'category': category,
@@ -254,27 +208,30 @@ def process_card(card):
     
     return display_benefits
 
-def main():
-    json_path = r"c:\Users\MADUP\Documents\seokmin\website_samsungcard_recommend\data\samsung_cards.json"
+def best_card(card):
+    """카드에 display_benefits 추가 (파이프라인 단계)"""
+    card['display_benefits'] = process_card(card)
+
+def main(argv=None):
+    args = parse_io_args(build_parser("카테고리별 최고 혜택 추출"), argv)
+    out = info_stream(args.output)
     
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_cards(args.input)
     
     for card in data['cards']:
-        card['display_benefits'] = process_card(card)
+        best_card(card)
     
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_data(data, args.output)
     
-    print(f"완료: {len(data['cards'])}개 카드")
+    print(f"완료: {len(data['cards'])}개 카드", file=out)
     
     # 샘플 확인
     samples = ['삼성카드 taptap O', '삼성 iD SELECT ALL 카드', '모니모카드', 'THE 1 (스카이패스)']
     for card in data['cards']:
         if card['name'] in samples:
-            print(f"\n=== {card['name']} ===")
+            print(f"\n=== {card['name']} ===", file=out)
             for b in card.get('display_benefits', []):
-                print(f"  [{b['category']}] {b['summary']}")
+                print(f"  [{b['category']}] {b['summary']}", file=out)
 
 if __name__ == "__main__":
     main()
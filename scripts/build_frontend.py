@@ -0,0 +1,296 @@
+"""
+프론트엔드용 데이터 분할 빌드
+- cards_listing.json: 카드 그리드가 실제로 그리는 필드만 담은 압축(minified) 목록
+  + 카테고리 → 정렬된 카드 목록 역색인 (필터 클릭 시 정렬 없이 바로 조회)
+  + 추천 탭 고정 카드 목록 (data/priority_cards.json featured_cards)
+- cards/{id}.json: 카드별 전체 데이터 (상세 보기 시 지연 로드)
+- search_index.json: 카드 이름/혜택 문구 바이그램 BM25 검색 색인 (search_index.py)
+- 모든 산출물은 내용 해시가 붙은 이름으로 build/ 아래에 기록 (예: build/cards_listing.3f9a1c2b7e.json)
+  + 최대 압축 수준 .gz / .br 사본 (CDN/서버가 요청마다 압축하지 않음, .br은 brotli 패키지 있을 때만)
+  + manifest.json: 논리 이름 → 현재 파일 경로 (페이지는 이 파일만 no-cache로 읽고 나머지는 영구 캐시)
+  이전 빌드의 해시 파일은 삭제
+- image_map.json (images.py) 이 있으면 목록 카드에 로컬 WebP/AVIF 썸네일 srcset(thumb),
+  manifest에 히어로 캔버스용 썸네일(hero_images) 추가 (없으면 원본 image_url 그대로)
+- 빌드 전/후 용량 비교 (원본, gzip) + 산출물별 압축 크기/시간
+
+manifest.json 형식:
+    {"version": 1, "encodings": ["gz", "br"],
+     "files": {"cards_listing.json": "build/cards_listing.<hash>.json", "cards/051.json": "build/cards/051.<hash>.json", ...},
+     "hero_images": ["img/<hash>-180.webp", ...]}     # image_map.json 있을 때만
+
+사용법:
+    python scripts/build_frontend.py                    # data/samsung_cards.json → data/
+    python scripts/build_frontend.py --out-dir dist/data
+
+선택 패키지: brotli (.br 사본)
+"""
+import gzip
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from data_io import DATA_PATH, build_parser, load_data
+from priority import apply_priority, priority_table
+from search_index import SearchIndex
+from text_store import store_path
+
+OUT_DIR = DATA_PATH.parent
+LISTING_NAME = "cards_listing.json"
+DETAIL_DIR_NAME = "cards"
+SEARCH_INDEX_NAME = "search_index.json"
+BUILD_DIR_NAME = "build"
+MANIFEST_NAME = "manifest.json"
+IMAGE_MAP_NAME = "image_map.json"
+THUMB_FORMATS = ["avif", "webp"]   # <picture> source 순서 (앞쪽 우선)
+HASH_LENGTH = 10
+
+# card-manager.js createCardElement / filterByCategory 가 사용하는 필드
+LISTING_FIELDS = ["id", "name", "image_url", "detail_url", "primary_color", "secondary_color",
+                  "tagline", "display_benefits", "priority_rank", "sort_key"]
+
+
+def dumps_compact(data) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def detail_keys(cards: list[dict]) -> list[str]:
+    """카드별 상세 파일 이름 (원본 데이터에 중복 id가 있어 두 번째부터는 -n 접미사)"""
+    seen = {}
+    keys = []
+    for card in cards:
+        count = seen.get(card["id"], 0)
+        seen[card["id"]] = count + 1
+        keys.append(card["id"] if count == 0 else f"{card['id']}-{count}")
+    return keys
+
+
+def load_image_map(out_dir: Path) -> dict | None:
+    """images.py 가 기록한 원본 URL → 썸네일 경로 (없으면 None)"""
+    path = out_dir / IMAGE_MAP_NAME
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def thumb_srcsets(entry: dict) -> dict[str, str]:
+    """{"avif": "img/a-105.avif 105w, img/a-210.avif 210w", "webp": ...} (생성된 형식만)"""
+    return {fmt: ", ".join(f"{path} {width}w" for width, path in sorted(entry[fmt].items(), key=lambda w: int(w[0])))
+            for fmt in THUMB_FORMATS if entry.get(fmt)}
+
+
+def hero_images(image_map: dict) -> list[str | None]:
+    """히어로 캔버스 이미지 순서대로 2x WebP 썸네일 (캔버스는 <picture>를 못 쓰므로 한 형식만)
+    원본이 2x보다 작으면 썸네일 폭도 원본 폭이므로 가장 큰 것으로 대체
+    """
+    width = str(max(image_map.get("widths", {}).get("hero", [0])))
+    paths = []
+    for url in image_map.get("hero", []):
+        webp = image_map["images"].get(url, {}).get("webp") or {}
+        paths.append(webp.get(width) or webp[max(webp, key=int)] if webp else None)
+    return paths
+
+
+def listing_card(card: dict, detail_key: str, image_map: dict | None = None) -> dict:
+    """그리드 렌더링에 필요한 필드만 추출"""
+    item = {field: card.get(field) for field in LISTING_FIELDS}
+    item["detail_key"] = detail_key
+    fee = (card.get("annual_fee") or {}).get("domestic")
+    item["annual_fee"] = {"domestic": fee} if fee else None
+    entry = image_map["images"].get(card.get("image_url")) if image_map else None
+    srcsets = thumb_srcsets(entry) if entry else None
+    if srcsets:
+        item["thumb"] = srcsets
+    return item
+
+
+def build_category_index(items: list[dict]) -> dict[str, list]:
+    """카테고리 → 정렬된 [detail_key, 해당 카테고리 혜택 수, 우선순위(없으면 null)] 목록
+    정렬: sort_key 순 (우선순위 카드 rank 순 → 나머지 연회비 낮은 순), 같으면 혜택 수 내림차순, 원래 순서
+    """
+    matches = {}
+    for item in items:
+        counts = {}
+        for b in item["display_benefits"]:
+            counts[b.get("category")] = counts.get(b.get("category"), 0) + 1
+        for category, count in counts.items():
+            if category:
+                matches.setdefault(category, []).append((item, count))
+
+    index = {}
+    for category, entries in matches.items():
+        entries.sort(key=lambda e: (e[0]["sort_key"], -e[1]))
+        index[category] = [[item["detail_key"], count, item["priority_rank"]]
+                           for item, count in entries]
+    return index
+
+
+def featured_keys(items: list[dict]) -> list[str]:
+    """추천 탭 카드 detail_key 목록 (featured_cards 순서)"""
+    table = priority_table()
+    ranked = [(table.featured_rank(item["name"]), item["detail_key"]) for item in items]
+    return [key for rank, key in sorted(r for r in ranked if r[0] is not None)]
+
+
+def build_listing(data: dict, image_map: dict | None = None) -> dict:
+    for card in data["cards"]:
+        if "sort_key" not in card:
+            # pipeline priority 단계를 거치지 않은 입력
+            apply_priority(card)
+    items = [listing_card(card, key, image_map) for card, key in zip(data["cards"], detail_keys(data["cards"]))]
+    return {
+        "crawled_at": data.get("crawled_at"),
+        "total_cards": len(items),
+        "categories": data.get("categories", []),
+        "cards": items,
+        "category_index": build_category_index(items),
+        "featured": featured_keys(items),
+    }
+
+
+def build_artifacts(data: dict, image_map: dict | None = None) -> dict[str, bytes]:
+    """{논리 이름: 내용} - 목록, 검색 색인, 카드별 상세"""
+    artifacts = {LISTING_NAME: dumps_compact(build_listing(data, image_map)),
+                 SEARCH_INDEX_NAME: dumps_compact(SearchIndex.build(data["cards"], detail_keys(data["cards"])).to_dict())}
+    for card, key in zip(data["cards"], detail_keys(data["cards"])):
+        artifacts[f"{DETAIL_DIR_NAME}/{key}.json"] = dumps_compact(card)
+    return artifacts
+
+
+def fingerprinted_name(name: str, content: bytes) -> str:
+    """cards/051.json → build/cards/051.<내용 해시>.json"""
+    stem, dot, suffix = name.rpartition(".")
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    return f"{BUILD_DIR_NAME}/{stem}.{digest}{dot}{suffix}"
+
+
+def gzip_bytes(content: bytes) -> bytes:
+    # mtime=0: 같은 내용이면 같은 .gz (재빌드 시 불필요한 변경 없음)
+    return gzip.compress(content, compresslevel=9, mtime=0)
+
+
+def compressed_variants(content: bytes) -> dict[str, tuple[bytes, float]]:
+    """{확장자: (압축 내용, 소요 시간)} - 최대 압축 수준"""
+    variants = {}
+    start = time.perf_counter()
+    variants["gz"] = (gzip_bytes(content), time.perf_counter() - start)
+    if brotli is not None:
+        start = time.perf_counter()
+        variants["br"] = (brotli.compress(content, quality=11), time.perf_counter() - start)
+    return variants
+
+
+def write_artifacts(data: dict, out_dir: Path) -> tuple[dict[str, bytes], dict[str, dict]]:
+    """해시 이름 산출물 + 압축 사본 + manifest.json 기록
+    반환: ({논리 이름: 내용}, {논리 이름: {"path": 해시 경로, 확장자: (크기, 소요 시간), ...}})
+    """
+    image_map = load_image_map(out_dir)
+    artifacts = build_artifacts(data, image_map)
+    files, stats = {}, {}
+    written = set()
+    for name, content in artifacts.items():
+        path = fingerprinted_name(name, content)
+        files[name] = path
+        stats[name] = {"path": path}
+        target = out_dir / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        outputs = {target: content}
+        for ext, (compressed, elapsed) in compressed_variants(content).items():
+            outputs[target.with_name(f"{target.name}.{ext}")] = compressed
+            stats[name][ext] = (len(compressed), elapsed)
+        for file, file_content in outputs.items():
+            written.add(file)
+            if not file.exists():          # 해시가 같으면 내용도 같음 → 다시 쓰지 않음 (mtime 유지)
+                file.write_bytes(file_content)
+
+    # 이전 빌드의 해시 파일 정리
+    for stale in (out_dir / BUILD_DIR_NAME).rglob("*"):
+        if stale.is_file() and stale not in written:
+            stale.unlink()
+
+    manifest = {"version": 1, "encodings": ["gz"] + (["br"] if brotli is not None else []), "files": files}
+    if image_map:
+        manifest["hero_images"] = hero_images(image_map)
+    (out_dir / MANIFEST_NAME).write_bytes(dumps_compact(manifest))
+    return artifacts, stats
+
+
+def gzip_size(content: bytes) -> int:
+    return len(gzip_bytes(content))
+
+
+def print_size_report(source: bytes, artifacts: dict[str, bytes], out):
+    listing = artifacts[LISTING_NAME]
+    details = [content for path, content in artifacts.items() if path.startswith(f"{DETAIL_DIR_NAME}/")]
+    search = artifacts[SEARCH_INDEX_NAME]
+    rows = [
+        ("원본 samsung_cards.json (+ 문구 저장소)", len(source), gzip_size(source)),
+        (f"{LISTING_NAME} (첫 화면)", len(listing), gzip_size(listing)),
+        (f"{DETAIL_DIR_NAME}/*.json 평균 ({len(details)}개)",
+         sum(map(len, details)) // max(1, len(details)),
+         sum(map(gzip_size, details)) // max(1, len(details))),
+        (f"{SEARCH_INDEX_NAME} (검색 시 지연 로드)", len(search), gzip_size(search)),
+    ]
+    print("용량 비교 (bytes, gzip -9):", file=out)
+    for label, raw, gz in rows:
+        print(f"  - {label}: {raw:,} / gzip {gz:,}", file=out)
+    print(f"  - 첫 화면 다운로드: {gzip_size(listing) / gzip_size(source):.1%} (gzip 기준)", file=out)
+
+
+def print_compression_report(artifacts: dict[str, bytes], stats: dict[str, dict], out):
+    """산출물별 원본 / .gz / .br 크기와 압축 시간 (카드별 상세는 합계)"""
+    groups = {}
+    for name, content in artifacts.items():
+        label = f"{DETAIL_DIR_NAME}/*.json" if name.startswith(f"{DETAIL_DIR_NAME}/") else stats[name]["path"]
+        group = groups.setdefault(label, {"count": 0, "raw": 0})
+        group["count"] += 1
+        group["raw"] += len(content)
+        for ext in ("gz", "br"):
+            if ext in stats[name]:
+                size, elapsed = stats[name][ext]
+                total_size, total_time = group.get(ext, (0, 0.0))
+                group[ext] = (total_size + size, total_time + elapsed)
+
+    print("압축 사본 (bytes, 압축 시간):", file=out)
+    if brotli is None:
+        print("  [WARN] brotli 패키지 없음 → .br 생략 (pip install brotli)", file=out)
+    for label, group in groups.items():
+        count = f" {group['count']}개 합계" if group["count"] > 1 else ""
+        parts = [f"원본 {group['raw']:,}"]
+        for ext in ("gz", "br"):
+            if ext in group:
+                size, elapsed = group[ext]
+                parts.append(f".{ext} {size:,} ({size / max(1, group['raw']):.1%}, {elapsed * 1000:.1f}ms)")
+        print(f"  - {label}{count}: {' / '.join(parts)}", file=out)
+
+
+def main(argv=None):
+    parser = build_parser("프론트엔드용 데이터 분할 빌드", with_output=False)
+    parser.add_argument("--out-dir", type=Path, default=OUT_DIR, help="출력 디렉토리 (기본: data/)")
+    args = parser.parse_args(argv)
+    out = sys.stdout
+
+    data = load_data(args.input)
+    artifacts, stats = write_artifacts(data, args.out_dir)
+
+    print(f"완료: {args.out_dir / MANIFEST_NAME} → {stats[LISTING_NAME]['path']} "
+          f"+ {DETAIL_DIR_NAME}/ {len(data['cards'])}개 + {stats[SEARCH_INDEX_NAME]['path']}", file=out)
+    if args.input == "-":
+        source = dumps_compact(data)
+    else:
+        # 상세 문구 저장소(*.texts.json)까지 합친 원본 기준
+        texts_path = store_path(args.input)
+        source = Path(args.input).read_bytes() + (texts_path.read_bytes() if texts_path.exists() else b"")
+    print_size_report(source, artifacts, out)
+    print_compression_report(artifacts, stats, out)
+
+
+if __name__ == "__main__":
+    main()
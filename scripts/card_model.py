@@ -0,0 +1,305 @@
+"""
+파이프라인용 카드/혜택 메모리 모델
+- Card / Benefit: __slots__ 기반 레코드 (dict 대비 인스턴스당 해시 테이블 없음)
+  필드는 속성(card.name, benefit.category)으로 읽을 수 있고, dict 방식(card.get('benefits', []),
+  benefit['monthly_caps'] = ...)도 그대로 지원 → 기존 단계 함수와 recommender 등 dict 사용 코드 수정 불필요
+- 필드 순서는 키 튜플(_keys)로 기록 → 저장 시 원래 JSON과 같은 순서 (같은 구조의 레코드는 튜플 하나를 공유)
+- 카테고리/제목/색상/태그라인/detail_id 등 반복되는 문자열은 sys.intern으로 한 벌만 유지
+- 혜택 상세 문구(detail)는 문구 저장소(text_store.py)의 detail_id만 들고 있다가 읽을 때마다 조각을 이어 반환
+  (카테고리만 쓰는 단계는 문구를 전혀 만들지 않음, 새 문구를 대입하면 그 문구를 그대로 보관)
+- data_io.load_cards 가 json 파싱 중에 바로 모델로 변환 (object_pairs_hook)
+  → 전체 dict 트리를 먼저 만들었다가 버리지 않으므로 해제된 dict가 메모리 조각으로 남지 않음
+- save_data 로 그대로 저장
+
+사용법:
+    python scripts/card_model.py                    # dict vs 모델 RSS 비교 (실제 107개 + 가상 50,000개)
+    python scripts/card_model.py --sizes 107,10000 --stages metadata,priority
+"""
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import MutableMapping
+from pathlib import Path
+
+from text_store import TextStore, store_path
+
+INTERNED_FIELDS = frozenset(["category", "title", "primary_color", "secondary_color", "tagline"])
+BENCH_SIZES = [107, 50000]
+BENCH_STAGES = "metadata,priority"   # 카테고리/이름만 쓰는 단계
+
+_key_tuples = {}   # 키 튜플 공유 (같은 구조의 레코드는 같은 튜플 객체)
+
+
+def _shared_keys(keys) -> tuple:
+    keys = tuple(keys)
+    return _key_tuples.setdefault(keys, keys)
+
+
+def _intern(key: str, value):
+    return sys.intern(value) if type(value) is str and key in INTERNED_FIELDS else value
+
+
+class Record(MutableMapping):
+    """고정 필드는 슬롯, 그 밖의 필드는 _extra dict에 두는 dict 호환 레코드
+    키 존재 여부/순서는 _keys가 기준 (슬롯 기본값 None은 "없음"과 구분)
+    """
+    __slots__ = ("_keys", "_extra")
+    FIELDS: tuple = ()
+    _FIELD_SET: frozenset = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+
+    def __init__(self):
+        self._keys = ()
+        self._extra = None
+        for field in self.FIELDS:
+            object.__setattr__(self, field, None)
+
+    def __getitem__(self, key):
+        if key not in self._keys:
+            raise KeyError(key)
+        return getattr(self, key) if key in self._FIELD_SET else self._extra[key]
+
+    def get(self, key, default=None):
+        if key not in self._keys:
+            return default
+        return getattr(self, key) if key in self._FIELD_SET else self._extra[key]
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __setitem__(self, key, value):
+        if key in self._FIELD_SET:
+            setattr(self, key, _intern(key, value))
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+        if key not in self._keys:
+            self._keys = _shared_keys(self._keys + (key,))
+
+    def __delitem__(self, key):
+        if key not in self._keys:
+            raise KeyError(key)
+        if key in self._FIELD_SET:
+            setattr(self, key, None)
+        else:
+            del self._extra[key]
+        self._keys = _shared_keys(k for k in self._keys if k != key)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __reduce__(self):
+        # 프로세스 풀 전달/깊은 복사: 문구까지 채운 dict로 (저장소 객체는 함께 보내지 않음)
+        return type(self).from_dict, (self.to_dict(),)
+
+    def to_dict(self) -> dict:
+        return {key: self[key] for key in self._keys}
+
+    def _fill(self, data: dict):
+        extra = None
+        for key, value in data.items():
+            if key in self._FIELD_SET:
+                object.__setattr__(self, key, _intern(key, value))
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        self._extra = extra
+        self._keys = _shared_keys(data)
+
+
+class Benefit(Record):
+    """혜택 하나 (detail은 저장소 ID로 지연 복원)"""
+    __slots__ = ("category", "title", "description", "discount", "is_select_option", "monthly_caps",
+                 "_detail", "_detail_id", "_store")
+    FIELDS = ("category", "title", "description", "detail", "discount", "is_select_option", "monthly_caps")
+
+    category: str | None
+    title: str | None
+    description: str | None
+    discount: dict | None
+    is_select_option: bool | None
+    monthly_caps: dict | None
+
+    def __init__(self):
+        self._detail = None
+        self._detail_id = None
+        self._store = None
+        super().__init__()
+
+    @property
+    def detail(self) -> str | None:
+        if self._detail_id is not None:
+            return self._store.get(self._detail_id)
+        return self._detail
+
+    @detail.setter
+    def detail(self, value: str | None):
+        self._detail = value
+        self._detail_id = None
+
+    @classmethod
+    def from_dict(cls, data: dict, store: TextStore | None = None) -> "Benefit":
+        """data: 문구 인라인(detail) 또는 저장소 참조(detail_id + store)"""
+        benefit = cls()
+        if "detail_id" in data and store is not None:
+            benefit._fill({("detail" if key == "detail_id" else key): value for key, value in data.items()})
+            # _fill이 detail 자리에 넣은 ID를 저장소 참조로 전환 (같은 문구를 쓰는 혜택끼리 ID 문자열 공유)
+            benefit._detail_id, benefit._detail = sys.intern(benefit._detail), None
+            benefit._store = store
+        else:
+            benefit._fill(data)
+        return benefit
+
+
+class Card(Record):
+    """카드 하나 (benefits는 Benefit 목록, 단계 산출 필드는 원래 dict/list 그대로)"""
+    __slots__ = ("id", "name", "detail_url", "image_url", "annual_fee", "min_spending", "benefits",
+                 "primary_color", "secondary_color", "tagline", "cleaned_benefits", "summarized_benefits",
+                 "display_benefits", "priority_rank", "sort_key", "choice_sets")
+    FIELDS = __slots__
+
+    id: str | None
+    name: str | None
+    benefits: list[Benefit] | None
+
+    @classmethod
+    def from_dict(cls, data: dict, store: TextStore | None = None) -> "Card":
+        card = cls()
+        card._fill(data)
+        if card.benefits is not None:
+            card.benefits = [benefit if isinstance(benefit, Benefit) else Benefit.from_dict(benefit, store)
+                             for benefit in card.benefits]
+        return card
+
+    def to_dict(self) -> dict:
+        data = super().to_dict()
+        if "benefits" in data:
+            data["benefits"] = [benefit.to_dict() if isinstance(benefit, Record) else benefit
+                                for benefit in data["benefits"]]
+        return data
+
+
+def object_pairs_hook(store: TextStore | None = None):
+    """json.load(object_pairs_hook=...)용: 혜택/카드 객체를 파싱 즉시 모델로 변환
+    (JSON 객체는 안쪽부터 완성되므로 카드보다 혜택이 먼저 변환됨)
+    """
+    def hook(pairs):
+        data = dict(pairs)
+        if "description" in data and ("detail_id" in data or "detail" in data):
+            return Benefit.from_dict(data, store)
+        if "benefits" in data and "id" in data:
+            return Card.from_dict(data, store)
+        return data
+    return hook
+
+
+def to_plain(data: dict) -> dict:
+    """json.dump 가능한 dict (Card → dict)"""
+    return {**data, "cards": [card.to_dict() if isinstance(card, Record) else card
+                              for card in data.get("cards", [])]}
+
+
+def current_rss() -> int:
+    """현재 프로세스 RSS (bytes, Linux /proc 기준, 없으면 최대 RSS)"""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def measure(path: str, mode: str, stages: list[str]) -> dict:
+    """하위 프로세스: 로드 후 / 단계 실행 후 RSS 증가량"""
+    import gc
+
+    from data_io import load_cards, load_data
+    from pipeline import run_stages
+
+    gc.collect()
+    base = current_rss()
+    start = time.perf_counter()
+    data = load_cards(path) if mode == "model" else load_data(path)
+    load_time = time.perf_counter() - start
+    gc.collect()
+    loaded = current_rss()
+    start = time.perf_counter()
+    run_stages(data["cards"], stages)
+    stage_time = time.perf_counter() - start
+    gc.collect()
+    return {"load": loaded - base, "stages": current_rss() - base,
+            "load_time": load_time, "stage_time": stage_time, "cards": len(data["cards"])}
+
+
+def write_synthetic(source: Path, size: int, target: Path):
+    """저장 형식 그대로(detail_id 참조) 카드를 반복 복제한 size개 카탈로그 + 같은 문구 저장소"""
+    with open(source, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    cards = data["cards"]
+    data["cards"] = [{**cards[i % len(cards)], "id": f"{cards[i % len(cards)]['id']}-{i}"} for i in range(size)]
+    data["total_cards"] = size
+    with open(target, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    shutil.copyfile(store_path(source), store_path(target))
+
+
+def benchmark_memory(source: Path, sizes: list[int], stages: str, out):
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = Path(tmp) / f"cards_{size}.json"
+            write_synthetic(source, size, path)
+            results = {}
+            for mode in ("dict", "model"):
+                output = subprocess.run([sys.executable, __file__, "--measure", mode, "--input", str(path),
+                                         "--stages", stages], check=True, capture_output=True, text=True).stdout
+                results[mode] = json.loads(output.splitlines()[-1])
+            print(f"[카드 {size:,}개, 파일 {path.stat().st_size:,} bytes, 단계 {stages}]", file=out)
+            for label, key in (("로드 후", "load"), ("단계 실행 후", "stages")):
+                before, after = results["dict"][key], results["model"][key]
+                print(f"  - {label} RSS 증가: dict {before / 1e6:,.1f}MB → 모델 {after / 1e6:,.1f}MB "
+                      f"({1 - after / max(1, before):.1%} 절감)", file=out)
+            print(f"  - 로드 시간: dict {results['dict']['load_time'] * 1000:,.0f}ms / "
+                  f"모델 {results['model']['load_time'] * 1000:,.0f}ms, 단계: dict "
+                  f"{results['dict']['stage_time'] * 1000:,.0f}ms / 모델 {results['model']['stage_time'] * 1000:,.0f}ms",
+                  file=out)
+
+
+def main(argv=None):
+    from data_io import DATA_PATH
+
+    parser = argparse.ArgumentParser(description="dict vs 카드 모델 메모리 비교")
+    parser.add_argument("--input", default=str(DATA_PATH), help="카드 데이터 JSON 경로 (문구 저장소 필요)")
+    parser.add_argument("--sizes", default=",".join(map(str, BENCH_SIZES)), help="비교할 카드 수 (쉼표 구분)")
+    parser.add_argument("--stages", default=BENCH_STAGES, help="로드 후 실행할 단계")
+    parser.add_argument("--measure", choices=["dict", "model"], help=argparse.SUPPRESS)  # 하위 프로세스용
+    args = parser.parse_args(argv)
+    stages = [name for name in args.stages.split(",") if name]
+
+    if args.measure:
+        print(json.dumps(measure(args.input, args.measure, stages)))
+        return
+    if not store_path(args.input).exists():
+        sys.exit(f"문구 저장소가 없습니다: {store_path(args.input)}")
+    benchmark_memory(Path(args.input), [int(size) for size in args.sizes.split(",")], args.stages, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+혜택 카테고리 분류기 (공용)
+- 카테고리별 키워드 목록을 하나의 정규식으로 미리 컴파일
+- 텍스트를 한 번만 훑어서 우선순위가 가장 높은 카테고리 반환 (기존 any() 루프와 결과 동일)
+- 크롤러(parse_card_data), reclassify_benefits, best_benefits 가 함께 사용
+
+사용법:
+    python scripts/categorizer.py --bench   # 기존 방식과 처리량 비교 + 결과 일치 검증
+"""
+import argparse
+import re
+import time
+from pathlib import Path
+
+DATA_PATH = Path(__file__).parent.parent / "data" / "samsung_cards.json"
+
+# 크롤러 parse_card_data 용 (대소문자 구분)
+PARSE_RULES = [
+    ("커피", ["스타벅스", "커피", "카페", "투썸", "이디야", "메가커피"]),
+    ("교통", ["교통", "버스", "지하철", "택시", "대중교통"]),
+    ("주유", ["주유", "SK", "GS", "S-OIL", "현대오일뱅크", "정유"]),
+    ("쇼핑", ["쇼핑", "백화점", "마트", "이마트", "홈플러스", "쿠팡", "SSG", "온라인몰"]),
+    ("편의점", ["편의점", "CU", "GS25", "세븐일레븐", "이마트24"]),
+    ("통신", ["통신", "SKT", "KT", "LG U+", "휴대폰", "이동통신"]),
+    ("영화", ["영화", "CGV", "메가박스", "롯데시네마"]),
+    ("음식", ["배달", "요기요", "배민", "음식", "식당", "음식점"]),
+    ("항공", ["항공", "마일리지", "대한항공", "아시아나", "스카이패스"]),
+    ("스트리밍", ["넷플릭스", "유튜브", "웨이브", "왓챠", "디즈니", "OTT"]),
+]
+
+# reclassify_benefits 용 (대소문자 무시)
+RECLASSIFY_RULES = [
+    ("커피", ['스타벅스', '투썸', '이디야', '메가커피', '커피', '카페']),
+    ("스트리밍", ['넷플릭스', '유튜브', '디즈니', '티빙', '웨이브', 'ott', '디지털콘텐츠']),
+    ("영화", ['cgv', '롯데시네마', '메가박스', '영화']),
+    ("쇼핑", ['쿠팡', '네이버', 'ssg', 'g마켓', '옥션', '11번가', '온라인쇼핑', '쇼핑몰', '마트', '이마트', '롯데마트', '편의점']),
+    ("배달", ['배달의민족', '배민', '쿠팡이츠', '요기요', '배달앱']),
+    ("주유", ['주유', 'sk에너지', 'gs칼텍스', 's-oil', '오일뱅크']),
+    ("통신", ['통신', 'skt', 'kt', 'lg u+', '이동통신', '인터넷', '휴대폰']),
+    ("교통", ['대중교통', '버스', '지하철', '택시', 'ktx', '고속버스', '철도']),
+    ("항공", ['마일리지', '스카이패스', '항공', '라운지', '아시아나', '대한항공']),
+    ("해외", ['해외']),
+    ("교육", ['학원', '교육', '인터넷강의', '학습']),
+    ("의료", ['병원', '의료', '약국', '동물병원']),
+    ("생활", ['관리비', '아파트']),
+]
+
+# best_benefits 용 (대소문자 무시, 배달/통신을 쇼핑보다 먼저)
+DISPLAY_RULES = [
+    ("커피", ['스타벅스', '투썸', '이디야', '메가커피', '커피', '카페']),
+    ("스트리밍", ['넷플릭스', '유튜브', '디즈니', '티빙', '웨이브', 'ott', '디지털콘텐츠']),
+    ("영화", ['cgv', '롯데시네마', '메가박스', '영화']),
+    ("배달", ['배달의민족', '배민', '쿠팡이츠', '요기요', '배달앱']),
+    ("통신", ['통신', 'skt', 'kt', 'lg u+', '이동통신', '휴대폰', '인터넷요금']),
+    ("쇼핑", ['쿠팡', '네이버', 'ssg', 'g마켓', '옥션', '11번가', '온라인쇼핑', '쇼핑몰', '마트', '이마트', '롯데마트', '편의점']),
+    ("주유", ['주유', 'sk에너지', 'gs칼텍스', 's-oil', '오일뱅크']),
+    ("교통", ['대중교통', '버스', '지하철', '택시', 'ktx', '고속버스', '철도']),
+    ("항공", ['마일리지', '스카이패스', '항공', '라운지', '아시아나', '대한항공', '마일']),
+    ("해외", ['해외']),
+]
+
+
+class KeywordCategorizer:
+    """우선순위가 있는 키워드 → 카테고리 분류기
+
+    모든 키워드를 (우선순위, 긴 것 먼저) 순서의 정규식 하나로 합쳐 앞에서부터 한 번 훑는다.
+    같은 위치에서는 우선순위가 가장 높은 키워드가 매칭되지만, 매칭된 구간 안에서
+    시작하는 다른 키워드는 건너뛰게 되므로 키워드마다 "가려질 수 있는 최고 우선순위"를
+    미리 계산해 두고, 그 값이 현재 결과보다 앞설 때만 다음 글자부터 다시 탐색한다.
+    최고 우선순위 카테고리를 찾으면 바로 종료한다.
+    """
+
+    def __init__(self, rules: list[tuple[str, list[str]]], ignore_case: bool = False):
+        self.rules = rules
+        self.ignore_case = ignore_case
+        self.categories = [category for category, _ in rules]
+
+        self.priority = {}
+        for i, (_, keywords) in enumerate(rules):
+            for kw in keywords:
+                kw = kw.lower() if ignore_case else kw
+                self.priority.setdefault(kw, i)
+        ordered = sorted(self.priority, key=lambda kw: (self.priority[kw], -len(kw)))
+        self.shadow = {kw: self._shadow_priority(kw) for kw in ordered}
+        self.pattern = re.compile("|".join(re.escape(kw) for kw in ordered))
+
+    def _shadow_priority(self, keyword: str) -> int:
+        """keyword 매칭 구간 안(1번째 글자 이후)에서 시작할 수 있는 다른 키워드의 최고 우선순위"""
+        best = len(self.rules)
+        for other, index in self.priority.items():
+            for offset in range(1, len(keyword)):
+                tail = keyword[offset:]
+                if other.startswith(tail) or tail.startswith(other):
+                    best = min(best, index)
+                    break
+        return best
+
+    def categorize(self, text: str) -> str | None:
+        """텍스트에서 우선순위가 가장 높은 카테고리 (없으면 None)"""
+        if self.ignore_case:
+            text = text.lower()
+        best = len(self.rules)
+        search = self.pattern.search
+        pos = 0
+        while best > 0:
+            match = search(text, pos)
+            if not match:
+                break
+            kw = match.group()
+            index = self.priority[kw]
+            if index < best:
+                best = index
+            # 구간 안에 더 높은 우선순위 키워드가 숨을 수 있을 때만 바로 다음 글자부터 재탐색
+            pos = match.start() + 1 if self.shadow[kw] < best else match.end()
+        return self.categories[best] if best < len(self.rules) else None
+
+    def categorize_naive(self, text: str) -> str | None:
+        """기존 방식 (카테고리마다 any(kw in text)) - 검증/벤치마크용"""
+        if self.ignore_case:
+            text = text.lower()
+        for category, keywords in self.rules:
+            if any(kw in text for kw in keywords):
+                return category
+        return None
+
+
+PARSE_CATEGORIZER = KeywordCategorizer(PARSE_RULES)
+RECLASSIFY_CATEGORIZER = KeywordCategorizer(RECLASSIFY_RULES, ignore_case=True)
+DISPLAY_CATEGORIZER = KeywordCategorizer(DISPLAY_RULES, ignore_case=True)
+
+
+def benchmark(json_path: Path, repeat: int = 20):
+    """데이터셋의 모든 혜택에 대해 기존/신규 분류 처리량 비교"""
+    from data_io import load_data   # 상세 문구(detail_id)를 저장소에서 복원해 detail 포함
+
+    data = load_data(str(json_path))
+
+    texts = []
+    for card in data["cards"]:
+        for b in card.get("benefits", []):
+            desc = b.get("description", "") or ""
+            detail = b.get("detail", "") or ""
+            texts.append(f"{b.get('title', '')} {desc} {detail}")
+    print(f"혜택 {len(texts)}개 x {repeat}회")
+
+    for name, categorizer in [("parse", PARSE_CATEGORIZER),
+                              ("reclassify", RECLASSIFY_CATEGORIZER),
+                              ("display", DISPLAY_CATEGORIZER)]:
+        old = [categorizer.categorize_naive(t) for t in texts]
+        new = [categorizer.categorize(t) for t in texts]
+        assert old == new, f"{name}: 분류 결과 불일치"
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for t in texts:
+                categorizer.categorize_naive(t)
+        old_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for t in texts:
+                categorizer.categorize(t)
+        new_elapsed = time.perf_counter() - start
+
+        total = len(texts) * repeat
+        print(f"  [{name}] 기존 {total / old_elapsed:,.0f}건/초, "
+              f"신규 {total / new_elapsed:,.0f}건/초 ({old_elapsed / new_elapsed:.1f}배), 결과 일치")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="혜택 카테고리 분류기")
+    parser.add_argument("--bench", action="store_true", help="기존 방식과 처리량 비교")
+    parser.add_argument("--input", type=Path, default=DATA_PATH, help="카드 데이터 JSON 경로")
+    args = parser.parse_args()
+    if args.bench:
+        benchmark(args.input)
+    else:
+        parser.print_help()
@@ -0,0 +1,123 @@
+"""
+선택형(택 1) 혜택 → 선택 세트(choice_sets) 구성
+- "[SELECT 1] ...", "[SELECT] ..." : 같은 태그끼리 한 세트, 혜택 하나가 옵션 하나
+- "[일상팩] ...", "여가패키지: ..." : 카드당 패키지 세트 하나, 같은 패키지 이름의 혜택들이 옵션 하나
+- 세트 안내 문구("선택 옵션에 따른 할인 혜택 제공 (택 1)")는 옵션에서 제외
+- 옵션별 대표 값으로 표시용 대표 옵션(headline) 미리 선택 (할인율끼리 비교, 할인율 옵션이 없을 때만 금액끼리)
+- 크롤러(parse_card_data)와 파이프라인 choices 단계가 함께 사용
+
+card["choice_sets"] 형식:
+    [{"name": "SELECT 1", "options": [{"name": "국내 가맹점 0.7% 할인", "benefits": [1]}, ...], "headline": 1}, ...]
+    benefits = card["benefits"] 인덱스
+
+사용법:
+    python scripts/choice_sets.py                   # samsung_cards.json에 choice_sets 기록
+    python scripts/choice_sets.py --output -        # stdout으로 출력
+"""
+import re
+
+from data_io import build_parser, info_stream, load_cards, parse_io_args, save_data
+from discount_parser import parse_discount_text
+
+SELECT_TAG_RE = re.compile(r'^\s*\[(SELECT\s*\d*)\]\s*')
+PACKAGE_TAG_RE = re.compile(r'^\s*(?:\[([^\]]*팩)\]|(\S*패키지)\s*:)\s*')
+PACKAGE_SET = "패키지"
+
+
+def is_set_header(benefit: dict) -> bool:
+    """세트 안내 문구 (옵션 아님)"""
+    desc = benefit.get('description', '') or ''
+    return '선택 옵션에 따른' in desc or benefit.get('title') == '선택형'
+
+
+def option_value(benefit: dict) -> tuple[str | None, float]:
+    """옵션 비교용 (단위, 대표 값): 할인 객체 → % → 원 순서 (best_benefits.parse_discount_value 와 같은 우선순위)"""
+    discount = benefit.get('discount') or {}
+    if discount.get('value') and discount.get('type') in ('percent', 'won'):
+        return discount['type'], float(discount['value'])
+    parsed = parse_discount_text(benefit.get('description', '') or '')
+    if parsed['percent'] is not None:
+        return 'percent', parsed['percent']
+    if parsed['won']:
+        return 'won', float(parsed['won'])
+    return None, 0.0
+
+
+def headline_index(options: list[list[tuple[str | None, float]]]) -> int:
+    """옵션별 (단위, 값) 목록 → 대표 옵션 위치
+    할인율과 금액은 같은 척도가 아니므로 할인율이 있는 옵션끼리 먼저 비교하고,
+    할인율 옵션이 하나도 없을 때만 금액으로 비교
+    """
+    for unit in ('percent', 'won'):
+        best = [max((value for option_unit, value in values if option_unit == unit), default=0.0)
+                for values in options]
+        if any(best):
+            return best.index(max(best))
+    return 0
+
+
+def group_choice_sets(benefits: list[dict]) -> list[dict]:
+    """혜택 목록 → 선택 세트 목록 (등장 순서 유지)"""
+    sets = {}
+    for i, benefit in enumerate(benefits):
+        desc = benefit.get('description', '') or ''
+        match = SELECT_TAG_RE.match(desc)
+        if match:
+            if is_set_header(benefit):
+                continue
+            set_name = ' '.join(match.group(1).split())
+            option_name = desc[match.end():].split('\n')[0].strip()
+        else:
+            match = PACKAGE_TAG_RE.match(desc)
+            if not match:
+                continue
+            set_name = PACKAGE_SET
+            option_name = match.group(1) or match.group(2)
+
+        options = sets.setdefault(set_name, {})
+        options.setdefault(option_name, []).append(i)
+
+    choice_sets = []
+    for set_name, options in sets.items():
+        if len(options) < 2:
+            continue
+        option_list = [{"name": name, "benefits": indexes} for name, indexes in options.items()]
+        values = [[option_value(benefits[i]) for i in option["benefits"]] for option in option_list]
+        choice_sets.append({
+            "name": set_name,
+            "options": option_list,
+            "headline": headline_index(values),
+        })
+    return choice_sets
+
+
+def option_benefit_indexes(choice_sets: list[dict]) -> set[int]:
+    """선택 세트 옵션에 속한 혜택 인덱스 전체"""
+    return {i for choice_set in choice_sets for option in choice_set["options"] for i in option["benefits"]}
+
+
+def choices_card(card):
+    """카드에 choice_sets 추가 (파이프라인 단계)"""
+    card['choice_sets'] = group_choice_sets(card.get('benefits', []))
+
+
+def main(argv=None):
+    args = parse_io_args(build_parser("선택형 혜택 선택 세트 구성"), argv)
+    out = info_stream(args.output)
+
+    data = load_cards(args.input)
+    for card in data['cards']:
+        choices_card(card)
+    save_data(data, args.output)
+
+    with_sets = [card for card in data['cards'] if card['choice_sets']]
+    print(f"완료: {len(data['cards'])}개 카드 중 선택 세트 보유 {len(with_sets)}개", file=out)
+    for card in with_sets:
+        for choice_set in card['choice_sets']:
+            names = [option['name'] for option in choice_set['options']]
+            names[choice_set['headline']] += " *"
+            print(f"  - {card['name']} [{choice_set['name']}]: {' / '.join(names)}", file=out)
+
+
+if __name__ == "__main__":
+    main()
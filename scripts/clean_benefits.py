@@ -4,10 +4,14 @@
 - 중복 카테고리 제거
 - 간결한 혜택 값 생성
 """
-import json
 import re
 from collections import OrderedDict
 
+from data_io import build_parser, info_stream, load_cards, parse_io_args, save_data
+from memo import memoize
+
+@memoize(key=lambda benefit: (benefit.get('description'), benefit.get('title'), benefit.get('category'),
+                               (benefit.get('discount') or {}).get('type'), (benefit.get('discount') or {}).get('value')))
 def extract_benefit_value(benefit):
     """혜택에서 간결한 값 추출 (예: "스타벅스 50%", "대중교통 10%")"""
     
@@ -202,36 +206,35 @@ def get_cleaned_benefits(benefits, max_count=4):
     
     return cleaned
 
-def process_cards():
+def clean_card(card):
+    """카드에 cleaned_benefits 추가 (파이프라인 단계)"""
+    card['cleaned_benefits'] = get_cleaned_benefits(card.get('benefits', []))
+
+def process_cards(argv=None):
     """모든 카드의 혜택 정제"""
     
-    json_path = r"c:\Users\MADUP\Documents\seokmin\website_samsungcard_recommend\data\samsung_cards.json"
+    args = parse_io_args(build_parser("삼성카드 혜택 데이터 정제"), argv)
+    out = info_stream(args.output)
     
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_cards(args.input)
     
     for card in data['cards']:
-        original_benefits = card.get('benefits', [])
-        cleaned_benefits = get_cleaned_benefits(original_benefits)
-        
-        # cleaned_benefits 추가
-        card['cleaned_benefits'] = cleaned_benefits
+        clean_card(card)
     
     # 저장
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_data(data, args.output)
     
-    print(f"완료: {len(data['cards'])}개 카드 혜택 정제")
+    print(f"완료: {len(data['cards'])}개 카드 혜택 정제", file=out)
     
     # 샘플 출력
-    print("\n샘플 결과:")
+    print("\n샘플 결과:", file=out)
     sample_cards = ['삼성카드 taptap O', '삼성 iD SELECT ALL 카드', '모니모카드', '삼성카드 & MILEAGE PLATINUM (스카이패스)']
     
     for card in data['cards']:
         if card['name'] in sample_cards:
-            print(f"\n[{card['name']}]")
+            print(f"\n[{card['name']}]", file=out)
             for b in card.get('cleaned_benefits', []):
-                print(f"  - {b['category']}: {b['value']}")
+                print(f"  - {b['category']}: {b['value']}", file=out)
 
 if __name__ == "__main__":
     process_cards()
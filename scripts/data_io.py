@@ -0,0 +1,101 @@
+"""
+후처리 스크립트 공용 입출력
+- --input / --output 경로 옵션 (기본: 저장소 기준 data/samsung_cards.json)
+- 경로가 '-'이면 stdin/stdout 사용 → 단계들을 파이프로 연결 가능
+  예) python scripts/clean_benefits.py --output - | python scripts/best_benefits.py --input - --output out.json
+- stdout으로 데이터를 내보낼 때는 진행 메시지를 stderr로 출력
+- 파일 입출력 시 혜택 상세 문구는 옆 저장소 파일(*.texts.json, text_store.py)로 분리 저장하고
+  읽을 때 다시 붙임 → 단계들은 항상 benefit['detail'] 전체 문구를 사용
+  (stdin/stdout 파이프는 문구를 인라인으로 주고받음)
+- load_cards: 카드를 Card/Benefit 모델(card_model.py)로 읽음 (파이프라인 단계용, 상세 문구는 읽을 때 복원)
+  save_data는 dict와 모델을 모두 받음
+- read_stream / write_stream: 카드를 하나씩 읽고 쓰는 스트리밍 입출력 (json_stream.py, 메모리가 카드 수와 무관)
+"""
+import argparse
+import io
+import json
+import sys
+from pathlib import Path
+
+from card_model import object_pairs_hook, to_plain
+from json_stream import CardReader, CardWriter
+from text_store import TextStore, attach_texts, detach_texts, store_path
+
+DATA_PATH = Path(__file__).parent.parent / "data" / "samsung_cards.json"
+STDIO = "-"
+
+
+def build_parser(description: str, with_output: bool = True) -> argparse.ArgumentParser:
+    """--input/--output 옵션이 포함된 ArgumentParser (with_output=False면 --input만)"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--input", default=str(DATA_PATH),
+                        help="입력 JSON 경로 ('-'이면 stdin, 기본: data/samsung_cards.json)")
+    if with_output:
+        parser.add_argument("--output", default=None,
+                            help="출력 JSON 경로 ('-'이면 stdout, 기본: 입력 경로에 덮어쓰기)")
+    return parser
+
+
+def parse_io_args(parser: argparse.ArgumentParser, argv: list[str] | None = None) -> argparse.Namespace:
+    args = parser.parse_args(argv)
+    if args.output is None:
+        # stdin으로 받았으면 stdout으로, 파일이면 같은 파일에 덮어쓰기 (기존 동작)
+        args.output = args.input
+    return args
+
+
+def load_data(path: str) -> dict:
+    if path == STDIO:
+        return json.load(sys.stdin.buffer)
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    texts_path = store_path(path)
+    if texts_path.exists():
+        attach_texts(data, TextStore.load(texts_path))
+    return data
+
+
+def load_cards(path: str) -> dict:
+    """load_data와 같지만 data["cards"]가 Card 목록 (상세 문구는 저장소 참조로 유지)"""
+    if path == STDIO:
+        return json.load(sys.stdin.buffer, object_pairs_hook=object_pairs_hook())
+    texts_path = store_path(path)
+    store = TextStore.load(texts_path) if texts_path.exists() else None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f, object_pairs_hook=object_pairs_hook(store))
+
+
+def read_stream(path: str) -> CardReader:
+    """카드(Card 모델)를 하나씩 돌려주는 반복자, 헤더 필드는 reader.header
+    (파일은 반복이 끝나면 닫힘, 문구 저장소는 처음에 한 번 읽음)
+    """
+    if path == STDIO:
+        return CardReader(io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8"), object_pairs_hook())
+    texts_path = store_path(path)
+    store = TextStore.load(texts_path) if texts_path.exists() else None
+    return CardReader(open(path, "r", encoding="utf-8"), object_pairs_hook(store))
+
+
+def write_stream(path: str) -> CardWriter:
+    """카드를 하나씩 write()하고 마지막에 close(header) → save_data와 같은 결과 파일 (+ 문구 저장소)"""
+    return CardWriter(path)
+
+
+def save_data(data: dict, path: str) -> TextStore | None:
+    """저장 (파일이면 상세 문구 저장소도 함께 기록하고 반환)"""
+    if path == STDIO:
+        sys.stdout.buffer.write(json.dumps(to_plain(data), ensure_ascii=False, indent=2).encode("utf-8"))
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.flush()
+        return None
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    data, store = detach_texts(data)
+    store.save(store_path(path))
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return store
+
+
+def info_stream(output: str):
+    """진행 메시지 출력 대상 (데이터가 stdout으로 나가면 stderr)"""
+    return sys.stderr if output == STDIO else sys.stdout
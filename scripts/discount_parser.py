@@ -0,0 +1,234 @@
+"""
+혜택 할인 문구 파서 (공용)
+- 정규식을 모듈 로드 시 한 번만 컴파일
+- 함수 한 번 호출로 할인율/금액/마일 수치와 할인·적립 키워드를 함께 반환
+  (단위 글자('%', '원', '마일')가 없는 텍스트는 정규식 탐색 자체를 생략)
+- 브랜드별 "브랜드 ... N%" 패턴은 브랜드 이름 기준으로 캐시
+
+사용법:
+    python scripts/discount_parser.py --bench   # 기존 방식과 혜택당 파싱 시간 비교 + 결과 일치 검증
+"""
+import argparse
+import re
+import time
+from functools import lru_cache
+from pathlib import Path
+
+DATA_PATH = Path(__file__).parent.parent / "data" / "samsung_cards.json"
+
+PERCENT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*%')
+WON_RE = re.compile(r'([\d,]+)\s*원')
+MILE_RE = re.compile(r'([\d,]+)\s*마일')
+
+# 마일 수치는 기존 표시 규칙대로 쉼표 없는 숫자만 사용 ("1,000마일" → "000")
+MILE_DIGITS_RE = re.compile(r'(\d+)\s*마일')
+
+# 월 한도 문구: "통합 월 할인한도 : 5,000원", "할인한도: 통합 월 10,000원" (구매한도/이용한도 등은 제외)
+CAP_ANCHOR_RE = re.compile(r'(?:할인|적립)한도')
+CAP_AMOUNT_RE = re.compile(r'(\d[\d,]*)\s*(만|천)?\s*(?:원|포인트|P(?![A-Za-z]))(\s*이상)?')
+CAP_TIER_RE = re.compile(r'(\d+)\s*만\s*원\s*이상')
+# 한도 문구의 끝: 다음 "- " / "* " 항목 (단, "- 30만원 이상: 10,000원" 같은 구간 항목은 이어서 읽음)
+CAP_SEGMENT_END_RE = re.compile(
+    r' [-*·] (?!(?:전월\s*이용금액\s*)?\d+\s*만\s*원\s*이상)|이용\s*조\s*건|유의사항')
+# 구간마다 한도 문구가 반복되는 형식: "30만원 이상 시: 통합 월 적립한도 5,000P - ... 60만원 이상 시: ..."
+TIER_CAP_RE = re.compile(
+    r'(\d+)\s*만\s*원\s*이상\s*(?:시\s*)?:\s*(?:통합\s*)?(?:월\s*)?(?:추가\s*)?(?:할인|적립)한도\s*:?\s*'
+    r'(\d[\d,]*)\s*(만|천)?\s*(?:원|포인트|P(?![A-Za-z]))')
+# "(전월 이용금액 80만원 이상 시에는 해당 실적구간 혜택 제공)" 같은 예외 조항과 구분하려고 "시 제공"까지 확인
+PREREQUISITE_RE = re.compile(r'전월\s*(?:일시불 및 할부\s*)?이용금액\s*(\d+)\s*만\s*원\s*이상\s*시\s*(?:에만\s*)?(?:제공|적용|혜택)')
+NO_PREREQUISITE_WORDS = ('이용금액에 관계없이', '이용금액 관계없이')
+NO_CAP_WORDS = ('한도 없이', '한도없이')
+
+
+def parse_discount_text(text: str) -> dict:
+    """혜택 텍스트에서 수치/키워드를 한 번에 추출
+
+    반환 키:
+        percent: 첫 번째 "N%" 값 (float)
+        won: 첫 번째 "N원" 값 (int)
+        mile: 첫 번째 "N마일" 값 (int)
+        mile_digits: 첫 번째 "N마일"의 숫자 문자열 (쉼표 없는 숫자만)
+        accrual / discount / free / mileage: '적립' / '할인' / '무료' / '마일리지' 포함 여부
+    """
+    result = {
+        "percent": None, "won": None, "mile": None, "mile_digits": None,
+        "accrual": '적립' in text, "discount": '할인' in text,
+        "free": '무료' in text, "mileage": '마일리지' in text,
+    }
+    if '%' in text:
+        match = PERCENT_RE.search(text)
+        if match:
+            result["percent"] = float(match.group(1))
+    if '원' in text:
+        match = WON_RE.search(text)
+        if match:
+            digits = match.group(1).replace(',', '')
+            if digits:
+                result["won"] = int(digits)
+    if '마일' in text:
+        match = MILE_RE.search(text)
+        if match:
+            digits = match.group(1).replace(',', '')
+            if digits:
+                result["mile"] = int(digits)
+        match = MILE_DIGITS_RE.search(text)
+        if match:
+            result["mile_digits"] = match.group(1)
+    return result
+
+
+def _won(digits: str, unit: str | None) -> int:
+    """"1,000" → 1000, ("1", "만") → 10000, ("5", "천") → 5000"""
+    value = int(digits.replace(',', ''))
+    return value * {"만": 10000, "천": 1000}.get(unit, 1)
+
+
+def parse_monthly_caps(detail: str) -> dict:
+    """혜택 상세 문구에서 전월 실적 조건과 실적 구간별 월 한도 추출
+
+    반환 키:
+        prerequisite: 혜택 제공 전월 이용금액 조건 (원, "관계없이"면 0, 문구가 없으면 None)
+        unlimited: "할인한도 없이" 여부
+        tiers: [[전월 이용금액 하한(원), 월 한도(원 또는 포인트)], ...] 하한 오름차순
+               (구간 없는 단일 한도는 하한 = prerequisite 또는 0)
+
+    지원 형식:
+        "월 할인한도 40만원 이상 80만원 이상 120만원 이상 7,000원 10,000원 15,000원"
+        "월 할인한도 30만원 이상 10,000원 60만원 이상 15,000원 90만원 이상 20,000원"
+        "통합 월 할인한도 : 5,000원 - 전월 이용금액 40만원 이상 시 제공"
+        "통합 월 할인한도 - 30만원 이상: 10,000원 - 60만원 이상: 20,000원"
+        "30만원 이상 시: 통합 월 적립한도 5,000P - 60만원 이상 시: 통합 월 적립한도 7,000P"
+        "전월 이용금액 40만원 이상: 통합 월 적립한도 5천원 - 전월 이용금액 80만원 이상: ..."
+    포인트(P) 한도는 1포인트 = 1원으로 취급
+    여러 행으로 된 표("구분 ... 음식점 5,000원 10,000원 ...")는 첫 행만 사용
+    """
+    result = {"prerequisite": None, "unlimited": False, "tiers": []}
+    if not detail:
+        return result
+    # "발급월+1개월까지는 전월 이용금액에 관계없이 제공"은 예외 조항이라 실적 조건 문구를 먼저 확인
+    match = PREREQUISITE_RE.search(detail)
+    if match:
+        result["prerequisite"] = int(match.group(1)) * 10000
+    elif any(word in detail for word in NO_PREREQUISITE_WORDS):
+        result["prerequisite"] = 0
+    if any(word in detail for word in NO_CAP_WORDS):
+        result["unlimited"] = True
+        return result
+    if '한도' not in detail:
+        return result
+
+    repeated = TIER_CAP_RE.findall(detail)
+    if len(repeated) > 1:
+        result["tiers"] = sorted([int(floor) * 10000, _won(cap, unit)] for floor, cap, unit in repeated)
+        return result
+
+    for anchor in CAP_ANCHOR_RE.finditer(detail):
+        end = CAP_SEGMENT_END_RE.search(detail, anchor.end())
+        segment = detail[anchor.end():end.start() if end else len(detail)]
+        thresholds, caps = [], []
+        for match in CAP_AMOUNT_RE.finditer(segment):
+            value = _won(match.group(1), match.group(2))
+            (thresholds if match.group(3) else caps).append(value)
+        if not caps:
+            continue
+        if not thresholds:
+            # 구간 표 머리글이 한도 문구 앞에 있는 형식 ("이용금액대별 ... 30만원 이상 60만원 이상 ... 한도")
+            head = detail.rfind('이용금액', 0, anchor.start())
+            if head != -1:
+                thresholds = [int(v) * 10000 for v in CAP_TIER_RE.findall(detail, head, anchor.start())]
+        if len(thresholds) > 1 and len(caps) >= len(thresholds):
+            result["tiers"] = sorted(zip(thresholds, caps[:len(thresholds)]))
+            result["tiers"] = [list(tier) for tier in result["tiers"]]
+        else:
+            result["tiers"] = [[thresholds[0] if thresholds else (result["prerequisite"] or 0), caps[0]]]
+        break
+    return result
+
+
+@lru_cache(maxsize=256)
+def brand_percent_pattern(target: str) -> re.Pattern:
+    """"브랜드 ... N%" 패턴 (브랜드별로 한 번만 컴파일)"""
+    return re.compile(rf'{re.escape(target)}[^0-9]*(\d+(?:\.\d+)?)\s*%', re.IGNORECASE)
+
+
+def brand_percent(text: str, target: str) -> float | None:
+    """브랜드 이름 뒤에 처음 나오는 할인율"""
+    match = brand_percent_pattern(target).search(text)
+    return float(match.group(1)) if match else None
+
+
+def format_percent(val: float) -> str:
+    """10.0 -> "10%", 1.5 -> "1.5%" """
+    if val == int(val):
+        return f"{int(val)}%"
+    return f"{val}%"
+
+
+def format_won(val) -> str:
+    """15000 -> "1만원", 5000 -> "5,000원" """
+    val = int(val)
+    if val >= 10000:
+        return f"{val//10000}만원"
+    return f"{val:,}원"
+
+
+def _parse_discount_text_naive(text: str) -> dict:
+    """기존 방식 (패턴/키워드마다 개별 탐색) - 검증/벤치마크용"""
+    result = {
+        "percent": None, "won": None, "mile": None, "mile_digits": None,
+        "accrual": '적립' in text, "discount": '할인' in text,
+        "free": '무료' in text, "mileage": '마일리지' in text,
+    }
+    percent_match = re.search(r'(\d+(?:\.\d+)?)\s*%', text)
+    if percent_match:
+        result["percent"] = float(percent_match.group(1))
+    won_match = re.search(r'([\d,]+)\s*원', text)
+    if won_match and won_match.group(1).replace(',', ''):
+        result["won"] = int(won_match.group(1).replace(',', ''))
+    mile_match = re.search(r'([\d,]+)\s*마일', text)
+    if mile_match and mile_match.group(1).replace(',', ''):
+        result["mile"] = int(mile_match.group(1).replace(',', ''))
+    digits_match = re.search(r'(\d+)\s*마일', text)
+    if digits_match:
+        result["mile_digits"] = digits_match.group(1)
+    return result
+
+
+def benchmark(json_path: Path, repeat: int = 20):
+    """데이터셋의 모든 혜택에 대해 혜택당 파싱 시간 비교"""
+    from data_io import load_data   # 상세 문구(detail_id)를 저장소에서 복원해 detail 포함
+
+    data = load_data(str(json_path))
+
+    texts = []
+    for card in data["cards"]:
+        for b in card.get("benefits", []):
+            texts.append((b.get("description", "") or "") + ' ' + (b.get("detail", "") or ""))
+
+    old = [_parse_discount_text_naive(t) for t in texts]
+    new = [parse_discount_text(t) for t in texts]
+    assert old == new, "파싱 결과 불일치"
+
+    timings = {}
+    for name, func in [("기존", _parse_discount_text_naive), ("신규", parse_discount_text)]:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for t in texts:
+                func(t)
+        timings[name] = (time.perf_counter() - start) / (len(texts) * repeat)
+
+    print(f"혜택 {len(texts)}개 x {repeat}회, 결과 일치")
+    for name, per_benefit in timings.items():
+        print(f"  - {name}: 혜택당 {per_benefit * 1e6:.1f}µs")
+    print(f"  - {timings['기존'] / timings['신규']:.1f}배")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="혜택 할인 문구 파서")
+    parser.add_argument("--bench", action="store_true", help="기존 방식과 파싱 시간 비교")
+    parser.add_argument("--input", type=Path, default=DATA_PATH, help="카드 데이터 JSON 경로")
+    args = parser.parse_args()
+    if args.bench:
+        benchmark(args.input)
+    else:
+        parser.print_help()
@@ -0,0 +1,315 @@
+"""
+카드 이미지 로컬 캐시 + 썸네일 생성
+- 카드 image_url 과 js/app.js 히어로 캔버스 cardUrls 이미지를 한 번만 받아 내용 주소(SHA-256) 캐시에 저장
+  .cache/images/objects/{해시 앞 2자리}/{해시}.{확장자}  +  .cache/images/index.json (URL → 해시/ETag/Last-Modified)
+- 다시 실행하면 ETag/Last-Modified 조건부 요청 → 304면 재다운로드 없음, 내용이 같으면 같은 파일
+- --offline: 네트워크 없이 이미 채워진 캐시만 사용
+- 프로세스 풀에서 실제 표시 크기(1x/2x)의 WebP/AVIF 썸네일 생성 → data/img/{해시 12자리}-{폭}.{형식}
+    grid: 카드 목록 <img> 폭 105px (css .card-image img)
+    hero: 히어로 캔버스 카드 폭 90px (app.js setupCards cardWidth)
+  원본이 표시 폭보다 좁으면 원본 폭까지만 (1x와 같아지는 2x는 만들지 않음)
+  썸네일 이름도 원본 내용 기준이라 이미 있으면 다시 만들지 않음
+- data/image_map.json 기록 → build_frontend.py 가 목록에 썸네일 경로(thumb)와 manifest에 히어로 이미지(hero_images)를 넣음
+- 원본 대비 절약 바이트 보고 (실제 생성된 썸네일 크기 기준)
+
+image_map.json 형식:
+    {"images": {원본 URL: {"sha256": ..., "bytes": 원본 크기, "webp": {"105": "img/....webp", ...}, "avif": {...}}},
+     "hero": [히어로 이미지 원본 URL, ...], "widths": {"grid": [105, 210], "hero": [90, 180]}}
+
+사용법:
+    python scripts/images.py                    # 받기(조건부) + 썸네일 + image_map.json
+    python scripts/images.py --offline          # 캐시만 사용
+    python scripts/images.py --workers 4
+
+필요 패키지: requests, Pillow (AVIF는 AVIF 인코더가 포함된 Pillow에서만 생성)
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from data_io import DATA_PATH, load_data
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+ROOT = Path(__file__).parent.parent
+CACHE_DIR = ROOT / ".cache" / "images"
+THUMB_DIR_NAME = "img"
+IMAGE_MAP_PATH = DATA_PATH.parent / "image_map.json"
+APP_JS_PATH = ROOT / "js" / "app.js"
+
+# 용도별 CSS 표시 폭 (px) → 1x, 2x 썸네일 생성
+DISPLAY_WIDTHS = {"grid": 105, "hero": 90}
+FORMATS = {"webp": {"quality": 80, "method": 6}, "avif": {"quality": 50}}
+FETCH_WORKERS = 4
+TIMEOUT = 10
+
+CARD_URLS_RE = re.compile(r'cardUrls\s*=\s*\[(.*?)\]', re.S)
+QUOTED_RE = re.compile(r"['\"]([^'\"]+)['\"]")
+EXTENSIONS = {"image/png": "png", "image/jpeg": "jpg", "image/webp": "webp", "image/gif": "gif"}
+
+
+def hero_urls(path: Path = APP_JS_PATH) -> list[str]:
+    """js/app.js CardHeroAnimation.cardUrls"""
+    match = CARD_URLS_RE.search(path.read_text(encoding="utf-8"))
+    return QUOTED_RE.findall(match.group(1)) if match else []
+
+
+def thumb_widths(purpose: str) -> list[int]:
+    width = DISPLAY_WIDTHS[purpose]
+    return [width, width * 2]
+
+
+class ImageCache:
+    """URL → 내용 주소 객체 (조건부 재요청 정보 포함)"""
+
+    def __init__(self, root: Path = CACHE_DIR):
+        self.root = root
+        self.index_path = root / "index.json"
+        self.index = {}
+        if self.index_path.exists():
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                self.index = json.load(f)
+
+    def object_path(self, entry: dict) -> Path:
+        digest = entry["sha256"]
+        return self.root / "objects" / digest[:2] / f"{digest}.{entry['ext']}"
+
+    def get(self, url: str) -> dict | None:
+        """캐시에 파일까지 있는 항목만"""
+        entry = self.index.get(url)
+        return entry if entry and self.object_path(entry).exists() else None
+
+    def store(self, url: str, content: bytes, headers) -> dict:
+        content_type = headers.get("Content-Type", "").split(";")[0].strip()
+        entry = {
+            "sha256": hashlib.sha256(content).hexdigest(),
+            "ext": EXTENSIONS.get(content_type, url.rsplit(".", 1)[-1].lower()[:4] or "bin"),
+            "bytes": len(content),
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        }
+        path = self.object_path(entry)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(content)
+            tmp_path.replace(path)
+        self.index[url] = entry
+        return entry
+
+    def save(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, ensure_ascii=False, indent=2)
+        tmp_path.replace(self.index_path)
+
+
+def fetch_all(cache: ImageCache, urls: list[str], workers: int = FETCH_WORKERS) -> dict[str, int]:
+    """조건부 요청으로 캐시 갱신, 결과별 개수 반환"""
+    import requests
+
+    session = requests.Session()
+    session.headers["User-Agent"] = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+    def fetch(url: str):
+        entry = cache.get(url)
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        try:
+            response = session.get(url, headers=headers, timeout=TIMEOUT)
+        except requests.RequestException as e:
+            return url, "failed", str(e)
+        if response.status_code == 304 and entry:
+            return url, "not_modified", None
+        if response.status_code != 200:
+            return url, "failed", f"HTTP {response.status_code}"
+        return url, "fetched", (response.content, response.headers)
+
+    counts = {"fetched": 0, "not_modified": 0, "failed": 0}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for url, status, result in executor.map(fetch, urls):
+            counts[status] += 1
+            if status == "fetched":
+                cache.store(url, *result)      # 인덱스 갱신은 메인 스레드에서만
+            elif status == "failed":
+                print(f"  [WARN] {url}: {result}{' (이전 캐시 사용)' if cache.get(url) else ''}")
+    session.close()
+    return counts
+
+
+def _make_thumbnails(source: str, digest: str, widths: list[int], out_dir: str) -> dict:
+    """워커: 원본 하나 → 폭별 WebP/AVIF (이미 있으면 건너뜀)
+    반환: {"webp": {폭: (상대 경로, 바이트)}, "avif": {...}, "created": 새로 만든 수, "errors": [...]}
+    """
+    result = {fmt: {} for fmt in FORMATS}
+    result.update(created=0, errors=[])
+    with Image.open(source) as original:
+        original.load()
+        image = original.convert("RGBA") if original.mode not in ("RGB", "RGBA") else original
+        # 확대는 하지 않음 → 원본보다 넓은 폭은 원본 폭으로 (1x와 같아진 2x는 한 번만 생성)
+        for width in sorted({min(width, image.width) for width in widths}):
+            height = max(1, round(image.height * width / image.width))
+            resized = None
+            for fmt, options in FORMATS.items():
+                rel_path = f"{THUMB_DIR_NAME}/{digest[:12]}-{width}.{fmt}"
+                path = Path(out_dir) / rel_path
+                if not path.exists():
+                    if resized is None:
+                        resized = image.resize((width, height), Image.LANCZOS)
+                    tmp_path = path.with_name(f"{path.name}.tmp")
+                    try:
+                        resized.save(tmp_path, format=fmt.upper(), **options)
+                    except (KeyError, OSError, ValueError) as e:
+                        # AVIF 인코더가 없는 Pillow 등 → 해당 형식만 생략
+                        tmp_path.unlink(missing_ok=True)
+                        result["errors"].append(f"{fmt}: {e}")
+                        continue
+                    tmp_path.replace(path)
+                    result["created"] += 1
+                result[fmt][str(width)] = (rel_path, path.stat().st_size)
+    return result
+
+
+def make_thumbnails(cache: ImageCache, purposes: dict[str, set[str]], out_dir: Path,
+                    workers: int) -> dict[str, dict]:
+    """URL별 썸네일 생성 (같은 원본 내용은 한 번만 처리)
+    purposes: URL → {"grid", "hero"} 용도
+    """
+    (out_dir / THUMB_DIR_NAME).mkdir(parents=True, exist_ok=True)
+    jobs = {}
+    for url, uses in purposes.items():
+        entry = cache.get(url)
+        if entry is None:
+            continue
+        widths = sorted({w for use in uses for w in thumb_widths(use)})
+        job = jobs.setdefault(entry["sha256"], {"source": str(cache.object_path(entry)), "widths": set(), "urls": []})
+        job["widths"].update(widths)
+        job["urls"].append(url)
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {digest: executor.submit(_make_thumbnails, job["source"], digest,
+                                           sorted(job["widths"]), str(out_dir))
+                   for digest, job in jobs.items()}
+        for digest, future in futures.items():
+            try:
+                results[digest] = future.result()
+            except Exception as e:
+                print(f"  [WARN] 썸네일 생성 실패 {jobs[digest]['urls'][0]}: {e}")
+    return {url: results[digest] for digest, job in jobs.items() if digest in results for url in job["urls"]}
+
+
+def write_image_map(cache: ImageCache, thumbs: dict[str, dict], hero: list[str], path: Path = IMAGE_MAP_PATH):
+    images = {}
+    for url, result in sorted(thumbs.items()):
+        entry = cache.get(url)
+        images[url] = {"sha256": entry["sha256"], "bytes": entry["bytes"]}
+        for fmt in FORMATS:
+            if result[fmt]:
+                images[url][fmt] = {width: rel_path for width, (rel_path, _) in result[fmt].items()}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"images": images, "hero": hero,
+                   "widths": {use: thumb_widths(use) for use in DISPLAY_WIDTHS}}, f, ensure_ascii=False, indent=1)
+
+
+def prune_thumbnails(thumbs: dict[str, dict], out_dir: Path) -> int:
+    """image_map에 없는 이전 썸네일 삭제"""
+    current = {rel_path for result in thumbs.values() for fmt in FORMATS for rel_path, _ in result[fmt].values()}
+    removed = 0
+    for path in (out_dir / THUMB_DIR_NAME).glob("*"):
+        if f"{THUMB_DIR_NAME}/{path.name}" not in current:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def largest_thumb(sizes: dict[str, tuple], limit: int) -> tuple | None:
+    """실제 생성된 썸네일 중 limit 폭 이하에서 가장 큰 것 (원본이 좁으면 원본 폭 썸네일)"""
+    widths = [width for width in sizes if int(width) <= limit]
+    return sizes[max(widths, key=int)] if widths else None
+
+
+def print_savings_report(cache: ImageCache, purposes: dict[str, set[str]], thumbs: dict[str, dict], out):
+    """용도별 원본 대비 썸네일 바이트 (실제 생성된 가장 큰 썸네일 기준, 원본 한 번씩 계산)"""
+    print("이미지 용량 (용도별 최대 썸네일 기준):", file=out)
+    for use in DISPLAY_WIDTHS:
+        urls = [url for url, uses in purposes.items() if use in uses and url in thumbs]
+        original = sum(cache.get(url)["bytes"] for url in urls)
+        width = thumb_widths(use)[-1]
+        parts = [f"원본 {original:,}"]
+        for fmt in FORMATS:
+            sizes = [largest_thumb(thumbs[url][fmt], width) for url in urls]
+            sizes = [size for size in sizes if size]
+            if len(sizes) == len(urls) and urls:
+                total = sum(size for _, size in sizes)
+                parts.append(f"{fmt} {total:,} ({original - total:,} 절약, {1 - total / max(1, original):.1%})")
+            else:
+                parts.append(f"{fmt} 일부 없음 ({len(sizes)}/{len(urls)})")
+        print(f"  - {use} ({len(urls)}개, 최대 {width}px): {' / '.join(parts)}", file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="카드 이미지 캐시 + 썸네일 생성")
+    parser.add_argument("--input", default=str(DATA_PATH), help="카드 데이터 JSON 경로")
+    parser.add_argument("--out-dir", type=Path, default=DATA_PATH.parent, help="썸네일/image_map 출력 디렉토리")
+    parser.add_argument("--cache-dir", type=Path, default=CACHE_DIR, help="원본 이미지 캐시 디렉토리")
+    parser.add_argument("--offline", action="store_true", help="네트워크 없이 캐시만 사용")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="썸네일 프로세스 수")
+    args = parser.parse_args(argv)
+    out = sys.stdout
+
+    if Image is None:
+        sys.exit("썸네일 생성에는 Pillow가 필요합니다 (pip install Pillow)")
+
+    purposes = {}
+    for card in load_data(args.input)["cards"]:
+        if card.get("image_url"):
+            purposes.setdefault(card["image_url"], set()).add("grid")
+    hero = hero_urls()
+    for url in hero:
+        purposes.setdefault(url, set()).add("hero")
+
+    cache = ImageCache(args.cache_dir)
+    start = time.perf_counter()
+    if args.offline:
+        print(f"[1/2] 오프라인: 캐시 {sum(1 for url in purposes if cache.get(url))}/{len(purposes)}개 사용", file=out)
+    else:
+        print(f"[1/2] 이미지 {len(purposes)}개 조건부 요청 중...", file=out)
+        counts = fetch_all(cache, list(purposes))
+        cache.save()
+        print(f"  - 새로 받음 {counts['fetched']} / 변경 없음(304) {counts['not_modified']} / "
+              f"실패 {counts['failed']} ({time.perf_counter() - start:.1f}초)", file=out)
+    missing = [url for url in purposes if cache.get(url) is None]
+    if missing:
+        print(f"  [WARN] 캐시에 없는 이미지 {len(missing)}개 (원본 URL 유지)", file=out)
+
+    start = time.perf_counter()
+    print(f"[2/2] 썸네일 생성 중... (프로세스 {args.workers}개)", file=out)
+    thumbs = make_thumbnails(cache, purposes, args.out_dir, args.workers)
+    created = sum(result["created"] for result in thumbs.values())
+    errors = sorted({error for result in thumbs.values() for error in result["errors"]})
+    removed = prune_thumbnails(thumbs, args.out_dir)
+    write_image_map(cache, thumbs, hero, args.out_dir / IMAGE_MAP_PATH.name)
+    print(f"  - 새 썸네일 {created}개 / 이전 썸네일 삭제 {removed}개 ({time.perf_counter() - start:.1f}초)", file=out)
+    for error in errors[:3]:
+        print(f"  [WARN] 형식 생략: {error}", file=out)
+    print_savings_report(cache, purposes, thumbs, out)
+    print(f"완료: {args.out_dir / IMAGE_MAP_PATH.name} (build_frontend.py 실행 시 목록/manifest에 반영)", file=out)
+
+
+if __name__ == "__main__":
+    main()
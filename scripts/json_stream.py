@@ -0,0 +1,294 @@
+"""
+카드 데이터 스트리밍 읽기/쓰기 (카탈로그 크기와 무관한 메모리)
+- CardReader: {"crawled_at": ..., "cards": [...]} 파일을 CHUNK_SIZE씩 읽으며 cards 배열 원소를 하나씩 반환
+  (헤더 필드는 reader.header 에 모음, cards 뒤에 오는 필드는 반복이 끝난 뒤 채워짐)
+- CardWriter: 카드를 하나씩 임시 파일에 기록하고, close() 때 헤더(total_cards / categories는 실제로 쓴 카드 기준으로 다시 계산)
+  + 카드 배열을 이어 최종 파일을 만든 뒤 교체 → 결과는 json.dump(indent=2)와 바이트 단위로 같음
+- 파일 입출력 시 상세 문구는 기존처럼 옆 저장소(*.texts.json)로 분리 (저장소는 고유 문구 크기만큼만 메모리 사용)
+- data_io.read_stream / write_stream 으로 사용 (pipeline.py --stream)
+
+사용법:
+    python scripts/json_stream.py --bench 2048      # 최대 2GB 가상 카탈로그로 스트리밍 vs 전체 로드 최대 RSS/처리량 비교
+"""
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from text_store import TextStore, detach_card, store_path
+
+CHUNK_SIZE = 1 << 20           # 한 번에 읽는 글자 수
+MAX_VALUE_SIZE = 64 << 20      # 값 하나(카드 하나)가 이보다 크면 잘못된 입력으로 간주
+INDENT = "  "
+WHITESPACE = " \t\n\r"
+BENCH_STAGES = "metadata,priority"
+BENCH_FULL_LOAD_LIMIT = 512 << 20   # 전체 로드 비교는 이 크기 이하 파일만 (메모리 부족 방지)
+
+
+class CardReader:
+    """최상위 객체의 cards 배열을 원소 단위로 읽는 반복자 (한 번만 반복 가능)"""
+
+    def __init__(self, fp, object_pairs_hook=None):
+        self.fp = fp
+        self.decoder = json.JSONDecoder(object_pairs_hook=object_pairs_hook)
+        self.header = {}
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.chars_read = 0
+
+    def _fill(self) -> bool:
+        """다음 조각 읽기 (처리한 앞부분은 버림)"""
+        if self.eof:
+            return False
+        chunk = self.fp.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.chars_read += len(chunk)
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """공백을 건너뛴 다음 글자 (파일 끝이면 '')"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if not char or char not in chars:
+            raise ValueError(f"JSON 스트림 형식 오류: {chars!r} 필요, {char or 'EOF'!r} 발견 "
+                             f"(위치 약 {self.chars_read - len(self.buffer) + self.pos:,})")
+        self.pos += 1
+        return char
+
+    def _value(self):
+        """값 하나 디코드 (버퍼에 다 들어올 때까지 더 읽음)"""
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # 숫자 등은 버퍼 끝에서 잘려도 디코드되므로 뒤에 구분자가 보일 때만 확정
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            if len(self.buffer) - self.pos > MAX_VALUE_SIZE:
+                raise ValueError(f"JSON 값이 {MAX_VALUE_SIZE:,}자를 넘음 (잘못된 입력?)")
+            self._fill()
+
+    def __iter__(self):
+        try:
+            yield from self._parse()
+        finally:
+            self.fp.close()
+
+    def _parse(self):
+        self._expect("{")
+        if self._peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self._value()
+            self._expect(":")
+            if key == "cards":
+                self._expect("[")
+                if self._peek() == "]":
+                    self.pos += 1
+                else:
+                    while True:
+                        yield self._value()
+                        if self._expect(",]") == "]":
+                            break
+            else:
+                self.header[key] = self._value()
+            if self._expect(",}") == "}":
+                return
+
+
+def indent_lines(text: str, prefix: str) -> str:
+    """두 번째 줄부터 prefix 추가 (json.dumps(indent) 결과를 더 깊은 위치에 넣을 때)"""
+    return text.replace("\n", "\n" + prefix)
+
+
+class CardWriter:
+    """카드를 하나씩 받아 json.dump(indent=2)와 같은 파일을 만드는 기록기
+    path가 '-'이면 stdout (문구 인라인), 파일이면 문구는 저장소로 분리
+    """
+
+    def __init__(self, path: str, detach: bool = True):
+        self.path = path
+        self.to_stdout = path == "-"
+        self.store = TextStore() if detach and not self.to_stdout else None
+        directory = None if self.to_stdout else Path(path).parent
+        if directory is not None:
+            directory.mkdir(parents=True, exist_ok=True)
+        self.cards_file = tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=directory,
+                                                      prefix=".cards.", suffix=".tmp", delete=False)
+        self.count = 0
+        self.categories = set()
+
+    def write(self, card):
+        data = card.to_dict() if hasattr(card, "to_dict") else card
+        for benefit in data.get("benefits", []):
+            if benefit.get("category"):
+                self.categories.add(benefit["category"])
+        if self.store is not None:
+            data = detach_card(data, self.store)
+        self.write_json(json.dumps(data, ensure_ascii=False, indent=2))
+
+    def write_json(self, text: str) -> int:
+        """직렬화된 카드(json.dumps(indent=2)) 하나를 배열에 추가, 기록한 글자 수 반환"""
+        prefix = INDENT * 2
+        chunk = ("," if self.count else "") + "\n" + prefix + indent_lines(text, prefix)
+        self.cards_file.write(chunk)
+        self.count += 1
+        return len(chunk)
+
+    def close(self, header: dict) -> TextStore | None:
+        """헤더 + 카드 배열로 최종 파일 완성 (header의 total_cards / categories는 실제 기록 기준으로 교체)
+        반환: 문구 저장소 (stdout이면 None)
+        """
+        self.cards_file.close()
+        header = dict(header)
+        if "total_cards" in header:
+            header["total_cards"] = self.count
+        if "categories" in header:
+            header["categories"] = sorted(self.categories)
+        try:
+            if self.to_stdout:
+                out = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+                self._assemble(header, out)
+                out.write("\n")
+                out.flush()
+                out.detach()     # sys.stdout은 닫지 않음
+                return None
+            tmp_path = Path(f"{self.path}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as out:
+                self._assemble(header, out)
+            if self.store is not None:
+                self.store.save(store_path(self.path))
+            tmp_path.replace(self.path)
+            return self.store
+        finally:
+            os.unlink(self.cards_file.name)
+
+    def _assemble(self, header: dict, out):
+        out.write("{")
+        for key, value in header.items():
+            out.write(f"\n{INDENT}{json.dumps(key, ensure_ascii=False)}: "
+                      f"{indent_lines(json.dumps(value, ensure_ascii=False, indent=2), INDENT)},")
+        out.write(f"\n{INDENT}\"cards\": [")
+        if self.count:
+            with open(self.cards_file.name, "r", encoding="utf-8") as cards:
+                shutil.copyfileobj(cards, out, CHUNK_SIZE)
+            out.write(f"\n{INDENT}]")
+        else:
+            out.write("]")
+        out.write("\n}")
+
+    def abort(self):
+        self.cards_file.close()
+        os.unlink(self.cards_file.name)
+
+
+def current_peak_rss() -> int:
+    """현재 프로세스 최대 RSS (bytes)"""
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def write_synthetic(source: str, target: Path, target_bytes: int) -> int:
+    """실제 카드를 id만 바꿔 반복 기록한 target_bytes 크기 가상 카탈로그 (스트리밍 기록, 같은 문구 저장소)
+    반환: 카드 수
+    """
+    with open(source, "r", encoding="utf-8") as f:
+        data = json.load(f)     # 저장 형식 그대로 (detail_id 참조)
+    # 카드 직렬화는 한 번만, 복제본은 id 줄만 바꿔 기록
+    templates = [(card["id"], json.dumps(card, ensure_ascii=False, indent=2)) for card in data.pop("cards")]
+    writer = CardWriter(str(target), detach=False)
+    writer.categories.update(data.get("categories", []))
+    written = 0
+    while written < target_bytes:
+        card_id, text = templates[writer.count % len(templates)]
+        written += writer.write_json(text.replace(f'"id": "{card_id}"', f'"id": "{card_id}-{writer.count}"', 1))
+    writer.close(data)
+    shutil.copyfile(store_path(source), store_path(target))
+    return writer.count
+
+
+def measure(mode: str, path: str, output: str, stages: list[str]) -> dict:
+    """하위 프로세스: 스트리밍 / 전체 로드로 단계 실행 + 저장, 최대 RSS와 소요 시간"""
+    from data_io import load_cards, save_data
+    from pipeline import run_stages, run_stages_streaming
+
+    start = time.perf_counter()
+    if mode == "stream":
+        count, _ = run_stages_streaming(path, output, stages)
+    else:
+        data = load_cards(path)
+        run_stages(data["cards"], stages)
+        save_data(data, output)
+        count = len(data["cards"])
+    return {"elapsed": time.perf_counter() - start, "peak_rss": current_peak_rss(), "cards": count}
+
+
+def benchmark_streaming(source: str, max_mb: int, stages: str, out):
+    sizes = sorted({max(1, max_mb // 8), max(1, max_mb // 2), max_mb})
+    with tempfile.TemporaryDirectory() as tmp:
+        for size_mb in sizes:
+            path = Path(tmp) / f"cards_{size_mb}mb.json"
+            start = time.perf_counter()
+            count = write_synthetic(source, path, size_mb << 20)   # 글자 수 기준 (한글은 3바이트라 파일은 더 큼)
+            file_bytes = path.stat().st_size
+            print(f"[{file_bytes / 2**20:,.0f}MB, 카드 {count:,}개, 단계 {stages}] "
+                  f"(생성 {time.perf_counter() - start:.1f}초)", file=out)
+            modes = ["stream"] + (["full"] if file_bytes <= BENCH_FULL_LOAD_LIMIT else [])
+            for mode in modes:
+                output = subprocess.run([sys.executable, __file__, "--measure", mode, "--input", str(path),
+                                         "--output", str(Path(tmp) / "out.json"), "--stages", stages],
+                                        check=True, capture_output=True, text=True).stdout
+                result = json.loads(output.splitlines()[-1])
+                label = "스트리밍" if mode == "stream" else "전체 로드"
+                print(f"  - {label}: 최대 RSS {result['peak_rss'] / 2**20:,.0f}MB / {result['elapsed']:.1f}초 "
+                      f"({file_bytes / 2**20 / result['elapsed']:,.1f}MB/s, "
+                      f"{result['cards'] / result['elapsed']:,.0f}카드/s)", file=out)
+            if "full" not in modes:
+                print(f"  - 전체 로드: 생략 ({BENCH_FULL_LOAD_LIMIT >> 20}MB 초과)", file=out)
+            path.unlink()
+            store_path(path).unlink()
+
+
+def main(argv=None):
+    import argparse
+
+    from data_io import DATA_PATH
+
+    parser = argparse.ArgumentParser(description="스트리밍 JSON 입출력 벤치마크")
+    parser.add_argument("--input", default=str(DATA_PATH), help="카드 데이터 JSON 경로")
+    parser.add_argument("--bench", type=int, metavar="MB", default=2048, help="가장 큰 가상 카탈로그 크기 (MB)")
+    parser.add_argument("--stages", default=BENCH_STAGES, help="카드마다 실행할 단계")
+    parser.add_argument("--measure", choices=["stream", "full"], help=argparse.SUPPRESS)  # 하위 프로세스용
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    stages = [name for name in args.stages.split(",") if name]
+
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.input, args.output, stages)))
+        return
+    benchmark_streaming(args.input, args.bench, args.stages, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+혜택 문구 기반 추출 함수 메모이제이션 (공용)
+- 같은 혜택 문구(taptap/iD 계열 등 여러 카드가 공유)는 실행마다 한 번만 분류
+- 키: 함수 인자(혜택 문구 등) → 문구가 글자 단위로 같으면 같은 키 (디스크에는 인자를 이은 문자열의 SHA-1)
+  (추출 함수들이 원문에 부분 문자열 검사를 하므로 공백/대소문자 정규화는 하지 않음 → 결과 동일 보장)
+- 메모리: 함수별 크기 제한 LRU (MAX_ENTRIES)
+- 디스크: .cache/memo.json 에 LRU 내용과 평균 계산 시간을 저장해 다음 실행에서 재사용
+  함수 코드 지문(바이트코드 + 상수)을 네임스페이스에 포함 → 함수가 바뀌면 이전 캐시는 자동으로 무시
+- 함수별 적중률 / 절약 시간(적중 수 x 평균 계산 시간) 보고
+
+사용 예:
+    @memoize()
+    def get_best_target(desc, detail, category): ...
+
+    @memoize(key=lambda benefit: (benefit.get('description'), benefit.get('title')))
+    def extract_benefit_value(benefit): ...
+
+사용법:
+    python scripts/memo.py              # 메모 없음 / 디스크 캐시 없음 / 디스크 캐시 있음 비교 (실제 데이터)
+    python scripts/memo.py --clear      # 디스크 캐시 삭제
+"""
+import copy
+import functools
+import hashlib
+import json
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+CACHE_PATH = Path(__file__).parent.parent / ".cache" / "memo.json"
+MAX_ENTRIES = 4096       # 함수별 메모리 LRU 크기 (디스크에도 이만큼만 저장)
+KEY_SEPARATOR = "\x1f"
+
+_caches = {}             # 함수 이름 → MemoCache
+_disk = None             # 디스크 캐시 (첫 사용 시 로드)
+enabled = True
+
+
+def code_fingerprint(func) -> str:
+    """함수 바이트코드 + 상수 지문 (키워드 목록이 바뀌어도 달라짐)"""
+    code = func.__code__
+    digest = hashlib.sha1(code.co_code + repr(code.co_consts).encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+def content_key(parts) -> str:
+    text = KEY_SEPARATOR.join("" if part is None else str(part) for part in parts)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _load_disk() -> dict:
+    global _disk
+    if _disk is None:
+        _disk = {}
+        if CACHE_PATH.exists():
+            try:
+                with open(CACHE_PATH, "r", encoding="utf-8") as f:
+                    _disk = json.load(f)
+            except (OSError, ValueError):
+                _disk = {}   # 깨진 캐시는 무시 (다음 저장 시 덮어씀)
+    return _disk
+
+
+class MemoCache:
+    """함수 하나의 LRU + 통계
+    메모리 LRU는 인자 튜플을 그대로 키로 사용하고 (문자열 해시는 파이썬이 캐시),
+    SHA-1 키는 메모리에 없을 때 디스크 캐시를 찾거나 저장할 때만 계산
+    """
+
+    def __init__(self, namespace: str, max_entries: int = MAX_ENTRIES):
+        self.namespace = namespace
+        self.max_entries = max_entries
+        stored = _load_disk().get(namespace, {})
+        self.disk = stored.get("entries", {})          # SHA-1 키 → 값
+        self.disk_mean_time = stored.get("mean_time", 0.0)
+        self.entries = OrderedDict()                    # 인자 튜플 → (SHA-1 키, 값)
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.miss_time = 0.0
+
+    def get(self, parts: tuple, compute):
+        entry = self.entries.get(parts)
+        if entry is not None:
+            self.entries.move_to_end(parts)
+            self.hits += 1
+            value = entry[1]
+            return value if isinstance(value, str) else copy.deepcopy(value)
+
+        key = content_key(parts)
+        if key in self.disk:
+            self.disk_hits += 1
+            value = self.disk[key]
+        else:
+            start = time.perf_counter()
+            value = compute()
+            self.miss_time += time.perf_counter() - start
+            self.misses += 1
+        self.entries[parts] = (key, value)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return value if isinstance(value, str) else copy.deepcopy(value)
+
+    def mean_time(self) -> float:
+        """1회 계산 평균 시간 (이번 실행에 계산이 없으면 이전 실행 기록)"""
+        return self.miss_time / self.misses if self.misses else self.disk_mean_time
+
+    def saved_time(self) -> float:
+        """(메모리 + 디스크 적중 수) x 평균 계산 시간 (추정)"""
+        return (self.hits + self.disk_hits) * self.mean_time()
+
+    def to_disk(self) -> dict:
+        return {"mean_time": self.mean_time(), "entries": dict(self.entries.values())}
+
+
+def memoize(key=None):
+    """content_key(key(*args) 또는 args) 기준 메모이제이션 데코레이터 (반환값은 JSON 값이어야 함)"""
+    def decorator(func):
+        name = f"{func.__module__}.{func.__qualname__}"
+        namespace = f"{name}@{code_fingerprint(func)}"
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            if not enabled:
+                return func(*args)
+            cache = _caches.get(name)
+            if cache is None:
+                cache = _caches[name] = MemoCache(namespace)
+            return cache.get(key(*args) if key else args, lambda: func(*args))
+        return wrapper
+    return decorator
+
+
+def save_cache(path: Path = CACHE_PATH):
+    """현재 LRU 내용을 디스크에 저장 (이번 실행에서 쓰지 않은 함수의 기존 항목은 유지)"""
+    if not _caches:
+        return
+    disk = dict(_load_disk())
+    for cache in _caches.values():
+        disk[cache.namespace] = cache.to_disk()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(disk, f, ensure_ascii=False, separators=(",", ":"))
+    tmp_path.replace(path)
+
+
+def reset(disk: bool = False):
+    """메모리 캐시/통계 초기화 (disk=True면 디스크 캐시 다시 읽기)"""
+    global _disk
+    _caches.clear()
+    if disk:
+        _disk = None
+
+
+def print_memo_report(out):
+    if not _caches:
+        return
+    print("추출 함수 메모이제이션:", file=out)
+    for name, cache in sorted(_caches.items()):
+        calls = cache.hits + cache.disk_hits + cache.misses
+        hits = cache.hits + cache.disk_hits
+        print(f"  - {name}: 호출 {calls}회, 적중 {hits}회 ({hits / max(1, calls):.1%}, "
+              f"디스크 {cache.disk_hits}회), 절약 약 {cache.saved_time() * 1000:.2f}ms", file=out)
+
+
+def set_enabled(flag: bool):
+    global enabled
+    enabled = flag
+
+
+def main(argv=None):
+    import argparse
+
+    # 스크립트로 실행하면 이 파일은 __main__ 이므로, 단계 함수들이 쓰는 memo 모듈을 따로 import해서 조작
+    import memo
+    from data_io import DATA_PATH, load_cards
+    from pipeline import run_stages
+
+    parser = argparse.ArgumentParser(description="추출 함수 메모이제이션 비교")
+    parser.add_argument("--input", default=str(DATA_PATH), help="카드 데이터 JSON 경로")
+    parser.add_argument("--stages", default="clean,summarize,best,reclassify", help="비교할 단계")
+    parser.add_argument("--clear", action="store_true", help="디스크 캐시 삭제 후 종료")
+    args = parser.parse_args(argv)
+    out = sys.stdout
+
+    if args.clear:
+        memo.CACHE_PATH.unlink(missing_ok=True)
+        print(f"삭제: {memo.CACHE_PATH}", file=out)
+        return
+
+    stages = args.stages.split(",")
+    cards = load_cards(args.input)["cards"]
+    results = {}
+    for label, memo_on, use_disk in [("메모 없음", False, False),
+                                     ("메모 (디스크 캐시 없음)", True, False),
+                                     ("메모 (디스크 캐시 있음)", True, True)]:
+        memo.set_enabled(memo_on)
+        memo.reset(disk=True)
+        if not use_disk:
+            memo._load_disk().clear()
+        work = copy.deepcopy(cards)
+        start = time.perf_counter()
+        run_stages(work, stages)
+        elapsed = time.perf_counter() - start
+        results[label] = work
+        print(f"[{label}] {'+'.join(stages)}: {elapsed * 1000:.1f}ms", file=out)
+        memo.print_memo_report(out)
+        if memo_on:
+            memo.save_cache()
+    memo.set_enabled(True)
+
+    assert all(work == results["메모 없음"] for work in results.values()), "메모이제이션 결과가 원래 결과와 다름"
+    print("결과 일치 확인: 세 실행 모두 동일", file=out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+혜택별 전월 실적 구간 / 월 한도 표 추출
+- benefit.detail 문구를 빌드 시 한 번만 파싱해서 benefit.monthly_caps 로 저장
+  {"prerequisite": 전월 실적 조건(원), "unlimited": 한도 없음 여부, "tiers": [[실적 하한, 월 한도], ...]}
+- 추천 엔진(recommender.py)은 저장된 표만 사용 (점수 계산 시 텍스트 재탐색 없음)
+- 파싱 결과 커버리지 보고
+
+사용법:
+    python scripts/monthly_caps.py                      # samsung_cards.json에 monthly_caps 기록 + 커버리지 보고
+    python scripts/monthly_caps.py --output -           # stdout으로 출력
+"""
+import re
+
+from data_io import build_parser, info_stream, load_cards, parse_io_args, save_data
+from discount_parser import parse_monthly_caps
+
+CAP_WORD_RE = re.compile(r'(?:할인|적립)한도')
+
+
+def caps_card(card):
+    """카드의 혜택마다 monthly_caps 추가 (파이프라인 단계)"""
+    for benefit in card.get('benefits', []):
+        benefit['monthly_caps'] = parse_monthly_caps(benefit.get('detail', '') or '')
+
+
+def coverage(cards: list[dict]) -> dict[str, int]:
+    """monthly_caps 결과 분류별 혜택 수"""
+    counts = {"구간별 한도 표": 0, "단일 월 한도": 0, "한도 없음": 0,
+              "한도 문구 미해석": 0, "한도 문구 없음": 0}
+    for card in cards:
+        for benefit in card.get('benefits', []):
+            caps = benefit.get('monthly_caps') or parse_monthly_caps(benefit.get('detail', '') or '')
+            if len(caps['tiers']) > 1:
+                counts["구간별 한도 표"] += 1
+            elif caps['tiers']:
+                counts["단일 월 한도"] += 1
+            elif caps['unlimited']:
+                counts["한도 없음"] += 1
+            elif CAP_WORD_RE.search(benefit.get('detail', '') or ''):
+                counts["한도 문구 미해석"] += 1
+            else:
+                counts["한도 문구 없음"] += 1
+    return counts
+
+
+def print_coverage_report(cards: list[dict], out):
+    counts = coverage(cards)
+    total = sum(counts.values())
+    with_caps = total - counts["한도 문구 없음"]
+    parsed = with_caps - counts["한도 문구 미해석"]
+    print(f"월 한도 파싱: 혜택 {total}개 중 한도 문구 {with_caps}개, 해석 {parsed}개 "
+          f"({parsed / max(1, with_caps):.1%})", file=out)
+    for label, count in counts.items():
+        print(f"  - {label}: {count}개", file=out)
+
+
+def main(argv=None):
+    args = parse_io_args(build_parser("혜택별 전월 실적 구간 / 월 한도 추출"), argv)
+    out = info_stream(args.output)
+
+    data = load_cards(args.input)
+    for card in data['cards']:
+        caps_card(card)
+    save_data(data, args.output)
+
+    print(f"완료: {len(data['cards'])}개 카드", file=out)
+    print_coverage_report(data['cards'], out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+카드 데이터 후처리 파이프라인
+- samsung_cards.json을 한 번만 읽고, 선택한 단계를 메모리에서 순서대로 적용한 뒤 한 번만 저장
+- 단계: metadata(색상/tagline) → clean(cleaned_benefits) → summarize(summarized_benefits)
+        → choices(선택형 혜택 choice_sets) → best(display_benefits v2) / reclassify(display_benefits v1)
+        → caps(benefits[].monthly_caps 실적 구간별 월 한도) → priority(네이버 우선순위 priority_rank / sort_key)
+- 단계별 소요 시간 출력
+- --workers N: 카드를 묶음 단위로 프로세스 풀에 분배 (출력 순서는 입력과 동일)
+- 대상/값 추출 함수는 혜택 문구 기준으로 메모이제이션, 단일 프로세스 실행 후 디스크 캐시 저장 (memo.py)
+- 카드는 슬롯 기반 Card/Benefit 모델(card_model.py)로 읽음 (상세 문구는 읽을 때 저장소에서 복원)
+- --stream: 카드를 하나씩 읽어 단계 적용 후 바로 기록 (json_stream.py, 카탈로그 크기와 무관한 메모리, 결과 파일 동일)
+  카드 전체를 보는 한도/우선순위 보고는 생략
+
+사용법:
+    python scripts/pipeline.py                          # 기본 단계 전체
+    python scripts/pipeline.py --stages clean,best      # 일부 단계만
+    python scripts/pipeline.py --input - --output - < in.json > out.json
+    python scripts/pipeline.py --workers 4 --input big.json --output big_out.json
+    python scripts/pipeline.py --stream --input huge.json --output huge_out.json
+    python scripts/pipeline.py --bench 20000            # 워커 수별 처리 시간 비교
+"""
+import argparse
+import copy
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from add_card_metadata import apply_card_metadata
+from best_benefits import best_card
+from choice_sets import choices_card
+from clean_benefits import clean_card
+from data_io import build_parser, info_stream, load_cards, parse_io_args, read_stream, save_data, write_stream
+from memo import print_memo_report, save_cache
+from monthly_caps import caps_card, print_coverage_report
+from priority import apply_priority, print_priority_report
+from reclassify_benefits import reclassify_card
+from summarize_benefits import summarize_card
+
+# 단계 이름 → 카드 하나를 제자리에서 수정하는 함수
+STAGES = {
+    "metadata": apply_card_metadata,
+    "clean": clean_card,
+    "summarize": summarize_card,
+    "choices": choices_card,
+    "best": best_card,
+    "reclassify": reclassify_card,
+    "caps": caps_card,
+    "priority": apply_priority,
+}
+
+# reclassify는 best와 같은 display_benefits를 덮어쓰므로 기본 단계에서 제외
+DEFAULT_STAGES = ["metadata", "clean", "summarize", "choices", "best", "caps", "priority"]
+
+# 단계별로 카드에 기록하는 필드 (워커는 이 필드만 돌려보냄)
+STAGE_FIELDS = {
+    "metadata": ["primary_color", "secondary_color", "tagline"],
+    "clean": ["cleaned_benefits"],
+    "summarize": ["summarized_benefits"],
+    "choices": ["choice_sets"],
+    "best": ["display_benefits"],
+    "reclassify": ["display_benefits"],
+    "caps": ["benefits"],
+    "priority": ["priority_rank", "sort_key"],
+}
+
+CHUNK_SIZE = 64  # 프로세스 풀에 한 번에 넘기는 카드 수
+
+
+def run_stages(cards: list[dict], stage_names: list[str]) -> list[tuple[str, float]]:
+    """카드 목록에 단계를 순서대로 적용하고 (단계, 소요 시간) 목록 반환"""
+    timings = []
+    for name in stage_names:
+        stage = STAGES[name]
+        start = time.perf_counter()
+        for card in cards:
+            stage(card)
+        timings.append((name, time.perf_counter() - start))
+    return timings
+
+
+def run_stages_streaming(input_path: str, output_path: str, stage_names: list[str]) -> tuple[int, list[tuple[str, float]]]:
+    """카드를 하나씩 읽어 단계를 적용하고 바로 기록 → (카드 수, [(단계, 소요 시간), ...])"""
+    totals = dict.fromkeys(stage_names, 0.0)
+    reader = read_stream(input_path)
+    writer = write_stream(output_path)
+    try:
+        for card in reader:
+            for name in stage_names:
+                start = time.perf_counter()
+                STAGES[name](card)
+                totals[name] += time.perf_counter() - start
+            writer.write(card)
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close(reader.header)
+    return writer.count, list(totals.items())
+
+
+def _run_chunk(stage_names: list[str], cards: list[dict]) -> list[dict]:
+    """워커 프로세스: 카드 묶음에 단계를 적용하고 단계가 기록한 필드만 돌려줌
+    (단계는 모두 카드 단위로 독립이라 카드별 처리 순서와 무관)
+    """
+    fields = [field for name in stage_names for field in STAGE_FIELDS[name]]
+    updates = []
+    for card in cards:
+        for name in stage_names:
+            STAGES[name](card)
+        updates.append({field: card[field] for field in fields})
+    return updates
+
+
+def run_stages_parallel(cards: list[dict], stage_names: list[str], workers: int,
+                        chunk_size: int = CHUNK_SIZE) -> list[dict]:
+    """카드를 chunk_size 단위로 나눠 프로세스 풀에서 처리
+    결과는 입력 순서대로 원래 카드에 합쳐지므로 단일 프로세스 실행과 출력이 같음
+    """
+    chunks = [cards[i:i + chunk_size] for i in range(0, len(cards), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(partial(_run_chunk, stage_names), chunks)
+        for chunk, updates in zip(chunks, results):
+            for card, update in zip(chunk, updates):
+                card.update(update)
+    return cards
+
+
+def synthetic_catalogue(cards: list[dict], size: int) -> list[dict]:
+    """실제 카드를 반복 복제해서 size개짜리 가상 카탈로그 생성"""
+    catalogue = []
+    while len(catalogue) < size:
+        for card in cards[:size - len(catalogue)]:
+            clone = copy.deepcopy(card)
+            clone["id"] = f"{card['id']}-{len(catalogue)}"
+            catalogue.append(clone)
+    return catalogue
+
+
+def benchmark_workers(cards: list[dict], stage_names: list[str], size: int, out,
+                      worker_counts=(1, 2, 4, 8)):
+    """가상 카탈로그로 워커 수별 처리 시간 비교 (결과 일치 검증 포함)"""
+    catalogue = synthetic_catalogue(cards, size)
+    benefit_count = sum(len(card.get("benefits", [])) for card in catalogue)
+    print(f"가상 카탈로그: 카드 {len(catalogue):,}개 / 혜택 {benefit_count:,}개", file=out)
+
+    baseline = None
+    base_elapsed = None
+    for workers in worker_counts:
+        work = copy.deepcopy(catalogue)
+        start = time.perf_counter()
+        if workers == 1:
+            run_stages(work, stage_names)
+        else:
+            work = run_stages_parallel(work, stage_names, workers)
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline, base_elapsed = work, elapsed
+        assert work == baseline, f"워커 {workers}개 결과가 단일 프로세스와 다름"
+        print(f"  - 워커 {workers}개: {elapsed:.2f}초 ({base_elapsed / elapsed:.2f}배)", file=out)
+
+
+def parse_stages(value: str) -> list[str]:
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in STAGES]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"알 수 없는 단계: {', '.join(unknown)} (가능: {', '.join(STAGES)})")
+    return names
+
+
+def main(argv=None):
+    parser = build_parser("카드 데이터 후처리 파이프라인")
+    parser.add_argument("--stages", type=parse_stages, default=DEFAULT_STAGES,
+                        help=f"쉼표로 구분한 단계 목록 (기본: {','.join(DEFAULT_STAGES)})")
+    parser.add_argument("--workers", type=int, default=1, help="프로세스 수 (1이면 현재 프로세스에서 처리)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="워커당 한 번에 처리할 카드 수")
+    parser.add_argument("--stream", action="store_true",
+                        help="카드를 하나씩 읽고 기록 (메모리 일정, --workers와 함께 사용 불가)")
+    parser.add_argument("--bench", type=int, metavar="N",
+                        help="저장 없이 N개짜리 가상 카탈로그로 워커 1/2/4/8개 처리 시간 비교")
+    args = parse_io_args(parser, argv)
+    out = info_stream(args.output)
+
+    if args.bench:
+        benchmark_workers(load_cards(args.input)["cards"], args.stages, args.bench, out)
+        return
+
+    total_start = time.perf_counter()
+
+    if args.stream:
+        if args.workers > 1:
+            parser.error("--stream은 --workers와 함께 사용할 수 없습니다")
+        count, timings = run_stages_streaming(args.input, args.output, args.stages)
+        save_cache()
+        total = time.perf_counter() - total_start
+        print(f"완료 (스트리밍): {count}개 카드, 단계 {' → '.join(args.stages)}", file=out)
+        for name, elapsed in timings:
+            print(f"  - {name}: {elapsed * 1000:.1f}ms", file=out)
+        print(f"  - 읽기/쓰기: {(total - sum(elapsed for _, elapsed in timings)) * 1000:.1f}ms", file=out)
+        print(f"  - 전체: {total * 1000:.1f}ms", file=out)
+        print_memo_report(out)
+        return
+
+    start = time.perf_counter()
+    data = load_cards(args.input)
+    load_elapsed = time.perf_counter() - start
+
+    if args.workers > 1:
+        start = time.perf_counter()
+        data["cards"] = run_stages_parallel(data["cards"], args.stages, args.workers, args.chunk_size)
+        timings = [(f"{'+'.join(args.stages)} (프로세스 {args.workers}개)", time.perf_counter() - start)]
+    else:
+        timings = run_stages(data["cards"], args.stages)
+        save_cache()
+
+    start = time.perf_counter()
+    save_data(data, args.output)
+    save_elapsed = time.perf_counter() - start
+
+    print(f"완료: {len(data['cards'])}개 카드, 단계 {' → '.join(args.stages)}", file=out)
+    print(f"  - 로드: {load_elapsed * 1000:.1f}ms", file=out)
+    for name, elapsed in timings:
+        print(f"  - {name}: {elapsed * 1000:.1f}ms", file=out)
+    print(f"  - 저장: {save_elapsed * 1000:.1f}ms", file=out)
+    print(f"  - 전체: {(time.perf_counter() - total_start) * 1000:.1f}ms", file=out)
+    if "caps" in args.stages:
+        print_coverage_report(data["cards"], out)
+    if "priority" in args.stages:
+        print_priority_report(data["cards"], out)
+    print_memo_report(out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+네이버 카드검색 우선순위/색상 조인 (공용)
+- data/priority_cards.json 을 한 번만 읽어 정규화된 카드 이름 → {순위, 색상} 조회 테이블 생성
+- card-gorilla 이름은 name_mapping(네이버 이름)으로 바꾼 뒤 정규화해서 dict 한 번으로 조회
+  (공백/대소문자/전각 문자 차이 무시: "PLATINUM (스카이패스)" == "PLATINUM(스카이패스)")
+- 카드별 priority_rank / sort_key 기록 → 프론트엔드는 이름 비교 없이 sort_key만으로 정렬
+- 추천 탭 고정 카드(featured_cards)도 같은 테이블로 조회
+- 데이터에서 찾지 못한 우선순위 카드 이름 보고
+
+sort_key 규칙 (implementation_plan.md "우선순위 적용 로직"):
+    우선순위 카드: rank (1 ~ 49)
+    나머지 카드: NON_PRIORITY_BASE + 국내 연회비 (연회비 정보 없으면 맨 뒤)
+
+사용법:
+    python scripts/priority.py                  # samsung_cards.json에 priority_rank/sort_key 기록
+    python scripts/priority.py --output -       # stdout으로 출력
+"""
+import json
+import re
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+
+from data_io import build_parser, info_stream, load_cards, parse_io_args, save_data
+
+PRIORITY_PATH = Path(__file__).parent.parent / "data" / "priority_cards.json"
+
+NON_PRIORITY_BASE = 1000          # 우선순위 카드(rank)보다 항상 뒤
+UNKNOWN_FEE = 10_000_000          # 연회비 정보 없는 카드는 맨 뒤
+
+SPACE_RE = re.compile(r'\s+')
+
+
+def normalize_name(name: str) -> str:
+    """조회용 카드 이름 (전각 → 반각, 공백 제거, 소문자)"""
+    return SPACE_RE.sub('', unicodedata.normalize('NFKC', name)).lower()
+
+
+class PriorityTable:
+    """정규화된 카드 이름 → 우선순위/색상 조회 테이블"""
+
+    def __init__(self, data: dict):
+        self.ranks = {}
+        self.names = {}
+        for item in data.get("priority_cards", []):
+            key = normalize_name(item["name"])
+            self.ranks.setdefault(key, item["rank"])
+            self.names.setdefault(key, item["name"])
+
+        self.colors = {}
+        for name, pair in data.get("card_colors", {}).items():
+            if not name.startswith("_"):
+                self.colors[normalize_name(name)] = [pair["primary"], pair["secondary"]]
+
+        # 추천 탭 고정 카드 (순서 유지)
+        self.featured = [normalize_name(name) for name in data.get("featured_cards", {}).get("names", [])]
+
+        # card-gorilla 이름 → 네이버 이름 (정규화 후 같은 항목은 생략)
+        self.mapping = {}
+        for source, target in data.get("name_mapping", {}).items():
+            if not source.startswith("_") and normalize_name(source) != normalize_name(target):
+                self.mapping[normalize_name(source)] = normalize_name(target)
+
+    @classmethod
+    def load(cls, path: Path = PRIORITY_PATH) -> "PriorityTable":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def key(self, card_name: str) -> str:
+        key = normalize_name(card_name)
+        return self.mapping.get(key, key)
+
+    def rank(self, card_name: str) -> int | None:
+        return self.ranks.get(self.key(card_name))
+
+    def card_colors(self, card_name: str) -> list[str] | None:
+        """[primary, secondary] (없으면 None)"""
+        return self.colors.get(self.key(card_name))
+
+    def featured_rank(self, card_name: str) -> int | None:
+        """추천 탭 노출 순서 (0부터, 추천 카드가 아니면 None)"""
+        key = self.key(card_name)
+        return self.featured.index(key) if key in self.featured else None
+
+    def unmatched(self, card_names) -> list[str]:
+        """카드 데이터에서 찾지 못한 우선순위 카드 이름 (순위 순)"""
+        matched = {self.key(name) for name in card_names}
+        return [self.names[key] for key in sorted(self.ranks, key=self.ranks.get) if key not in matched]
+
+
+@lru_cache(maxsize=1)
+def priority_table() -> PriorityTable:
+    """프로세스당 한 번만 로드 (파이프라인 워커 포함)"""
+    return PriorityTable.load()
+
+
+def sort_key(rank: int | None, card: dict) -> int:
+    if rank is not None:
+        return rank
+    fee = (card.get("annual_fee") or {}).get("domestic")
+    return NON_PRIORITY_BASE + (fee if fee is not None else UNKNOWN_FEE)
+
+
+def apply_priority(card):
+    """카드에 priority_rank / sort_key 추가 (파이프라인 단계)"""
+    rank = priority_table().rank(card["name"])
+    card["priority_rank"] = rank
+    card["sort_key"] = sort_key(rank, card)
+
+
+def print_priority_report(cards: list[dict], out):
+    table = priority_table()
+    matched = sum(1 for card in cards if card.get("priority_rank") is not None)
+    unmatched = table.unmatched(card["name"] for card in cards)
+    print(f"우선순위 매칭: {matched}/{len(cards)}개 카드 (우선순위 목록 {len(table.ranks)}개)", file=out)
+    if unmatched:
+        print(f"  - 데이터에 없는 우선순위 카드 {len(unmatched)}개:", file=out)
+        for name in unmatched:
+            print(f"    {table.ranks[normalize_name(name)]:>2}. {name}", file=out)
+
+
+def main(argv=None):
+    args = parse_io_args(build_parser("네이버 우선순위/정렬 키 추가"), argv)
+    out = info_stream(args.output)
+
+    data = load_cards(args.input)
+    for card in data["cards"]:
+        apply_priority(card)
+    save_data(data, args.output)
+
+    print(f"완료: {len(data['cards'])}개 카드에 priority_rank/sort_key 추가됨", file=out)
+    print_priority_report(data["cards"], out)
+
+
+if __name__ == "__main__":
+    main()
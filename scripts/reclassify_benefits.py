@@ -4,68 +4,23 @@
 - 정확한 요약 생성
 - 중복 제거
 """
-import json
 import re
 
+from categorizer import RECLASSIFY_CATEGORIZER
+from data_io import build_parser, info_stream, load_cards, parse_io_args, save_data
+from memo import memoize
+
 def detect_category(desc, detail, original_cat):
     """description에서 올바른 카테고리 추출"""
-    text = (desc + ' ' + (detail or '')).lower()
-    
-    # 커피/카페
-    if any(k in text for k in ['스타벅스', '투썸', '이디야', '메가커피', '커피', '카페']):
-        return '커피'
-    
-    # 스트리밍/OTT
-    if any(k in text for k in ['넷플릭스', '유튜브', '디즈니', '티빙', '웨이브', 'ott', '디지털콘텐츠']):
-        return '스트리밍'
-    
-    # 영화
-    if any(k in text for k in ['cgv', '롯데시네마', '메가박스', '영화']):
-        return '영화'
-    
-    # 쇼핑
-    if any(k in text for k in ['쿠팡', '네이버', 'ssg', 'g마켓', '옥션', '11번가', '온라인쇼핑', '쇼핑몰', '마트', '이마트', '롯데마트', '편의점']):
-        return '쇼핑'
+    text = desc + ' ' + (detail or '')
     
-    # 배달
-    if any(k in text for k in ['배달의민족', '배민', '쿠팡이츠', '요기요', '배달앱']):
-        return '배달'
-    
-    # 주유
-    if any(k in text for k in ['주유', 'sk에너지', 'gs칼텍스', 's-oil', '오일뱅크']):
-        return '주유'
-    
-    # 통신
-    if any(k in text for k in ['통신', 'skt', 'kt', 'lg u+', '이동통신', '인터넷', '휴대폰']):
-        return '통신'
-    
-    # 교통
-    if any(k in text for k in ['대중교통', '버스', '지하철', '택시', 'ktx', '고속버스', '철도']):
-        return '교통'
-    
-    # 항공/마일리지
-    if any(k in text for k in ['마일리지', '스카이패스', '항공', '라운지', '아시아나', '대한항공']):
-        return '항공'
-    
-    # 해외
-    if any(k in text for k in ['해외']):
-        return '해외'
-    
-    # 교육
-    if any(k in text for k in ['학원', '교육', '인터넷강의', '학습']):
-        return '교육'
-    
-    # 의료
-    if any(k in text for k in ['병원', '의료', '약국', '동물병원']):
-        return '의료'
-    
-    # 관리비
-    if any(k in text for k in ['관리비', '아파트']):
-        return '생활'
+    # 커피 > 스트리밍 > 영화 > 쇼핑 > 배달 > 주유 > 통신 > 교통 > 항공 > 해외 > 교육 > 의료 > 생활 순
+    category = RECLASSIFY_CATEGORIZER.categorize(text)
     
     # 기본: 원본 사용하거나 '혜택'
-    return original_cat if original_cat else '혜택'
+    return category or original_cat or '혜택'
 
+@memoize()
 def extract_target(desc, category):
     """description에서 대상 추출"""
     text = desc.lower()
@@ -224,45 +179,47 @@ def process_benefit(benefit):
         'is_select_option': is_select
     }
 
-def process_all_cards():
+def reclassify_card(card):
+    """카드에 display_benefits 추가 (파이프라인 단계)"""
+    processed = []
+    
+    for benefit in card.get('benefits', []):
+        result = process_benefit(benefit)
+        if result:
+            processed.append(result)
+    
+    # 중복 제거 (같은 summary)
+    seen = set()
+    unique = []
+    for p in processed:
+        if p['summary'] not in seen:
+            seen.add(p['summary'])
+            unique.append(p)
+    
+    card['display_benefits'] = unique
+
+def process_all_cards(argv=None):
     """모든 카드 처리"""
-    json_path = r"c:\Users\MADUP\Documents\seokmin\website_samsungcard_recommend\data\samsung_cards.json"
+    args = parse_io_args(build_parser("혜택 데이터 재분류"), argv)
+    out = info_stream(args.output)
     
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_cards(args.input)
     
     for card in data['cards']:
-        benefits = card.get('benefits', [])
-        processed = []
-        
-        for benefit in benefits:
-            result = process_benefit(benefit)
-            if result:
-                processed.append(result)
-        
-        # 중복 제거 (같은 summary)
-        seen = set()
-        unique = []
-        for p in processed:
-            if p['summary'] not in seen:
-                seen.add(p['summary'])
-                unique.append(p)
-        
-        card['display_benefits'] = unique
+        reclassify_card(card)
     
     # 저장
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_data(data, args.output)
     
-    print(f"완료: {len(data['cards'])}개 카드 혜택 재분류")
+    print(f"완료: {len(data['cards'])}개 카드 혜택 재분류", file=out)
     
     # 샘플 확인
     samples = ['삼성카드 taptap O', '삼성 iD SELECT ALL 카드', '모니모카드']
     for card in data['cards']:
         if card['name'] in samples:
-            print(f"\n=== {card['name']} ===")
+            print(f"\n=== {card['name']} ===", file=out)
             for b in card.get('display_benefits', [])[:6]:
-                print(f"  [{b['category']}] {b['summary']}")
+                print(f"  [{b['category']}] {b['summary']}", file=out)
 
 if __name__ == "__main__":
     process_all_cards()
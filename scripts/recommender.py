@@ -0,0 +1,474 @@
+"""
+소비 패턴 기반 카드 추천 엔진 (NumPy 벡터화)
+- 월 소비 금액(카테고리 또는 가맹점 이름별)을 받아 107개 카드의 연간 순혜택(절약액 - 연회비)으로 순위 계산
+- 카드 데이터는 로드 시 한 번만 파싱해서 행렬로 만들어 둠 (점수 계산 중에는 텍스트를 보지 않음)
+    rates   (G x K): 한도 그룹별 소비 열(카테고리 + 가맹점) 할인율
+    tiers   (G x L): 한도 그룹별 전월 실적 구간 하한 / 월 한도
+    members (G x N): 한도 그룹 → 카드 (0/1)
+    선택 세트 옵션도 같은 방식의 행렬로 옵션별 값을 계산한 뒤 세트마다 최댓값만 더함
+  G = 한도 그룹 수 (같은 "통합" 한도를 공유하는 혜택은 한 그룹), K = 소비 열 수, N = 카드 수
+- 한 사람 점수 = rates @ 소비 → 구간별 한도 적용 → members 로 카드별 합산 (여러 명이면 행렬 곱 한 번)
+
+점수 규칙:
+    - 할인율(%) 혜택만 계산 (건당 정액 할인, 마일리지 적립, 리터당 할인은 제외), 포인트 적립은 1포인트 = 1원
+    - 전월 실적 조건은 한 달 소비 합계로 판단 (혜택 문구에 조건이 없으면 카드의 min_spending)
+    - 월 한도는 benefit.monthly_caps 의 전월 실적 구간별 한도 (monthly_caps.py), 한도 문구가 없으면 UNKNOWN_CAP
+    - 선택형(택 1) 혜택은 선택 세트(choice_sets.py)마다 프로필에 가장 유리한 옵션 하나만 계산
+    - 같은 카테고리에 여러 혜택이 있으면 한도 그룹이 다를 때 중복 적용으로 계산
+    - 적용 대상은 혜택 대상 문구(적립 수단 이름 제외)로 판단 (target_scope)
+      할인율이 여러 개면 할인율 묶음마다 대상을 나눔 ("A 5%, B 3%", "A·B 3%·1%" → A 3%, B 1%)
+      특정 가맹점 혜택(SSG.COM, 스타벅스 …)은 프로필에서 그 가맹점을 적은 금액에만,
+      업종 혜택(커피전문점, 온라인쇼핑몰 …)은 카테고리 전체에 적용하고 대상을 알 수 없는 혜택은 제외
+    - "국내 가맹점" 혜택은 해외를 제외한 전체, "국내외 가맹점"은 전체 소비에 적용
+
+사용법:
+    python scripts/recommender.py --profile '{"커피": 50000, "교통": 60000, "쿠팡": 200000}'
+    python scripts/recommender.py --bench 100000   # 1명 순위 지연 시간 + 10만 명 일괄 처리량
+
+필요 패키지: numpy
+"""
+import argparse
+import json
+import math
+import re
+import time
+from pathlib import Path
+
+import numpy as np
+
+from categorizer import DISPLAY_CATEGORIZER, DISPLAY_RULES
+from choice_sets import group_choice_sets, option_benefit_indexes
+from data_io import DATA_PATH, load_data
+from discount_parser import parse_discount_text, parse_monthly_caps
+
+OTHER = "기타"
+OVERSEAS = "해외"
+CATEGORIES = [category for category, _ in DISPLAY_RULES] + [OTHER]
+
+# 가맹점 열: 이 가맹점으로 제한된 혜택은 프로필에서 같은 가맹점을 적은 금액에만 적용
+# (카테고리 전체 혜택은 그 카테고리의 가맹점 열에도 적용, 간편결제는 결제 수단 조건이라 기타로 둠)
+MERCHANTS = [
+    ("커피", "스타벅스", ["스타벅스"]), ("커피", "투썸", ["투썸"]), ("커피", "이디야", ["이디야"]),
+    ("커피", "메가커피", ["메가커피"]),
+    ("스트리밍", "넷플릭스", ["넷플릭스"]), ("스트리밍", "유튜브", ["유튜브"]), ("스트리밍", "디즈니", ["디즈니"]),
+    ("스트리밍", "티빙", ["티빙"]), ("스트리밍", "웨이브", ["웨이브"]),
+    ("영화", "CGV", ["cgv"]), ("영화", "롯데시네마", ["롯데시네마"]), ("영화", "메가박스", ["메가박스"]),
+    ("배달", "배달의민족", ["배달의민족", "배민"]), ("배달", "쿠팡이츠", ["쿠팡이츠"]), ("배달", "요기요", ["요기요"]),
+    ("통신", "SKT", ["skt"]), ("통신", "KT", ["kt"]), ("통신", "LG U+", ["lg u+", "lgu+"]),
+    ("쇼핑", "쿠팡", ["쿠팡"]), ("쇼핑", "네이버", ["네이버"]), ("쇼핑", "SSG", ["ssg"]), ("쇼핑", "G마켓", ["g마켓"]),
+    ("쇼핑", "옥션", ["옥션"]), ("쇼핑", "11번가", ["11번가"]), ("쇼핑", "이마트", ["이마트"]),
+    ("쇼핑", "롯데마트", ["롯데마트"]),
+    ("주유", "SK에너지", ["sk에너지", "sk주유"]), ("주유", "GS칼텍스", ["gs칼텍스"]), ("주유", "S-OIL", ["s-oil"]),
+    ("주유", "현대오일뱅크", ["오일뱅크"]),
+    ("항공", "대한항공", ["대한항공", "스카이패스"]), ("항공", "아시아나", ["아시아나"]),
+    (OTHER, "삼성페이", ["삼성페이", "삼성 페이"]), (OTHER, "네이버페이", ["네이버페이"]),
+    (OTHER, "카카오페이", ["카카오페이"]), (OTHER, "SSGPAY", ["ssgpay", "ssg pay"]), (OTHER, "PAYCO", ["payco", "페이코"]),
+]
+MERCHANT_KEYWORDS = {keyword: name for _, name, keywords in MERCHANTS for keyword in keywords}
+MERCHANT_CATEGORY = {name: category for category, name, _ in MERCHANTS}
+# 영문 키워드는 앞뒤가 영문자가 아닐 때만 (kt ↔ ktx, ssg ↔ ssgpay)
+MERCHANT_RE = re.compile("|".join(
+    rf"(?<![a-z]){re.escape(keyword)}(?![a-z])" if keyword.isascii() else re.escape(keyword)
+    for keyword in sorted(MERCHANT_KEYWORDS, key=len, reverse=True)))
+
+# 카테고리 전체에 적용되는 일반 업종어 (DISPLAY_RULES 중 가맹점 키워드가 아닌 것 + 보충)
+EXTRA_TERMS = {"스트리밍": ["스트리밍"], "쇼핑": ["쇼핑", "할인점", "슈퍼마켓"], "교통": ["교통"]}
+GENERIC_TERMS = {keyword: category for category, keywords in DISPLAY_RULES
+                 for keyword in keywords + EXTRA_TERMS.get(category, []) if keyword not in MERCHANT_KEYWORDS}
+# 업종어 앞뒤로 붙어도 범위가 그대로인 말 (온라인쇼핑몰, 커피전문점, 이동통신요금) - 그 밖의 말이 붙으면
+# 특정 업종으로 좁혀진 것으로 보고 제외 (반려동물쇼핑몰, 유선통신)
+GENERIC_TERM_RE = re.compile(r"(?:온라인|오프라인)?(%s)(?:전문점|요금|이용료|서비스)?" % "|".join(
+    re.escape(keyword) for keyword in sorted(GENERIC_TERMS, key=len, reverse=True)))
+
+# 적립 수단 이름 (혜택 대상이 아님: "해외 1.5% SSG MONEY 적립"은 쇼핑이 아니라 해외 혜택)
+REWARD_CURRENCY_RE = re.compile(
+    r"SSG\s*MONEY|네이버페이\s*포인트|카카오페이\s*포인트|삼성전자\s*포인트|PAYCO\s*포인트|CJ\s*ONE\s*포인트|"
+    r"W\s*POINT|TR\s*CASH|모니머니\s*리워드|신백리워드\s*포인트|멤버십\s*리워즈|멤버십\s*포인트|"
+    r"빅포인트|번개포인트|주유포인트|신세계포인트|솜(?=\s*(?:추가\s*)?적립)", re.IGNORECASE)
+TAG_RE = re.compile(r"\[[^\]]*\]")
+# 할인율 묶음: "3%", "3%·1%", "5%/7%", "0.5% ~ 3%" (묶음 하나 = 대상 문구 하나)
+RATE_GROUP_RE = re.compile(r"\d+(?:\.\d+)?\s*%(?:\s*[·/,~]\s*\d+(?:\.\d+)?\s*%)*")
+RATE_VALUE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*%")
+ITEM_SPLIT_RE = re.compile(r"[/·,、.]")
+WORD_SPLIT_RE = re.compile(r"[\s()]+")
+
+SPEND_KEYS = CATEGORIES + [name for _, name, _ in MERCHANTS]
+DOMESTIC = [key for key in SPEND_KEYS if key != OVERSEAS]
+
+UNKNOWN_CAP = 10000          # 한도 문구를 찾지 못한 혜택의 월 한도 (원)
+BATCH_CHUNK = 4096           # 일괄 계산 시 한 번에 올리는 프로필 수 (G x L x 4096 임시 배열 크기 제한)
+
+
+def category_keys(category: str) -> list[str]:
+    """카테고리 전체 혜택이 적용되는 소비 열 (카테고리 + 그 카테고리의 가맹점)"""
+    return [category] + [name for name, owner in MERCHANT_CATEGORY.items() if owner == category]
+
+
+def benefit_segments(desc: str) -> list[tuple[str, list[float]]]:
+    """혜택 문구 → [(대상 문구, [할인율 %, ...]), ...] 할인율 묶음마다 한 구간 (머리표/적립 수단은 지움)
+
+    "국내 가맹점 1%, 생활 편의 영역 1.2%" → [("국내 가맹점", [1.0]), (", 생활 편의 영역", [1.2])]
+    - 여러 줄이면 묶음 앞 첫 줄은 앞 구간의 꼬리("할인", "적립")라 제외
+    - 괄호로 시작하는 줄(대상 목록)은 바로 앞 구간 대상에 붙임
+    - 할인율이 없으면 첫 줄(+ 괄호 줄)이 대상, 할인율 목록은 비어 있음
+    """
+    text = REWARD_CURRENCY_RE.sub(" ", TAG_RE.sub(" ", desc))
+    segments = []
+    start = 0
+    for match in RATE_GROUP_RE.finditer(text):
+        lines = text[start:match.start()].split("\n")
+        if segments and len(lines) > 1:
+            lines = lines[1:]
+            segments[-1][0].extend(line for line in lines if line.strip().startswith("("))
+            lines = [line for line in lines if not line.strip().startswith("(")]
+        segments.append([lines, [float(value) for value in RATE_VALUE_RE.findall(match.group())]])
+        start = match.end()
+    tail = text[start:].split("\n")
+    brackets = [line for line in tail[1:] if line.strip().startswith("(")]
+    if segments:
+        segments[-1][0].extend(brackets)
+    else:
+        segments = [[tail[:1] + brackets, []]]
+    return [(" / ".join(line for line in lines if line.strip()), rates) for lines, rates in segments]
+
+
+def target_scope(target: str) -> list[str] | None:
+    """대상 문구가 적용되는 소비 열 (적용 대상을 알 수 없으면 None → 계산 제외)
+
+    - 간편결제 조건(삼성페이로 결제 시 …)이 있으면 그 결제 수단 열에만 적용
+    - 대상 목록(/ · , 구분) 항목마다: 가맹점 이름 → 그 가맹점 열만, 일반 업종어 → 카테고리 전체,
+      "국내 가맹점" → 해외를 제외한 전체, "국내외/모든 가맹점" → 전체
+    - 어느 쪽도 아닌 항목(동물병원, 반려동물쇼핑몰, 헬스&뷰티, 멤버십 …)은 적용하지 않음
+    """
+    target = target.lower()
+    payments = [MERCHANT_KEYWORDS[m] for m in MERCHANT_RE.findall(target)
+                if MERCHANT_CATEGORY[MERCHANT_KEYWORDS[m]] == OTHER]
+    if payments:
+        return list(dict.fromkeys(payments))
+
+    scope = {}
+    for item in ITEM_SPLIT_RE.split(target):
+        merchants = [MERCHANT_KEYWORDS[m] for m in MERCHANT_RE.findall(item)]
+        if merchants:
+            scope.update(dict.fromkeys(merchants))
+            continue
+        if '가맹점' in item or item.strip() in ('국내', '국내외'):
+            if '국내외' in item or '모든' in item:
+                scope.update(dict.fromkeys(SPEND_KEYS))
+                continue
+            if '국내' in item:
+                scope.update(dict.fromkeys(DOMESTIC))
+                continue
+        if '멤버십' in item:      # "온라인쇼핑몰 멤버십" = 멤버십 이용료만 (쇼핑 전체가 아님)
+            continue
+        for word in WORD_SPLIT_RE.split(item):
+            match = GENERIC_TERM_RE.fullmatch(word)
+            if match:
+                scope.update(dict.fromkeys(category_keys(GENERIC_TERMS[match.group(1)])))
+    return list(scope) or None
+
+
+def segment_pairs(target: str, rates: list[float]) -> list[tuple[str, float]]:
+    """구간 하나 → [(대상, 할인율 %)]
+    대상 항목 수와 할인율 수가 같으면 항목마다 자기 할인율 ("간편결제·해외 3%·1%" → 해외 1%),
+    아니면 실적 구간별 할인율("대중교통 1%·2%")로 보고 첫 값만
+    """
+    items = [item for item in ITEM_SPLIT_RE.split(target) if item.strip()]
+    if len(rates) > 1 and len(items) == len(rates):
+        return list(zip(items, rates))
+    return [(target, rates[0])] if rates else []
+
+
+def benefit_scope(desc: str) -> list[str] | None:
+    """혜택이 적용되는 소비 열 전체 (구간별 대상의 합, 모르면 None)"""
+    scope = {}
+    for target, _ in benefit_segments(desc):
+        scope.update(dict.fromkeys(target_scope(target) or []))
+    return list(scope) or None
+
+
+def benefit_rates(desc: str) -> dict[str, float]:
+    """소비 열 → 할인/적립률 (0~1), 계산 대상이 아니면 빈 dict
+    할인율이 여러 개인 문구는 구간/항목별로 나눠 각 대상에 해당 할인율만 적용
+    """
+    parsed = parse_discount_text(desc)
+    if parsed['mileage'] or not (parsed['discount'] or parsed['accrual']):
+        return {}
+    rates = {}
+    for target, values in benefit_segments(desc):
+        for item, value in segment_pairs(target, values):
+            for key in target_scope(item) or []:
+                rates[key] = max(rates.get(key, 0), value / 100)
+    return rates
+
+
+def cap_groups(card: dict, indexes) -> list[dict]:
+    """카드의 혜택 중 indexes 에 해당하는 혜택을 한도 그룹으로 묶음
+
+    반환: [{"rates": {카테고리: 할인율}, "tiers": [[하한, 한도], ...]}, ...]
+    """
+    benefits = card.get('benefits', [])
+    groups = {}
+    for i in indexes:
+        benefit = benefits[i]
+        desc = benefit.get('description', '') or ''
+        detail = benefit.get('detail', '') or ''
+        if benefit.get('title') == '유의사항' or '유의사항' in desc:
+            continue
+        rates = benefit_rates(desc)
+        if not rates:
+            continue
+
+        # pipeline caps 단계에서 저장한 표 사용 (없는 입력만 직접 파싱)
+        caps = benefit.get('monthly_caps') or parse_monthly_caps(detail)
+        prerequisite = caps['prerequisite']
+        if prerequisite is None:
+            prerequisite = card.get('min_spending') or 0
+        if caps['unlimited']:
+            tiers = [[prerequisite, float('inf')]]
+        elif caps['tiers']:
+            tiers = caps['tiers']
+        else:
+            tiers = [[prerequisite, UNKNOWN_CAP]]
+
+        # "통합" 한도는 구간표가 같은 혜택끼리 한도를 나눠 씀
+        key = ('통합', tuple(map(tuple, tiers))) if '통합' in detail else ('개별', i)
+        group = groups.setdefault(key, {"rates": {}, "tiers": tiers})
+        for key, rate in rates.items():
+            group["rates"][key] = max(group["rates"].get(key, 0), rate)
+    return list(groups.values())
+
+
+def card_choice_sets(card: dict) -> list[dict]:
+    """pipeline choices 단계 결과 (없는 입력만 직접 구성)"""
+    return card['choice_sets'] if 'choice_sets' in card else group_choice_sets(card.get('benefits', []))
+
+
+def card_cap_groups(card: dict) -> list[dict]:
+    """선택 세트에 속하지 않은 기본 혜택의 한도 그룹"""
+    excluded = option_benefit_indexes(card_choice_sets(card))
+    indexes = [i for i, benefit in enumerate(card.get('benefits', []))
+               if i not in excluded and not benefit.get('is_select_option')]
+    return cap_groups(card, indexes)
+
+
+class CapGroups:
+    """한도 그룹 행렬: 할인율 (G x K), 실적 구간 하한 / 월 한도 (G x L)"""
+
+    def __init__(self, groups: list[dict], category_index: dict[str, int]):
+        depth = max((len(g["tiers"]) for g in groups), default=1)
+        self.rates = np.zeros((len(groups), len(category_index)))
+        # 빈 구간은 하한 inf → 절대 해당되지 않음
+        self.tier_floor = np.full((len(groups), depth), np.inf)
+        self.tier_cap = np.zeros((len(groups), depth))
+        for g, group in enumerate(groups):
+            for category, rate in group["rates"].items():
+                self.rates[g, category_index[category]] = rate
+            for t, (floor, cap) in enumerate(group["tiers"]):
+                self.tier_floor[g, t] = floor
+                self.tier_cap[g, t] = cap
+
+    def __len__(self):
+        return len(self.rates)
+
+    def monthly(self, spend: np.ndarray, total: np.ndarray) -> np.ndarray:
+        """(P, K) 월 소비, (P,) 소비 합계 → 그룹별 한도 적용 월 절약액 (P, G)"""
+        raw = spend @ self.rates.T
+        eligible = self.tier_floor[None, :, :] <= total[:, None, None]      # (P, G, L)
+        cap = np.where(eligible, self.tier_cap[None, :, :], 0.0).max(axis=2)
+        return np.minimum(raw, cap)
+
+
+class Recommender:
+    """카드 데이터를 행렬로 만들어 두고 소비 프로필별 연간 순혜택 계산
+
+    기본 혜택: 한도 그룹 → 카드 합산 (members)
+    선택 세트: 옵션마다 한도 그룹 → 옵션 합산 (option_members) → 세트별 옵션 값 중 최댓값
+               (set_options: 세트 x 최대 옵션 수 인덱스 표, 빈 칸은 값 0인 가상 옵션)
+               → 카드 합산 (set_members)
+    """
+
+    def __init__(self, cards: list[dict]):
+        self.cards = cards
+        self.category_index = {key: k for k, key in enumerate(SPEND_KEYS)}
+        self.annual_fee = np.array([(card.get('annual_fee') or {}).get('domestic') or 0
+                                    for card in cards], dtype=np.float64)
+
+        groups, owners = [], []
+        option_groups, option_owners = [], []
+        self.choice_sets = []          # [(카드 인덱스, 세트 이름, [옵션 이름, ...])]
+        set_options, set_owners = [], []
+        for n, card in enumerate(cards):
+            for group in card_cap_groups(card):
+                groups.append(group)
+                owners.append(n)
+            for choice_set in card_choice_sets(card):
+                option_ids = []
+                for option in choice_set["options"]:
+                    option_id = len(option_ids) + sum(len(ids) for ids in set_options)
+                    for group in cap_groups(card, option["benefits"]):
+                        option_groups.append(group)
+                        option_owners.append(option_id)
+                    option_ids.append(option_id)
+                set_options.append(option_ids)
+                set_owners.append(n)
+                self.choice_sets.append((n, choice_set["name"], [o["name"] for o in choice_set["options"]]))
+
+        self.base = CapGroups(groups, self.category_index)
+        self.members = np.zeros((len(groups), len(cards)))
+        self.members[np.arange(len(groups)), owners] = 1.0
+
+        option_count = sum(len(ids) for ids in set_options)
+        self.options = CapGroups(option_groups, self.category_index)
+        self.option_members = np.zeros((len(option_groups), option_count))
+        self.option_members[np.arange(len(option_groups)), option_owners] = 1.0
+        width = max((len(ids) for ids in set_options), default=1)
+        self.set_options = np.full((len(set_options), width), option_count)
+        for s, ids in enumerate(set_options):
+            self.set_options[s, :len(ids)] = ids
+        self.set_members = np.zeros((len(set_options), len(cards)))
+        self.set_members[np.arange(len(set_options)), set_owners] = 1.0
+
+    def option_values(self, spend: np.ndarray, total: np.ndarray) -> np.ndarray:
+        """선택 세트별 옵션 월 절약액 (P, S, 최대 옵션 수), 빈 칸은 0"""
+        values = self.options.monthly(spend, total) @ self.option_members          # (P, O)
+        values = np.concatenate([values, np.zeros((len(values), 1))], axis=1)
+        return values[:, self.set_options]
+
+    @classmethod
+    def from_file(cls, path: Path = DATA_PATH) -> "Recommender":
+        return cls(load_data(str(path))["cards"])
+
+    def spend_key(self, key: str) -> str:
+        """프로필 키 → 소비 열 (알려진 가맹점은 가맹점 열, 그 밖에는 카테고리, 모르면 기타)"""
+        if key in self.category_index:
+            return key
+        match = MERCHANT_RE.search(key.lower())
+        if match:
+            return MERCHANT_KEYWORDS[match.group()]
+        return DISPLAY_CATEGORIZER.categorize(key) or OTHER
+
+    def profile_vector(self, profile: dict) -> np.ndarray:
+        """{카테고리 또는 가맹점 이름: 월 금액} → 소비 열별 월 소비 벡터"""
+        spend = np.zeros(len(SPEND_KEYS))
+        for key, amount in profile.items():
+            spend[self.category_index[self.spend_key(key)]] += amount
+        return spend
+
+    def score(self, spend: np.ndarray) -> np.ndarray:
+        """월 소비 (K,) 또는 (P, K) → 카드별 연간 순혜택 (N,) 또는 (P, N)"""
+        single = spend.ndim == 1
+        spend = np.atleast_2d(spend)
+        total = spend.sum(axis=1)
+        monthly = self.base.monthly(spend, total) @ self.members                        # (P, N)
+        # 선택 세트는 옵션 값 배열의 최댓값 (사용자에게 가장 유리한 옵션을 고른다고 가정)
+        monthly += self.option_values(spend, total).max(axis=2) @ self.set_members
+        net = monthly * 12 - self.annual_fee
+        return net[0] if single else net
+
+    def score_batch(self, spend: np.ndarray, chunk: int = BATCH_CHUNK) -> np.ndarray:
+        """여러 프로필 (P, K) → (P, N), 임시 배열 크기를 chunk 단위로 제한"""
+        out = np.empty((len(spend), len(self.cards)))
+        for start in range(0, len(spend), chunk):
+            out[start:start + chunk] = self.score(spend[start:start + chunk])
+        return out
+
+    def top_cards(self, spend: np.ndarray, top: int = 5) -> tuple[np.ndarray, np.ndarray]:
+        """(P, K) → 순혜택 상위 top개 (카드 인덱스, 연간 순혜택), 각각 (P, top), 높은 순
+        (전체 정렬 대신 argpartition 사용 - top 경계에서 값이 같은 카드는 어느 쪽이 뽑힐지 보장하지 않음)
+        """
+        net = self.score_batch(np.atleast_2d(spend))
+        top = min(top, net.shape[1])
+        best = np.argpartition(-net, top - 1, axis=1)[:, :top]
+        values = np.take_along_axis(net, best, axis=1)
+        order = np.lexsort((best, -values), axis=1)  # 같은 값이면 카드 순서대로 (recommend와 동일)
+        return np.take_along_axis(best, order, axis=1), np.take_along_axis(values, order, axis=1)
+
+    def recommend(self, profile: dict, top: int = 5) -> list[dict]:
+        """소비 프로필 → 상위 카드 목록"""
+        spend = self.profile_vector(profile)
+        net = self.score(spend)
+        picks = self.option_values(spend[None, :], spend.sum()[None])[0].argmax(axis=1)
+        result = []
+        for n in np.argsort(-net, kind='stable')[:top]:
+            card = self.cards[n]
+            result.append({
+                "index": int(n),                # cards 목록 내 위치
+                "id": card["id"],
+                "name": card["name"],
+                "annual_saving": int(round(net[n] + self.annual_fee[n])),
+                "annual_fee": int(self.annual_fee[n]),
+                "net_value": int(round(net[n])),
+                "choices": {name: options[picks[s]]
+                            for s, (owner, name, options) in enumerate(self.choice_sets) if owner == n},
+            })
+        return result
+
+
+def random_profiles(count: int, seed: int = 0) -> np.ndarray:
+    """벤치마크용 가상 월 소비 (카테고리별 0 ~ 30만원, 전체 소비는 기타에 몰림, 가맹점 열은 0)"""
+    rng = np.random.default_rng(seed)
+    spend = np.zeros((count, len(SPEND_KEYS)))
+    spend[:, :len(CATEGORIES)] = rng.gamma(shape=1.0, scale=50000, size=(count, len(CATEGORIES)))
+    spend[:, len(CATEGORIES) - 1] = rng.gamma(shape=2.0, scale=300000, size=count)
+    return np.round(spend, -3)
+
+
+def benchmark(recommender: Recommender, count: int, repeat: int = 1000):
+    print(f"카드 {len(recommender.cards)}개 / 한도 그룹 {len(recommender.base)}개 / "
+          f"선택 세트 {len(recommender.choice_sets)}개 (옵션 한도 그룹 {len(recommender.options)}개) / "
+          f"소비 열 {len(SPEND_KEYS)}개")
+
+    spend = random_profiles(1)[0]
+    recommender.score(spend)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        np.argsort(-recommender.score(spend))
+    per_profile = (time.perf_counter() - start) / repeat
+    print(f"  - 1명 순위 계산: {per_profile * 1e6:.0f}µs ({repeat}회 평균)")
+
+    batch = random_profiles(count, seed=1)
+    start = time.perf_counter()
+    top, _ = recommender.top_cards(batch, top=5)
+    elapsed = time.perf_counter() - start
+    print(f"  - {count:,}명 일괄 상위 5개: {elapsed:.2f}초 ({count / elapsed:,.0f}명/초)")
+
+    # 일괄 결과가 1명씩 계산한 결과와 같은지 일부 확인
+    for i in range(0, count, max(1, count // 50)):
+        net = recommender.score(batch[i])
+        assert np.allclose(net[top[i]], np.sort(net)[::-1][:5]), "일괄/단건 결과 불일치"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="소비 패턴 기반 카드 추천")
+    parser.add_argument("--input", type=Path, default=DATA_PATH, help="카드 데이터 JSON 경로")
+    parser.add_argument("--profile", type=json.loads,
+                        help='월 소비 JSON (예: \'{"커피": 50000, "쿠팡": 200000}\')')
+    parser.add_argument("--top", type=int, default=5, help="추천 카드 수")
+    parser.add_argument("--bench", type=int, metavar="N", help="1명 / N명 일괄 처리 시간 측정")
+    args = parser.parse_args(argv)
+
+    recommender = Recommender.from_file(args.input)
+    if args.bench:
+        benchmark(recommender, args.bench)
+        return
+    if not args.profile:
+        parser.print_help()
+        return
+    # server.py /recommend 와 같은 기준
+    if not isinstance(args.profile, dict):
+        parser.error("--profile은 {카테고리: 월 금액} 객체여야 합니다")
+    if not all(isinstance(amount, (int, float)) and math.isfinite(amount) and amount >= 0
+               for amount in args.profile.values()):
+        parser.error("월 금액은 0 이상의 유한한 숫자여야 합니다")
+
+    print(f"월 소비 합계: {sum(args.profile.values()):,}원")
+    for rank, item in enumerate(recommender.recommend(args.profile, args.top), 1):
+        print(f"  {rank}. {item['name']}: 연 {item['net_value']:,}원 "
+              f"(절약 {item['annual_saving']:,}원 - 연회비 {item['annual_fee']:,}원)")
+        for set_name, option in item["choices"].items():
+            print(f"     - {set_name} 선택: {option}")
+
+
+if __name__ == "__main__":
+    main()
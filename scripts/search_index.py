@@ -0,0 +1,199 @@
+"""
+카드 혜택 전문 검색 색인 (BM25)
+- 카드 이름 + 혜택 제목/설명/상세 문구를 글자 바이그램(2글자)으로 토큰화 → 형태소 분석기 없이 한국어 부분 일치
+  ("쿠팡이츠" → 쿠팡 / 팡이 / 이츠, "스타벅스" 검색 시 "스타벅스커피"도 일치)
+- 빌드 시 역색인을 만들어 search_index.json 으로 저장 (build_frontend.py가 manifest의 해시 경로로 함께 생성 → 브라우저에서도 사용 가능)
+- 점수: BM25 (k1=1.2, b=0.75), 카드 이름은 NAME_WEIGHT배 가중
+- 로드 시 용어별 (카드, 점수 기여분) 목록을 미리 계산 → 질의 시 더하기만 수행
+
+직렬화 형식 (search_index.json):
+    {"version": 1, "k1": 1.2, "b": 0.75,
+     "docs": [detail_key, ...], "lengths": [토큰 수, ...],
+     "terms": {"바이그램": [문서 번호 차이, 빈도, 문서 번호 차이, 빈도, ...], ...}}
+    문서 번호는 오름차순 차이(delta)로 저장
+
+사용법:
+    python scripts/search_index.py --query 스타벅스           # 검색 결과 출력
+    python scripts/search_index.py --bench                    # 실제 데이터 + 100배 가상 데이터 벤치마크
+"""
+import gzip
+import heapq
+import json
+import math
+import random
+import re
+import sys
+import time
+import unicodedata
+from collections import Counter
+
+from bench_utils import percentile
+from data_io import build_parser, load_data
+
+VERSION = 1
+K1 = 1.2
+B = 0.75
+NAME_WEIGHT = 3           # 카드 이름 토큰 반복 횟수
+TOKEN_RUN_RE = re.compile(r'[0-9a-z가-힣]+')
+
+BENCH_QUERIES = ["스타벅스", "쿠팡이츠", "넷플릭스", "대중교통", "해외 결제", "주유 할인",
+                 "아시아나 마일리지", "taptap", "편의점", "배달의민족", "연회비 면제", "SELECT ALL"]
+BENCH_FACTOR = 100
+
+
+def tokenize(text: str) -> list[str]:
+    """NFKC + 소문자 → 한글/영문/숫자 연속 구간별 글자 바이그램 (1글자 구간은 그대로)"""
+    tokens = []
+    for run in TOKEN_RUN_RE.findall(unicodedata.normalize('NFKC', text).lower()):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def card_tokens(card: dict) -> list[str]:
+    tokens = tokenize(card.get('name', '')) * NAME_WEIGHT
+    for benefit in card.get('benefits', []):
+        for field in ('title', 'description', 'detail'):
+            tokens += tokenize(benefit.get(field) or '')
+    return tokens
+
+
+class SearchIndex:
+    """바이그램 역색인 + BM25 질의"""
+
+    def __init__(self, docs: list[str], lengths: list[int], postings: dict[str, tuple[list[int], list[int]]],
+                 k1: float = K1, b: float = B):
+        self.docs = docs
+        self.lengths = lengths
+        self.postings = postings          # 용어 → (문서 번호 목록, 빈도 목록)
+        self.k1 = k1
+        self.b = b
+
+        # 용어별 점수 기여분 미리 계산: idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * 길이 / 평균 길이))
+        avgdl = sum(lengths) / max(1, len(lengths))
+        norm = [k1 * (1 - b + b * length / max(avgdl, 1e-9)) for length in lengths]
+        self.impacts = {}
+        for term, (ids, tfs) in postings.items():
+            idf = math.log(1 + (len(docs) - len(ids) + 0.5) / (len(ids) + 0.5))
+            self.impacts[term] = (ids, [idf * tf * (k1 + 1) / (tf + norm[d]) for d, tf in zip(ids, tfs)])
+
+    @classmethod
+    def build(cls, cards: list[dict], keys: list[str]) -> "SearchIndex":
+        postings = {}
+        lengths = []
+        for d, card in enumerate(cards):
+            counts = Counter(card_tokens(card))
+            lengths.append(sum(counts.values()))
+            for term, tf in counts.items():
+                ids, tfs = postings.setdefault(term, ([], []))
+                ids.append(d)
+                tfs.append(tf)
+        return cls(list(keys), lengths, postings)
+
+    def to_dict(self) -> dict:
+        terms = {}
+        for term in sorted(self.postings):
+            ids, tfs = self.postings[term]
+            flat, previous = [], 0
+            for d, tf in zip(ids, tfs):
+                flat += [d - previous, tf]
+                previous = d
+            terms[term] = flat
+        return {"version": VERSION, "k1": self.k1, "b": self.b,
+                "docs": self.docs, "lengths": self.lengths, "terms": terms}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SearchIndex":
+        postings = {}
+        for term, flat in data["terms"].items():
+            ids, d = [], 0
+            for gap in flat[0::2]:
+                d += gap
+                ids.append(d)
+            postings[term] = (ids, flat[1::2])
+        return cls(data["docs"], data["lengths"], postings, data["k1"], data["b"])
+
+    def search(self, query: str, top: int = 10) -> list[tuple[str, float]]:
+        """질의 → [(detail_key, 점수), ...] 점수 내림차순"""
+        scores = {}
+        for term, qtf in Counter(tokenize(query)).items():
+            if term not in self.impacts:
+                continue
+            ids, weights = self.impacts[term]
+            for d, weight in zip(ids, weights):
+                scores[d] = scores.get(d, 0.0) + qtf * weight
+        best = heapq.nlargest(top, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [(self.docs[d], score) for d, score in best]
+
+
+def synthetic_cards(cards: list[dict], factor: int, seed: int = 0) -> list[dict]:
+    """벤치마크용 가상 카드 (카드 이름에 번호, 혜택은 전체 혜택에서 무작위 추출)"""
+    rng = random.Random(seed)
+    pool = [benefit for card in cards for benefit in card.get('benefits', [])]
+    result = []
+    for i in range(factor):
+        for card in cards:
+            count = max(1, len(card.get('benefits', [])))
+            result.append({"id": f"{card['id']}-{i}", "name": f"{card['name']} {i}",
+                           "benefits": rng.sample(pool, min(count, len(pool)))})
+    return result
+
+
+def benchmark_index(label: str, cards: list[dict], keys: list[str], repeat: int, out):
+    start = time.perf_counter()
+    index = SearchIndex.build(cards, keys)
+    build_time = time.perf_counter() - start
+
+    serialized = json.dumps(index.to_dict(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    start = time.perf_counter()
+    SearchIndex.from_dict(json.loads(serialized))
+    load_time = time.perf_counter() - start
+
+    latencies = []
+    for _ in range(repeat):
+        for query in BENCH_QUERIES:
+            start = time.perf_counter()
+            index.search(query)
+            latencies.append(time.perf_counter() - start)
+    latencies.sort()
+
+    print(f"[{label}] 카드 {len(cards):,}개 / 용어 {len(index.postings):,}개 / "
+          f"토큰 {sum(index.lengths):,}개", file=out)
+    print(f"  - 빌드 {build_time * 1000:,.0f}ms / 로드 {load_time * 1000:,.0f}ms", file=out)
+    print(f"  - 색인 크기: {len(serialized):,} bytes / gzip {len(gzip.compress(serialized, 9)):,}", file=out)
+    print(f"  - 질의 {len(latencies):,}회: p50 {percentile(latencies, 50) * 1e6:,.0f}µs / "
+          f"p99 {percentile(latencies, 99) * 1e6:,.0f}µs", file=out)
+
+
+def main(argv=None):
+    from build_frontend import detail_keys  # build_frontend가 이 모듈을 import하므로 지연 import
+
+    parser = build_parser("카드 혜택 전문 검색 (BM25)", with_output=False)
+    parser.add_argument("--query", help="검색어")
+    parser.add_argument("--top", type=int, default=10, help="출력할 카드 수")
+    parser.add_argument("--bench", action="store_true", help="실제 데이터 + 100배 가상 데이터 벤치마크")
+    args = parser.parse_args(argv)
+    out = sys.stdout
+
+    cards = load_data(args.input)["cards"]
+    keys = detail_keys(cards)
+    if args.bench:
+        benchmark_index("실제 데이터", cards, keys, repeat=100, out=out)
+        synthetic = synthetic_cards(cards, BENCH_FACTOR)
+        benchmark_index(f"가상 데이터 x{BENCH_FACTOR}", synthetic, detail_keys(synthetic), repeat=5, out=out)
+        return
+    if not args.query:
+        parser.print_help()
+        return
+
+    index = SearchIndex.build(cards, keys)
+    names = dict(zip(keys, (card["name"] for card in cards)))
+    print(f"'{args.query}' 검색 결과:", file=out)
+    for rank, (key, score) in enumerate(index.search(args.query, args.top), 1):
+        print(f"  {rank}. {names[key]} ({key}): {score:.2f}", file=out)
+
+
+if __name__ == "__main__":
+    main()
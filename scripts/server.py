@@ -0,0 +1,376 @@
+"""
+카드 조회/검색/추천 로컬 HTTP 서비스 (asyncio, 표준 라이브러리만 사용)
+- 카드 데이터를 한 번 읽어 메모리 색인(목록 + 카테고리 역색인, 검색 색인, 추천 행렬)으로 만든 뒤 JSON 응답
+    GET  /cards?category=커피        카테고리별 카드 (sort_key 순, category 없으면 전체)
+    GET  /cards/{detail_key}         카드 전체 데이터
+    GET  /search?q=스타벅스&top=10    BM25 검색 (search_index.py)
+    GET  /recommend?커피=50000&기타=800000&top=5
+    POST /recommend  {"커피": 50000, "기타": 800000}   소비 패턴 → 순혜택 순 카드 (recommender.py)
+    GET  /health
+- 데이터 파일(+ 문구 저장소)이 바뀌면 새 색인을 별도 스레드에서 만든 뒤 참조 하나만 교체
+  → 처리 중인 요청은 시작할 때 잡은 이전 색인으로 끝까지 응답 (요청 중단 없음)
+- HTTP/1.1 keep-alive 지원
+- --bench: 서버를 띄우고 동시 연결 부하 테스트 (p50/p99 지연, 초당 요청 수, 테스트 중 재로드 포함)
+
+사용법:
+    python scripts/server.py                          # http://127.0.0.1:8765
+    python scripts/server.py --port 9000 --input data/samsung_cards.json
+    python scripts/server.py --bench --connections 32 --requests 20000
+"""
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+from pathlib import Path
+from urllib.parse import parse_qsl, quote, unquote, urlsplit
+
+from bench_utils import percentile
+from build_frontend import build_listing, detail_keys
+from data_io import DATA_PATH, load_data
+from recommender import Recommender
+from search_index import SearchIndex
+from text_store import store_path
+
+HOST = "127.0.0.1"
+PORT = 8765
+RELOAD_INTERVAL = 1.0     # 데이터 파일 변경 확인 주기 (초)
+MAX_BODY = 64 * 1024      # POST 본문 최대 크기
+DEFAULT_TOP = 10
+
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class Snapshot:
+    """한 시점의 데이터로 만든 읽기 전용 색인 묶음 (만든 뒤에는 수정하지 않음)"""
+
+    def __init__(self, data: dict, version: tuple):
+        self.version = version
+        self.loaded_at = time.strftime("%Y-%m-%d %H:%M:%S")
+        cards = data["cards"]
+        keys = detail_keys(cards)
+        listing = build_listing(data)
+        self.items = {item["detail_key"]: item for item in listing["cards"]}
+        self.all_keys = [item["detail_key"] for item in sorted(listing["cards"], key=lambda item: item["sort_key"])]
+        self.category_index = {category: [entry[0] for entry in entries]
+                               for category, entries in listing["category_index"].items()}
+        self.cards = dict(zip(keys, cards))
+        # 결과가 데이터에만 달린 응답은 미리 JSON 인코딩 (요청마다 직렬화하지 않음)
+        self.card_pages = {None: encode(self.card_page(None, self.all_keys))}
+        for category, category_keys in self.category_index.items():
+            self.card_pages[category] = encode(self.card_page(category, category_keys))
+        self.card_details = {key: encode(card) for key, card in self.cards.items()}
+        self.search_index = SearchIndex.build(cards, keys)
+        self.recommender = Recommender(cards)
+        self.card_keys = keys          # recommender 카드 순서 → detail_key
+
+    def card_page(self, category: str | None, keys: list[str]) -> dict:
+        return {"category": category, "total": len(keys), "cards": [self.items[k] for k in keys]}
+
+
+def encode(payload) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def data_version(path: Path) -> tuple:
+    """(본 파일, 문구 저장소) 수정 시각/크기 (변경 감지용)"""
+    version = []
+    for file in (path, store_path(path)):
+        try:
+            stat = file.stat()
+            version.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            version.append(None)
+    return tuple(version)
+
+
+def load_snapshot(path: Path) -> Snapshot:
+    version = data_version(path)
+    return Snapshot(load_data(str(path)), version)
+
+
+def query_top(params: dict) -> int:
+    try:
+        return max(1, min(100, int(params.pop("top", DEFAULT_TOP))))
+    except ValueError:
+        raise HttpError(400, "top은 정수여야 합니다")
+
+
+class CardService:
+    """요청 처리 + 데이터 재로드"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.snapshot = load_snapshot(path)
+        self.reloads = 0
+        self.requests = 0
+
+    async def reload(self, force: bool = False) -> bool:
+        """파일이 바뀌었으면 새 색인을 스레드에서 만든 뒤 교체"""
+        if not force and data_version(self.path) == self.snapshot.version:
+            return False
+        snapshot = await asyncio.get_running_loop().run_in_executor(None, load_snapshot, self.path)
+        self.snapshot = snapshot      # 참조 교체 한 번 (처리 중인 요청은 이전 snapshot 유지)
+        self.reloads += 1
+        return True
+
+    async def watch(self, interval: float = RELOAD_INTERVAL):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if await self.reload():
+                    print(f"[재로드] {self.path} ({len(self.snapshot.cards)}개 카드)")
+            except Exception as e:
+                # 쓰는 도중의 파일 등 → 이전 데이터로 계속 서비스, 다음 주기에 재시도
+                print(f"[WARN] 재로드 실패 (이전 데이터 유지): {e}")
+
+    def handle(self, method: str, target: str, body: bytes) -> dict | bytes:
+        """요청 → 응답 객체 (미리 인코딩된 응답은 bytes)"""
+        snapshot = self.snapshot       # 요청 하나는 처음 잡은 snapshot만 사용
+        self.requests += 1
+        url = urlsplit(target)
+        path = unquote(url.path).rstrip("/") or "/"
+        params = dict(parse_qsl(url.query))
+
+        if path == "/health":
+            return {"cards": len(snapshot.cards), "loaded_at": snapshot.loaded_at,
+                    "reloads": self.reloads, "requests": self.requests}
+
+        if path == "/cards":
+            category = params.get("category")
+            if category in snapshot.card_pages:
+                return snapshot.card_pages[category]
+            return snapshot.card_page(category, [])
+
+        if path.startswith("/cards/"):
+            key = path[len("/cards/"):]
+            if key not in snapshot.card_details:
+                raise HttpError(404, f"카드 없음: {key}")
+            return snapshot.card_details[key]
+
+        if path == "/search":
+            query = params.get("q", "").strip()
+            if not query:
+                raise HttpError(400, "q 파라미터가 필요합니다")
+            results = snapshot.search_index.search(query, query_top(params))
+            return {"query": query,
+                    "results": [{**snapshot.items[key], "score": round(score, 4)} for key, score in results]}
+
+        if path == "/recommend":
+            top = query_top(params)
+            if method == "POST":
+                try:
+                    profile = json.loads(body or b"{}")
+                except ValueError:
+                    raise HttpError(400, "본문은 JSON이어야 합니다")
+                if not isinstance(profile, dict):
+                    raise HttpError(400, "본문은 {카테고리: 월 금액} 객체여야 합니다")
+            else:
+                profile = params
+            try:
+                profile = {name: float(amount) for name, amount in profile.items()}
+            except (TypeError, ValueError):
+                raise HttpError(400, "월 금액은 숫자여야 합니다")
+            if not all(math.isfinite(amount) and amount >= 0 for amount in profile.values()):
+                raise HttpError(400, "월 금액은 0 이상의 유한한 숫자여야 합니다")
+            results = snapshot.recommender.recommend(profile, top)
+            for item in results:
+                item["detail_key"] = snapshot.card_keys[item.pop("index")]
+            return {"monthly_spending": sum(profile.values()), "results": results}
+
+        raise HttpError(404, f"없는 경로: {path}")
+
+    @staticmethod
+    async def read_request(reader: asyncio.StreamReader) -> tuple | None:
+        """요청 하나 읽기 → (메서드, 대상, 버전, 헤더, 본문), 연결이 닫혔으면 None
+        잘못된 요청은 HttpError (400: 형식 오류, 413: 너무 긴 줄/본문)
+        """
+        try:
+            request_line = await reader.readline()
+            if not request_line:
+                return None
+            try:
+                method, target, version = request_line.decode("latin-1").split()
+            except ValueError:
+                raise HttpError(400, "잘못된 요청")
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+        except ValueError:
+            # StreamReader 한 줄 길이 제한(LimitOverrunError) 초과
+            raise HttpError(413, "요청 줄 또는 헤더가 너무 깁니다")
+
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError:
+            raise HttpError(400, "Content-Length는 정수여야 합니다")
+        if length < 0:
+            raise HttpError(400, "Content-Length는 0 이상이어야 합니다")
+        if length > MAX_BODY:
+            raise HttpError(413, "본문이 너무 큽니다")
+        body = await reader.readexactly(length) if length else b""
+        return method, target, version, headers, body
+
+    async def serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    request = await self.read_request(reader)
+                except HttpError as e:
+                    # 요청 경계를 알 수 없으므로 응답 후 연결 종료
+                    await self.respond(writer, e.status, {"error": str(e)}, keep_alive=False)
+                    break
+                if request is None:
+                    break
+                method, target, version, headers, body = request
+                keep_alive = (headers.get("connection", "").lower() != "close"
+                              and version.upper() == "HTTP/1.1")
+
+                if method not in ("GET", "POST"):
+                    status, payload = 405, {"error": f"지원하지 않는 메서드: {method}"}
+                else:
+                    try:
+                        status, payload = 200, self.handle(method, target, body)
+                    except HttpError as e:
+                        status, payload = e.status, {"error": str(e)}
+                    except Exception as e:
+                        status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+                await self.respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionResetError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def respond(writer: asyncio.StreamWriter, status: int, payload, keep_alive: bool):
+        body = payload if isinstance(payload, bytes) else encode(payload)
+        head = (f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Access-Control-Allow-Origin: *\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+# ========== 부하 테스트 ==========
+
+BENCH_TARGETS = [
+    ("GET", "/cards?category=커피", None),
+    ("GET", "/cards", None),
+    ("GET", "/search?q=스타벅스", None),
+    ("GET", "/search?q=쿠팡이츠&top=5", None),
+    ("GET", "/recommend?커피=50000&쇼핑=300000&기타=600000&top=5", None),
+    ("POST", "/recommend?top=5", {"교통": 80000, "통신": 60000, "기타": 900000}),
+]
+
+
+async def request(reader, writer, method: str, target: str, payload) -> int:
+    """keep-alive 연결로 요청 하나 보내고 상태 코드 반환 (본문은 읽고 버림)"""
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    path, _, query = target.partition("?")
+    encoded = quote(path) + (("?" + "&".join(f"{quote(k)}={quote(v)}" for k, v in parse_qsl(query))) if query else "")
+    writer.write(f"{method} {encoded} HTTP/1.1\r\nHost: {HOST}\r\nContent-Length: {len(body)}\r\n\r\n"
+                 .encode("latin-1") + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def load_test(service: CardService, port: int, connections: int, total: int, out):
+    server = await asyncio.start_server(service.serve_connection, HOST, port)
+    port = server.sockets[0].getsockname()[1]
+    latencies = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def client(c: int):
+        nonlocal errors
+        reader, writer = await asyncio.open_connection(HOST, port)
+        for i in counter:
+            method, target, payload = BENCH_TARGETS[(i + c) % len(BENCH_TARGETS)]
+            start = time.perf_counter()
+            status = await request(reader, writer, method, target, payload)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors += 1
+        writer.close()
+
+    async def reload_midway():
+        # 요청이 절반쯤 처리됐을 때 강제 재로드 (처리 중 요청이 끊기지 않는지 확인)
+        while len(latencies) < total // 2:
+            await asyncio.sleep(0.01)
+        await service.reload(force=True)
+
+    start = time.perf_counter()
+    await asyncio.gather(reload_midway(), *(client(c) for c in range(connections)))
+    elapsed = time.perf_counter() - start
+    server.close()
+    await server.wait_closed()
+
+    latencies.sort()
+    print(f"부하 테스트: 연결 {connections}개, 요청 {len(latencies):,}개 "
+          f"(엔드포인트 {len(BENCH_TARGETS)}종 순환, 테스트 중 재로드 {service.reloads}회)", file=out)
+    print(f"  - 처리량: {len(latencies) / elapsed:,.0f} 요청/초 ({elapsed:.2f}초)", file=out)
+    print(f"  - 지연: p50 {percentile(latencies, 50) * 1000:.2f}ms / "
+          f"p99 {percentile(latencies, 99) * 1000:.2f}ms / 최대 {latencies[-1] * 1000:.2f}ms", file=out)
+    print(f"  - 오류 응답: {errors}개", file=out)
+
+
+async def serve(service: CardService, host: str, port: int):
+    server = await asyncio.start_server(service.serve_connection, host, port)
+    print(f"서비스 시작: http://{host}:{port} ({len(service.snapshot.cards)}개 카드, "
+          f"{service.path} 변경 시 자동 재로드)")
+    async with server:
+        await asyncio.gather(server.serve_forever(), service.watch())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="카드 조회/검색/추천 로컬 HTTP 서비스")
+    parser.add_argument("--input", type=Path, default=DATA_PATH, help="카드 데이터 JSON 경로")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--bench", action="store_true", help="부하 테스트 후 종료 (임의 포트 사용)")
+    parser.add_argument("--connections", type=int, default=32, help="부하 테스트 동시 연결 수")
+    parser.add_argument("--requests", type=int, default=20000, help="부하 테스트 전체 요청 수")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    service = CardService(args.input)
+    print(f"색인 생성: {len(service.snapshot.cards)}개 카드 ({(time.perf_counter() - start) * 1000:.0f}ms)")
+
+    try:
+        if args.bench:
+            asyncio.run(load_test(service, 0, args.connections, args.requests, sys.stdout))
+        else:
+            asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,11 @@ AI가 직접 분석하여 모든 혜택을 요약
 - 할인/적립 구분 포함
 - UI에서는 최대 4개만 표시
 """
-import json
 import re
 
+from data_io import build_parser, info_stream, load_cards, parse_io_args, save_data
+from memo import memoize
+
 def summarize_benefit(benefit):
     """개별 혜택을 간결하게 요약"""
     
@@ -86,6 +88,7 @@ def summarize_benefit(benefit):
         'is_select_option': is_select
     }
 
+@memoize()
 def extract_target(desc, detail, category):
     """설명에서 대상점/서비스 추출"""
     
@@ -212,50 +215,52 @@ def extract_target(desc, detail, category):
     # 기본: 카테고리 사용
     return category if category else '혜택'
 
-def process_all_cards():
+def summarize_card(card):
+    """카드에 summarized_benefits 추가 (파이프라인 단계)"""
+    summarized = []
+    
+    for benefit in card.get('benefits', []):
+        summary = summarize_benefit(benefit)
+        if summary:
+            summarized.append(summary)
+    
+    # 중복 제거 (같은 category + summary)
+    seen = set()
+    unique_summarized = []
+    for s in summarized:
+        key = (s['category'], s['summary'])
+        if key not in seen:
+            seen.add(key)
+            unique_summarized.append(s)
+    
+    card['summarized_benefits'] = unique_summarized
+
+def process_all_cards(argv=None):
     """모든 카드의 모든 혜택 요약"""
     
-    json_path = r"c:\Users\MADUP\Documents\seokmin\website_samsungcard_recommend\data\samsung_cards.json"
+    args = parse_io_args(build_parser("모든 카드의 모든 혜택 요약"), argv)
+    out = info_stream(args.output)
     
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_cards(args.input)
     
     for card in data['cards']:
-        original_benefits = card.get('benefits', [])
-        summarized = []
-        
-        for benefit in original_benefits:
-            summary = summarize_benefit(benefit)
-            if summary:
-                summarized.append(summary)
-        
-        # 중복 제거 (같은 category + summary)
-        seen = set()
-        unique_summarized = []
-        for s in summarized:
-            key = (s['category'], s['summary'])
-            if key not in seen:
-                seen.add(key)
-                unique_summarized.append(s)
-        
-        card['summarized_benefits'] = unique_summarized
+        summarize_card(card)
     
     # 저장
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_data(data, args.output)
     
-    print(f"완료: {len(data['cards'])}개 카드 혜택 요약")
+    print(f"완료: {len(data['cards'])}개 카드 혜택 요약", file=out)
     
     # 샘플 출력
-    print("\n샘플 결과:")
+    print("\n샘플 결과:", file=out)
     sample_cards = ['삼성카드 taptap O', '삼성 iD SELECT ALL 카드', '모니모카드', 'THE 1 (스카이패스)']
     
     for card in data['cards']:
         if card['name'] in sample_cards:
-            print(f"\n[{card['name']}]")
+            print(f"\n[{card['name']}]", file=out)
             for b in card.get('summarized_benefits', [])[:6]:
                 select_mark = '(선택)' if b.get('is_select_option') else ''
-                print(f"  - {b['category']}: {b['summary']} {select_mark}")
+                print(f"  - {b['category']}: {b['summary']} {select_mark}", file=out)
 
 if __name__ == "__main__":
     process_all_cards()
@@ -0,0 +1,149 @@
+"""
+혜택 상세 문구(benefit.detail) 중복 제거 저장소
+- 크롤러는 상세 문구를 자르지 않고 전체 저장 (실적 구간표/제외 대상 유실 방지)
+- 본 데이터(samsung_cards.json)에는 문구 대신 detail_id만 기록하고,
+  문구는 옆 파일(samsung_cards.texts.json)에 한 번만 저장
+- 문구를 " - " 항목 단위 조각(segment)으로 나눠 조각끼리도 중복 제거
+  (여러 카드가 같은 유의사항/실적 구간 안내 문구를 공유)
+- detail_id = 문구 내용 해시 앞 12자리 → 같은 문구는 카드가 달라도 같은 ID
+- data_io.load_data / save_data 가 자동으로 붙이고 떼어내므로 각 단계는 benefit['detail'] 그대로 사용
+
+저장소 형식:
+    {"segments": ["조각 문구", ...], "texts": {"detail_id": [조각 인덱스, ...], ...}}
+
+사용법:
+    python scripts/text_store.py                    # samsung_cards.json을 저장소 형식으로 다시 저장 + 중복 제거 보고
+    python scripts/text_store.py --input other.json
+"""
+import hashlib
+import json
+import re
+from pathlib import Path
+
+SEGMENT_RE = re.compile(r' (?=- )')   # " - " 항목 앞에서 분리 (조각을 ' '로 이으면 원문)
+ID_LENGTH = 12
+TEXT_FIELDS = ["detail"]               # 저장소로 옮기는 혜택 필드 (필드명 + "_id"로 참조)
+
+
+def text_id(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:ID_LENGTH]
+
+
+def store_path(data_path) -> Path:
+    """본 데이터 옆 저장소 경로 (samsung_cards.json → samsung_cards.texts.json)"""
+    path = Path(data_path)
+    return path.with_name(f"{path.stem}.texts.json")
+
+
+class TextStore:
+    """detail_id → 조각 인덱스 목록, 조각은 한 번만 저장"""
+
+    def __init__(self, segments: list[str] | None = None, texts: dict[str, list[int]] | None = None):
+        self.segments = segments or []
+        self.texts = texts or {}
+        self.segment_index = {segment: i for i, segment in enumerate(self.segments)}
+        self.references = 0        # add() 호출 수 (중복 포함)
+        self.referenced_bytes = 0  # add()로 들어온 문구 전체 바이트 (중복 포함)
+
+    @classmethod
+    def load(cls, path: Path) -> "TextStore":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["segments"], data["texts"])
+
+    def save(self, path: Path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"segments": self.segments, "texts": self.texts},
+                      f, ensure_ascii=False, separators=(",", ":"))
+
+    def add(self, text: str) -> str:
+        self.references += 1
+        self.referenced_bytes += len(text.encode("utf-8"))
+        key = text_id(text)
+        if key not in self.texts:
+            indexes = []
+            for segment in SEGMENT_RE.split(text):
+                if segment not in self.segment_index:
+                    self.segment_index[segment] = len(self.segments)
+                    self.segments.append(segment)
+                indexes.append(self.segment_index[segment])
+            self.texts[key] = indexes
+        return key
+
+    def get(self, key: str) -> str:
+        return ' '.join(self.segments[i] for i in self.texts[key])
+
+    def stats(self) -> dict[str, int]:
+        segment_refs = sum(len(indexes) for indexes in self.texts.values())
+        return {
+            "references": self.references,
+            "texts": len(self.texts),
+            "segment_references": segment_refs,
+            "segments": len(self.segments),
+            "inline_bytes": self.referenced_bytes,
+            "stored_bytes": sum(len(segment.encode("utf-8")) for segment in self.segments),
+        }
+
+
+def detach_card(card: dict, store: TextStore) -> dict:
+    """카드 하나의 문구를 저장소로 옮긴 사본 (입력 card는 수정하지 않음)"""
+    benefits = []
+    for benefit in card.get("benefits", []):
+        # 필드 순서 유지: detail 자리에 detail_id, 문구 없음(None)은 그대로 유지
+        benefits.append({
+            (f"{key}_id" if key in TEXT_FIELDS and value is not None else key):
+                (store.add(value) if key in TEXT_FIELDS and value is not None else value)
+            for key, value in benefit.items()
+        })
+    return {**card, "benefits": benefits}
+
+
+def detach_texts(data: dict) -> tuple[dict, TextStore]:
+    """문구를 저장소로 옮긴 본 데이터 사본 + 저장소 (입력 data는 수정하지 않음)"""
+    store = TextStore()
+    cards = [detach_card(card, store) for card in data.get("cards", [])]
+    return {**data, "cards": cards}, store
+
+
+def attach_texts(data: dict, store: TextStore) -> dict:
+    """detail_id → detail 복원 (제자리 수정, 필드 순서 유지)"""
+    id_fields = {f"{field}_id": field for field in TEXT_FIELDS}
+    for card in data.get("cards", []):
+        card["benefits"] = [
+            {id_fields.get(key, key): (store.get(value) if key in id_fields else value)
+             for key, value in benefit.items()}
+            for benefit in card.get("benefits", [])
+        ]
+    return data
+
+
+def print_store_report(store: TextStore, out):
+    stats = store.stats()
+    saved = stats["inline_bytes"] - stats["stored_bytes"]
+    print(f"상세 문구 저장소: 참조 {stats['references']}개 → 고유 문구 {stats['texts']}개, "
+          f"조각 {stats['segment_references']}개 → 고유 조각 {stats['segments']}개 "
+          f"(중복 제거율 {1 - stats['segments'] / max(1, stats['segment_references']):.1%})", file=out)
+    print(f"  - 문구 바이트: 인라인 {stats['inline_bytes']:,} → 저장소 {stats['stored_bytes']:,} "
+          f"({saved:,} 절약, {saved / max(1, stats['inline_bytes']):.1%})", file=out)
+
+
+def main(argv=None):
+    from data_io import build_parser, load_data, save_data  # data_io가 이 모듈을 import하므로 지연 import
+
+    parser = build_parser("혜택 상세 문구 저장소 재구성 + 중복 제거 보고", with_output=False)
+    args = parser.parse_args(argv)
+    path = Path(args.input)
+
+    data = load_data(str(path))
+    inline_bytes = len(json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8"))
+    store = save_data(data, str(path))
+
+    main_bytes = path.stat().st_size
+    store_bytes = store_path(path).stat().st_size
+    print(f"완료: {path.name} {main_bytes:,} + {store_path(path).name} {store_bytes:,} bytes "
+          f"(문구 인라인 시 {inline_bytes:,} bytes, {inline_bytes - main_bytes - store_bytes:,} 절약)")
+    print_store_report(store, None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+"""scripts/ 와 crawler/ 모듈을 스크립트 실행 때처럼 바로 import 할 수 있게 경로 추가"""
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+for folder in ("scripts", "crawler"):
+    sys.path.insert(0, str(ROOT / folder))
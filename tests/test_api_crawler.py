@@ -0,0 +1,141 @@
+"""api_crawler: 로컬 스텁 API 서버로 속도 제한 / 병렬 상세 조회 / 목록 페이지 조회 확인"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+pytest.importorskip("requests")
+
+from api_crawler import CardGorillaClient, crawl_card_details, main
+from data_io import load_data
+
+DETAIL_DELAY = 0.2    # 상세 API 응답 지연 (초)
+
+
+class StubApi(BaseHTTPRequestHandler):
+    """카드고릴라 API 흉내: /cards?p=&perPage= 목록, /cards/{cid} 상세 (요청 시각 기록)
+    fail_page 페이지는 500, total 이 있으면 목록 전체 개수로 그 값을 보고
+    """
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.request_times.append(time.monotonic())
+        url = urlsplit(self.path)
+        if url.path == "/cards":
+            query = parse_qs(url.query)
+            page, per_page = int(query["p"][0]), int(query["perPage"][0])
+            if page == server.fail_page:
+                self.send_error(500)
+                return
+            # shift: 2페이지부터 목록이 앞으로 밀린 것처럼 이전 페이지 마지막 항목을 다시 포함
+            offset = (page - 1) * per_page - (server.shift if page > 1 else 0)
+            ids = server.card_ids[offset:offset + per_page]
+            payload = {"total": server.total or len(server.card_ids), "data": [{"cid": cid} for cid in ids]}
+        else:
+            time.sleep(DETAIL_DELAY)
+            payload = {"cid": int(url.path.rsplit("/", 1)[1]), "name": "stub"}
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_api():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubApi)
+    server.card_ids = list(range(1, 24))
+    server.shift = 0
+    server.fail_page = None
+    server.total = None
+    server.request_times = []
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_rate_limit_and_parallel_workers(stub_api):
+    rate, burst = 20.0, 5
+    api_base = f"http://127.0.0.1:{stub_api.server_address[1]}"
+    start = time.monotonic()
+    with CardGorillaClient(api_base, pool_size=8, rate=rate, burst=burst) as client:
+        card_ids, results = crawl_card_details(client, {}, workers=8)
+    elapsed = time.monotonic() - start
+
+    assert card_ids == stub_api.card_ids
+    assert [status for status, _, _ in results] == [200] * len(card_ids)
+
+    # 어느 구간 [t_i, t_j] 에서든 요청 수 ≤ 버킷 용량 + 속도 x 구간 길이 (+1: 타이머 오차)
+    times = sorted(stub_api.request_times)
+    for i in range(len(times)):
+        for j in range(i, len(times)):
+            assert j - i + 1 <= burst + rate * (times[j] - times[i]) + 1
+
+    # 상세 요청이 겹쳐서 처리됨 → 직렬 시간(카드 수 x 지연)보다 훨씬 짧음
+    assert elapsed < len(card_ids) * DETAIL_DELAY / 2
+
+
+@pytest.mark.parametrize("shift", [0, 1])
+def test_pagination_collects_total(stub_api, shift):
+    # total(23)이 perPage(10)의 배수가 아님 → 마지막 페이지는 일부만
+    stub_api.shift = shift
+    with CardGorillaClient(f"http://127.0.0.1:{stub_api.server_address[1]}", rate=0) as client:
+        pages = list(client.iter_card_pages(per_page=10))
+        total = client.list_total
+    card_ids = [cid for page in pages for cid in page]
+    assert total == 23
+    assert len(card_ids) == total
+    assert len(set(card_ids)) == len(card_ids)
+    assert len(pages) == 3
+
+
+def run_main(stub_api, tmp_path, *extra):
+    main(["--api-base", f"http://127.0.0.1:{stub_api.server_address[1]}", "--rate", "0", "--retries", "0",
+          "--per-page", "10", "--output", str(tmp_path / "cards.json"), "--state", str(tmp_path / "state.json"),
+          "--cache-dir", str(tmp_path / "cache"), *extra])
+    return [card["id"] for card in load_data(str(tmp_path / "cards.json"))["cards"]]
+
+
+def test_list_failure_keeps_previous_output(stub_api, tmp_path):
+    assert len(run_main(stub_api, tmp_path)) == 23
+    before = (tmp_path / "cards.json").read_bytes()
+
+    # 2페이지 실패 → 잘린 목록으로 덮어쓰지 않음
+    stub_api.fail_page = 2
+    with CardGorillaClient(f"http://127.0.0.1:{stub_api.server_address[1]}", rate=0, max_retries=0) as client:
+        with pytest.raises(Exception):
+            crawl_card_details(client, {}, per_page=10)
+    run_main(stub_api, tmp_path)
+    assert (tmp_path / "cards.json").read_bytes() == before
+
+
+def test_short_list_keeps_unseen_cards(stub_api, tmp_path):
+    run_main(stub_api, tmp_path)
+    # API는 전체 23개라고 보고하지만 목록에는 22개만 → 빠진 카드는 이전 결과 유지
+    stub_api.total, stub_api.card_ids = 23, stub_api.card_ids[:-1]
+    card_ids = run_main(stub_api, tmp_path, "--incremental")
+    assert sorted(map(int, card_ids)) == list(range(1, 24))
+    state = json.loads((tmp_path / "state.json").read_text(encoding="utf-8"))["cards"]
+    assert "23" in state and state["23"]["hash"]
+
+    # 전체 개수와 맞는 목록을 받으면 그때 단종 카드 정리
+    stub_api.total = None
+    card_ids = run_main(stub_api, tmp_path, "--incremental")
+    assert "23" not in card_ids
+    assert "23" not in json.loads((tmp_path / "state.json").read_text(encoding="utf-8"))["cards"]
+
+
+def test_negative_retries_still_requests(stub_api):
+    with CardGorillaClient(f"http://127.0.0.1:{stub_api.server_address[1]}", rate=0, max_retries=-1) as client:
+        assert client.get_json("/cards/7")["cid"] == 7
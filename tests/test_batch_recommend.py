@@ -0,0 +1,41 @@
+"""batch_recommend: 출력 열 수, 중복 없는 카드 ID, 잘못된 행/금액 보고, 실패 시 이전 출력 유지"""
+import csv
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from batch_recommend import main
+
+
+def write_input(path, lines):
+    path.write_text("\n".join(["customer_id,커피,쿠팡,기타"] + lines) + "\n", encoding="utf-8")
+
+
+def test_top_clamped_and_ids_unique(tmp_path):
+    source, output = tmp_path / "spend.csv", tmp_path / "top.csv"
+    write_input(source, ["A,50000,200000,500000", "B,0,0,100000"])
+    main(["--input", str(source), "--output", str(output), "--top", "1000", "--workers", "1"])
+    header, *rows = list(csv.reader(output.open(encoding="utf-8")))
+    assert [len(row) for row in rows] == [len(header)] * 2
+    ids = rows[0][1::2]
+    assert len(ids) == len(set(ids))
+
+
+def test_ragged_row_reports_line(tmp_path):
+    source = tmp_path / "spend.csv"
+    write_input(source, ["A,50000,200000,500000", "", "B,1000,2000"])
+    with pytest.raises(SystemExit, match="4번째 줄"):
+        main(["--input", str(source), "--output", str(tmp_path / "top.csv"), "--workers", "1"])
+
+
+@pytest.mark.parametrize("cell, message", [("abc", "3번째 줄: 숫자가 아닌 금액 'abc'"),
+                                           ("-1000", "3번째 줄: 3번째 열"), ("inf", "3번째 줄: 3번째 열")])
+def test_bad_amount_reports_line_and_keeps_output(tmp_path, cell, message):
+    source, output = tmp_path / "spend.csv", tmp_path / "top.csv"
+    output.write_text("이전 결과\n", encoding="utf-8")
+    write_input(source, ["A,50000,200000,500000", f"B,1000,{cell},3000"])
+    with pytest.raises(SystemExit, match=message):
+        main(["--input", str(source), "--output", str(output), "--workers", "1"])
+    assert output.read_text(encoding="utf-8") == "이전 결과\n"
+    assert set(tmp_path.iterdir()) == {source, output}     # 임시 파일도 남지 않음
@@ -0,0 +1,84 @@
+"""build_frontend: 카테고리 역색인 정렬이 역색인 이전 브라우저 비교 함수(filterByCategory) 결과와 같은지"""
+from functools import cmp_to_key
+
+import pytest
+
+from build_frontend import build_category_index, build_listing, detail_keys, listing_card
+from data_io import DATA_PATH, load_data
+from priority import PriorityTable, priority_table, sort_key
+
+TABLE = PriorityTable({"priority_cards": [{"name": "카드 B", "rank": 1}, {"name": "카드D", "rank": 2}]})
+
+
+def make_card(card_id, name, fee, categories):
+    card = {"id": card_id, "name": name, "annual_fee": {"domestic": fee} if fee else None,
+            "display_benefits": [{"category": c, "summary": f"{c} 혜택"} for c in categories]}
+    card["priority_rank"] = TABLE.rank(name)
+    card["sort_key"] = sort_key(card["priority_rank"], card)
+    return card
+
+
+CARDS = [
+    make_card("1", "카드 A", 10000, ["커피"]),
+    make_card("2", "카드 B", 30000, ["커피", "쇼핑"]),
+    make_card("3", "카드 C", 5000, ["커피", "커피"]),
+    make_card("4", "카드 D", 20000, ["커피"]),        # 공백 차이 무시하고 rank 2
+    make_card("5", "카드 E", None, ["커피", "쇼핑"]),  # 연회비 없음 → 맨 뒤
+    make_card("6", "카드 F", 5000, ["커피"]),         # C와 sort_key 같음 → 혜택 수 적어 뒤
+    make_card("6", "카드 F2", 5000, ["쇼핑"]),        # 중복 id → 6-1
+]
+
+
+def category_order(category):
+    items = [listing_card(card, key) for card, key in zip(CARDS, detail_keys(CARDS))]
+    return [entry[0] for entry in build_category_index(items)[category]]
+
+
+def test_pinned_order():
+    assert category_order("커피") == ["2", "4", "3", "6", "1", "5"]
+    assert category_order("쇼핑") == ["2", "6-1", "5"]
+
+
+def client_compare(category):
+    """card-manager.js filterByCategory 비교 함수를 그대로 옮긴 것 (우선순위 이름 목록 대신 rank,
+    우선순위 밖 카드는 연회비 낮은 순 → 연회비 없는 카드 마지막, 이후 해당 카테고리 혜택 수 내림차순)
+    """
+    table = priority_table()
+
+    def count(card):
+        return len([b for b in card.get("display_benefits") or [] if b.get("category") == category])
+
+    def fee(card):
+        return (card.get("annual_fee") or {}).get("domestic")
+
+    def compare(a, b):
+        a_rank, b_rank = table.rank(a["name"]), table.rank(b["name"])
+        if a_rank is not None and b_rank is not None and a_rank != b_rank:
+            return a_rank - b_rank
+        if a_rank is not None and b_rank is None:
+            return -1
+        if b_rank is not None and a_rank is None:
+            return 1
+        if a_rank is None and fee(a) != fee(b):
+            if fee(a) is None:
+                return 1
+            if fee(b) is None:
+                return -1
+            return fee(a) - fee(b)
+        return count(b) - count(a)
+    return cmp_to_key(compare)
+
+
+@pytest.mark.skipif(not DATA_PATH.exists(), reason="카드 데이터 없음")
+def test_real_dataset_matches_client_comparator():
+    data = load_data(str(DATA_PATH))
+    cards, keys = data["cards"], detail_keys(data["cards"])
+    index = build_listing(data)["category_index"]
+    categories = {b["category"] for card in cards for b in card.get("display_benefits") or [] if b.get("category")}
+    assert set(index) == categories
+    for category in categories:
+        shown = [(card, key) for card, key in zip(cards, keys)
+                 if any(b.get("category") == category for b in card.get("display_benefits") or [])]
+        compare = client_compare(category)
+        expected = [key for _, key in sorted(shown, key=lambda e: compare(e[0]))]
+        assert [entry[0] for entry in index[category]] == expected, category
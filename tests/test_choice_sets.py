@@ -0,0 +1,23 @@
+"""choice_sets: 대표 옵션은 같은 단위끼리 비교"""
+from choice_sets import group_choice_sets
+
+
+def benefit(desc, kind=None, value=None):
+    return {"title": "할인", "description": desc, "discount": {"type": kind, "value": value}}
+
+
+def test_percent_option_beats_won_amount():
+    benefits = [
+        benefit("여가패키지: 철도 건별 30,000원 이상 결제 시 5,000원 결제일할인", "won", 30000),
+        benefit("일상패키지: 커피전문점 30% 결제일할인", "percent", 30.0),
+        benefit("여가패키지: 해외 3% 결제일할인", "percent", 3.0),
+    ]
+    (choice_set,) = group_choice_sets(benefits)
+    assert [option["name"] for option in choice_set["options"]] == ["여가패키지", "일상패키지"]
+    assert choice_set["headline"] == 1
+
+
+def test_won_amounts_compared_without_rates():
+    benefits = [benefit("[SELECT] 영화 3,000원 할인", "won", 3000),
+                benefit("[SELECT] 영화 6,000원 할인", "won", 6000)]
+    assert group_choice_sets(benefits)[0]["headline"] == 1
@@ -0,0 +1,33 @@
+"""images: 원본보다 넓은 폭이 생략된 썸네일로 절약량 보고"""
+import io
+
+from images import largest_thumb, print_savings_report
+
+
+class FakeCache:
+    def __init__(self, sizes):
+        self.sizes = sizes
+
+    def get(self, url):
+        return {"bytes": self.sizes[url]}
+
+
+def thumbs(**widths):
+    return {"webp": {width.lstrip("w"): (f"img/x-{width}.webp", size) for width, size in widths.items()}, "avif": {}}
+
+
+def test_largest_thumb_uses_actual_widths():
+    sizes = thumbs(w90=100, w100=150)["webp"]      # 원본 폭 100 → 180 대신 100 하나
+    assert largest_thumb(sizes, 180) == ("img/x-w100.webp", 150)
+    assert largest_thumb(sizes, 90) == ("img/x-w90.webp", 100)
+    assert largest_thumb({}, 180) is None
+
+
+def test_report_counts_narrow_sources():
+    cache = FakeCache({"wide": 10_000, "narrow": 1_000})
+    purposes = {"wide": {"grid"}, "narrow": {"grid"}}
+    result = {"wide": thumbs(w105=300, w210=800), "narrow": thumbs(w80=200)}
+    out = io.StringIO()
+    print_savings_report(cache, purposes, result, out)
+    grid = next(line for line in out.getvalue().splitlines() if "grid" in line)
+    assert "webp 1,000 (10,000 절약" in grid
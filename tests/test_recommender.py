@@ -0,0 +1,60 @@
+"""recommender: 혜택 적용 범위와 소비 프로필별 순위"""
+import pytest
+
+pytest.importorskip("numpy")
+
+from recommender import OVERSEAS, Recommender, benefit_rates, benefit_scope, main
+
+
+def make_card(card_id, name, descriptions, fee=10000):
+    return {"id": card_id, "name": name, "annual_fee": {"domestic": fee}, "min_spending": 0,
+            "benefits": [{"title": "할인", "description": desc, "detail": "", "discount": {}}
+                         for desc in descriptions]}
+
+
+CARDS = [
+    make_card("1", "SSG", ["SSG.COM 결제 시 10% SSG MONEY 적립", "해외 1.5% SSG MONEY 적립"]),
+    make_card("2", "PET", ["동물병원/반려동물쇼핑몰 30% 할인", "온라인쇼핑몰 2% 할인"]),
+    make_card("3", "ALL", ["국내 가맹점 1% 할인"]),
+]
+
+
+def ranking(profile):
+    return [item["name"] for item in Recommender(CARDS).recommend(profile, top=len(CARDS))]
+
+
+def test_reward_currency_is_not_scope():
+    assert benefit_scope("해외 1.5% SSG MONEY 적립") == [OVERSEAS]
+    assert benefit_scope("생활편의영역 5% SSG MONEY 추가 적립") is None
+
+
+def test_merchant_restricted_scope():
+    assert benefit_scope("SSG.COM 결제 시 9% SSG MONEY 추가 적립") == ["SSG"]
+    assert benefit_scope("동물병원/반려동물쇼핑몰 30% 할인") is None
+
+
+def test_other_merchant_spend_not_credited():
+    # 쿠팡 소비는 SSG.COM 전용 혜택/반려동물쇼핑몰 혜택에 해당하지 않음
+    # PET 2% x 20만 = 4,000원/월, ALL 1% x 70만 = 7,000원/월, SSG 0원
+    assert ranking({"쿠팡": 200000, "기타": 500000}) == ["ALL", "PET", "SSG"]
+
+
+def test_matching_merchant_spend_credited():
+    # SSG 10% (한도 1만원) > PET 온라인쇼핑몰 2% x 30만 > ALL 1% x 40만
+    assert ranking({"SSG": 300000, "기타": 100000}) == ["SSG", "PET", "ALL"]
+
+
+def test_multi_rate_split_per_target():
+    # 항목 수 = 할인율 수 → 항목마다 자기 할인율 (해외는 1%, 간편결제는 대상 불명이라 제외)
+    assert benefit_rates("온라인 간편결제·해외 3%·1% 할인") == {OVERSEAS: 0.01}
+    rates = benefit_rates("커피/교통 5% 할인\n쇼핑/배달앱 3% 할인")
+    assert (rates["커피"], rates["교통"], rates["쇼핑"], rates["배달"]) == (0.05, 0.05, 0.03, 0.03)
+    # 대상 하나에 할인율 여러 개 = 실적 구간별 → 첫 값
+    assert benefit_rates("대중교통 1%·2% 결제일할인") == {"교통": 0.01}
+
+
+@pytest.mark.parametrize("profile", ['{"커피": -50000}', '{"커피": NaN}', '{"커피": "abc"}', '[1]'])
+def test_cli_rejects_bad_profile(profile):
+    with pytest.raises(SystemExit) as error:
+        main(["--profile", profile])
+    assert error.value.code == 2
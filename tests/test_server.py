@@ -0,0 +1,68 @@
+"""server: 잘못된 요청은 400/413 응답 후 연결 종료 (keep-alive 요청이어도 요청 경계를 알 수 없으므로)"""
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from data_io import DATA_PATH
+from server import HOST, CardService
+
+
+@pytest.fixture(scope="module")
+def service():
+    return CardService(DATA_PATH)
+
+
+def exchange(service, raw: bytes) -> tuple[int, dict, bool]:
+    """요청 원문을 보내고 (상태 코드, JSON 본문, 서버가 연결을 닫았는지) 반환"""
+    async def run():
+        server = await asyncio.start_server(service.serve_connection, HOST, 0)
+        reader, writer = await asyncio.open_connection(HOST, server.sockets[0].getsockname()[1])
+        writer.write(raw)
+        await writer.drain()
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = int(next(line.split(b":", 1)[1] for line in head.split(b"\r\n")
+                          if line.lower().startswith(b"content-length:")))
+        body = await reader.readexactly(length)
+        try:
+            # 응답 뒤 서버가 연결을 닫으면 EOF, keep-alive로 남아 있으면 시간 초과
+            closed = await asyncio.wait_for(reader.read(1), 1) == b""
+        except asyncio.TimeoutError:
+            closed = False
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return head, body, closed
+    head, body, closed = asyncio.run(run())
+    return int(head.split()[1]), json.loads(body), closed
+
+
+def post(service, body: bytes, length=None, keep_alive=False) -> tuple[int, dict, bool]:
+    length = len(body) if length is None else length
+    connection = b"" if keep_alive else b"Connection: close\r\n"
+    return exchange(service, b"POST /recommend HTTP/1.1\r\n" + connection +
+                    b"Content-Length: " + str(length).encode() + b"\r\n\r\n" + body)
+
+
+@pytest.mark.parametrize("length", ["abc", -1])
+def test_bad_content_length(service, length):
+    status, _, closed = post(service, b"{}", length=length, keep_alive=True)
+    assert status == 400 and closed
+
+
+def test_overlong_request_line(service):
+    status, _, closed = exchange(service, b"GET /search?q=" + b"a" * 100000 + b" HTTP/1.1\r\n\r\n")
+    assert status == 413 and closed
+
+
+@pytest.mark.parametrize("amount", ["NaN", "Infinity", "-1000"])
+def test_non_finite_or_negative_amount(service, amount):
+    assert post(service, ('{"커피": %s}' % amount).encode())[0] == 400
+
+
+def test_valid_profile(service):
+    status, payload, closed = post(service, json.dumps({"커피": 50000, "기타": 500000}).encode(), keep_alive=True)
+    assert status == 200 and payload["monthly_spending"] == 550000
+    assert not closed     # 정상 요청은 keep-alive 유지